@@ -0,0 +1,294 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+import os
+import sys
+import json
+import time
+import random
+import string
+import argparse
+import platform
+import datetime
+import statistics
+import tracemalloc
+from decimal import Decimal
+from typing import Any, Callable, cast
+
+
+# Allows running the benchmarks from any directory, without installing the package.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+from pymig.mysql_data_processor import process_mysql_data, process_mysql_data_to_string
+from pymig.binary_copy_encoder import get_encoders, process_mysql_data_binary
+from pymig.columns_data_arranger import arrange_columns_data
+from pymig.table_processor import map_data_types
+
+
+# Synthetic datasets: MySQL column types, and a generator of a single row (native Python values, as MySQLdb returns).
+# Notice, the generators are seeded, so each run benchmarks exactly the same data.
+_DATASETS: dict[str, tuple[list[str], Callable[[random.Random], tuple]]] = {
+    'narrow_ints': (
+        ['int(11)', 'int(11)', 'bigint(20)', 'smallint(6)', 'int(10) unsigned'],
+        lambda rnd: (rnd.randint(-2**31, 2**31 - 1), rnd.randint(0, 1000), rnd.randint(-2**63, 2**63 - 1),
+                     rnd.randint(-2**15, 2**15 - 1), rnd.randint(0, 2**32 - 1)),
+    ),
+    'wide_text': (
+        ['int(11)', 'varchar(255)', 'text', 'longtext'],
+        lambda rnd: (rnd.randint(0, 2**31 - 1), _get_text(rnd, 255), _get_text(rnd, 2048), _get_text(rnd, 8192)),
+    ),
+    'blobs': (
+        ['int(11)', 'blob', 'varbinary(255)'],
+        lambda rnd: (rnd.randint(0, 2**31 - 1), rnd.randbytes(rnd.randint(1024, 16384)), rnd.randbytes(255)),
+    ),
+    'dates': (
+        ['int(11)', 'date', 'datetime', 'timestamp', 'decimal(12,2)'],
+        lambda rnd: (
+            rnd.randint(0, 2**31 - 1),
+            datetime.date(2000, 1, 1) + datetime.timedelta(days=rnd.randint(0, 10000)),
+            datetime.datetime(2000, 1, 1) + datetime.timedelta(seconds=rnd.randint(0, 10**9)),
+            datetime.datetime(2000, 1, 1) + datetime.timedelta(microseconds=rnd.randint(0, 10**15)),
+            Decimal(rnd.randint(-10**11, 10**11)) / 100,
+        ),
+    ),
+    'null_heavy': (
+        ['int(11)', 'varchar(255)', 'int(11)', 'datetime', 'text', 'double'],
+        lambda rnd: tuple(
+            None if rnd.random() < 0.8 else value
+            for value in (
+                rnd.randint(0, 2**31 - 1),
+                _get_text(rnd, 64),
+                rnd.randint(0, 1000),
+                datetime.datetime(2000, 1, 1) + datetime.timedelta(seconds=rnd.randint(0, 10**9)),
+                _get_text(rnd, 512),
+                rnd.random() * 10**6,
+            )
+        ),
+    ),
+}
+
+# MySQL column types, used to benchmark "map_data_types" and "arrange_columns_data".
+_MYSQL_TYPES = [
+    'int(11)', 'int(10) unsigned', 'bigint(20) unsigned zerofill', 'tinyint(1)', 'smallint(6)', 'decimal(10,2)',
+    'double', 'float', 'varchar(255)', 'char(36)', 'text', 'longtext', 'blob', 'varbinary(16)', 'date', 'datetime',
+    'timestamp', 'time', 'year', 'bit(1)', "enum('a','b','c')", "set('x','y')", 'json', 'point', 'geometry',
+]
+
+
+def _get_text(rnd: random.Random, max_length: int) -> str:
+    """
+    Returns random text, including characters, which must be escaped in COPY text format.
+    """
+    alphabet = string.ascii_letters + string.digits + ' \\\t'
+    return ''.join(rnd.choices(alphabet, k=rnd.randint(1, max_length)))
+
+
+def _to_text(value: Any) -> str:
+    """
+    Converts given value to its textual representation, as selected by "arrange_columns_data" in text COPY format.
+    """
+    if value is None:
+        return '\\N'
+
+    if isinstance(value, bytes):
+        return f'\\\\x{value.hex().upper()}'
+
+    if isinstance(value, str):
+        return value.replace('\\', '\\\\')
+
+    return str(value)
+
+
+def _get_batches(dataset_name: str, rows_cnt: int) -> tuple[list[str], tuple[tuple, ...], tuple[tuple[str, ...], ...]]:
+    """
+    Returns PostgreSQL column types, and a batch of given dataset, both with native and textual values.
+    """
+    mysql_types, get_row = _DATASETS[dataset_name]
+    rnd = random.Random(dataset_name)
+    native_batch = tuple(get_row(rnd) for _ in range(rows_cnt))
+    text_batch = tuple(tuple(_to_text(value) for value in record) for record in native_batch)
+    column_types = [map_data_types(_get_data_types_map(), mysql_type) for mysql_type in mysql_types]
+    return column_types, native_batch, text_batch
+
+
+def _get_data_types_map() -> dict:
+    """
+    Returns the data-types map, used by the migration.
+    """
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'data_types_map.json')
+
+    with open(path, 'r') as file:
+        return cast(dict, json.load(file))
+
+
+def _process_mysql_data_generator(batch: tuple[tuple[str, ...], ...]) -> str:
+    """
+    A variant of "process_mysql_data_to_string", built of generator expressions instead of list comprehensions.
+    Serves as a reference for the claims in "mysql_data_processor.py".
+    """
+    return '\n'.join('\t'.join(record) for record in batch) + '\n'
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> dict:
+    """
+    Runs given function "repeat" times, and returns its timings (in seconds),
+    and the peak of memory allocated by a single (separate) run.
+    """
+    func()  # Warm up.
+    timings = []
+
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started_at)
+
+    tracemalloc.start()
+    func()
+    _, peak_allocated_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'seconds_median': statistics.median(timings),
+        'seconds_min': min(timings),
+        'peak_allocated_bytes': peak_allocated_bytes,
+    }
+
+
+def run_benchmarks(rows_cnt: int, repeat: int) -> dict[str, dict]:
+    """
+    Runs all the benchmarks, and returns their results, keyed by benchmark name.
+    Throughput is calculated by the median timing.
+    """
+    results: dict[str, dict] = {}
+
+    for dataset_name in _DATASETS:
+        column_types, native_batch, text_batch = _get_batches(dataset_name, rows_cnt)
+        encoders = get_encoders(column_types)
+        text_size = len(process_mysql_data_to_string(text_batch))
+        benchmarks: dict[str, tuple[Callable[[], Any], int]] = {
+            'process_mysql_data': (lambda: process_mysql_data(text_batch), text_size),
+            'process_mysql_data_to_string': (lambda: process_mysql_data_to_string(text_batch), text_size),
+            'process_mysql_data_generator': (lambda: _process_mysql_data_generator(text_batch), text_size),
+        }
+
+        if encoders is not None:
+            binary_size = len(process_mysql_data_binary(native_batch, encoders).getvalue())
+            benchmarks['process_mysql_data_binary'] = (
+                lambda: process_mysql_data_binary(native_batch, encoders),  # type: ignore
+                binary_size,
+            )
+
+        for benchmark_name, (func, output_size) in benchmarks.items():
+            result = _measure(func, repeat)
+            result['rows_per_second'] = rows_cnt / result['seconds_median']
+            result['mb_per_second'] = output_size / 1024 / 1024 / result['seconds_median']
+            results[f'{benchmark_name}[{dataset_name}]'] = result
+            _print_result(f'{benchmark_name}[{dataset_name}]', result)
+
+    data_types_map = _get_data_types_map()
+    calls_cnt = 1000
+    table_columns = [{'Field': f'column_{index}', 'Type': mysql_type} for index, mysql_type in enumerate(_MYSQL_TYPES)]
+    benchmarks = {
+        'map_data_types': (
+            lambda: [map_data_types(data_types_map, mysql_type)
+                     for _ in range(calls_cnt)
+                     for mysql_type in _MYSQL_TYPES],
+            calls_cnt * len(_MYSQL_TYPES),
+        ),
+        'arrange_columns_data[text]': (
+            lambda: [arrange_columns_data(table_columns, '8.0', 'utf8mb4') for _ in range(calls_cnt)],
+            calls_cnt,
+        ),
+        'arrange_columns_data[binary]': (
+            lambda: [arrange_columns_data(table_columns, '8.0', 'utf8mb4', 'binary') for _ in range(calls_cnt)],
+            calls_cnt,
+        ),
+    }
+
+    for benchmark_name, (func, calls) in benchmarks.items():
+        result = _measure(func, repeat)
+        result['calls_per_second'] = calls / result['seconds_median']
+        results[benchmark_name] = result
+        _print_result(benchmark_name, result)
+
+    return results
+
+
+def compare_with_baseline(results: dict[str, dict], baseline_path: str, tolerance: float) -> bool:
+    """
+    Compares median timings of given results with the baseline file.
+    Returns False if at least one benchmark is slower than the baseline by more than "tolerance" (a fraction).
+    """
+    with open(baseline_path, 'r') as file:
+        baseline = json.load(file)['results']
+
+    is_passed = True
+    print(f'\nComparison with {baseline_path} (tolerance {tolerance:.0%}):')
+
+    for benchmark_name, result in results.items():
+        if benchmark_name not in baseline:
+            print(f'\t{benchmark_name}: no baseline')
+            continue
+
+        ratio = result['seconds_median'] / baseline[benchmark_name]['seconds_median']
+        is_regression = ratio > 1 + tolerance
+        is_passed = is_passed and not is_regression
+        print(f'\t{benchmark_name}: {ratio:.2f}x of baseline time{" - REGRESSION" if is_regression else ""}')
+
+    return is_passed
+
+
+def _print_result(benchmark_name: str, result: dict) -> None:
+    """
+    Prints a result of given benchmark.
+    """
+    throughput = (f'{result["rows_per_second"]:,.0f} rows/s, {result["mb_per_second"]:,.1f} MB/s'
+                  if 'rows_per_second' in result
+                  else f'{result["calls_per_second"]:,.0f} calls/s')
+
+    print(f'{benchmark_name}: median {result["seconds_median"] * 1000:.2f} ms, {throughput},'
+          f' peak allocated {result["peak_allocated_bytes"] / 1024 / 1024:.1f} MB')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmarks the data transformation hot path. No database is required.',
+    )
+
+    parser.add_argument('--rows', type=int, default=10000, help='Rows per batch (default: 10000).')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per benchmark (default: 5).')
+    parser.add_argument('--output', default='benchmark_results.json', help='Path of the results file.')
+    parser.add_argument('--baseline', help='Path of a previous results file to compare with.')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='Allowed slowdown vs baseline (default: 0.1).')
+    args = parser.parse_args()
+
+    benchmark_results = run_benchmarks(args.rows, args.repeat)
+
+    with open(args.output, 'w') as output_file:
+        json.dump({
+            'timestamp': time.time(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'rows': args.rows,
+            'repeat': args.repeat,
+            'results': benchmark_results,
+        }, output_file, indent=4)
+
+    print(f'\nResults are written to {args.output}')
+
+    if args.baseline and not compare_with_baseline(benchmark_results, args.baseline, args.tolerance):
+        sys.exit(1)
@@ -28,12 +28,20 @@ from pymig.fs_ops import read_config, read_extra_config, create_logs_directory,
 from pymig.boot_processor import boot, get_introduction_message
 from pymig.schema_processor import create_schema
 from pymig.conversion import Conversion
-from pymig.binary_data_decoder import decode
 from pymig.report_generator import generate_report
-from pymig.migration_state_manager import create_state_logs_table, create_data_pool_table, read_data_pool
+from pymig.migration_state_manager import (
+    create_state_logs_table,
+    create_data_pool_table,
+    create_progress_ledger_table,
+    read_data_pool,
+)
 from pymig.structure_loader import load_structure
 from pymig.constraints_processor import process_constraints
 from pymig.data_loader import send_data
+from pymig.spool_mode import SpoolMode
+from pymig.log_pipeline import start_log_pipeline, stop_log_pipeline
+from pymig.metrics import start_metrics, stop_metrics
+from pymig.tracer import start_tracing, stop_tracing
 
 
 if __name__ == '__main__':
@@ -43,17 +51,30 @@ if __name__ == '__main__':
     config = read_extra_config(config, base_dir)
     conversion = Conversion(config)
     create_logs_directory(conversion)
+    start_log_pipeline(conversion.log_rotation_size)
+    start_metrics(conversion)
+    start_tracing(conversion)
     boot(conversion)
     read_data_types_map(conversion)
     read_index_types_map(conversion)
     create_schema(conversion)
     create_state_logs_table(conversion)
     create_data_pool_table(conversion)
+    create_progress_ledger_table(conversion)
     load_structure(conversion)
     read_data_pool(conversion)
     send_data(conversion)
-    decode(conversion)
-    process_constraints(conversion)
+
+    if conversion.spool_mode == SpoolMode.DUMP:
+        # The data will be loaded by a subsequent run in "LOAD" spool mode.
+        last_message = 'Data dump is accomplished.'
+    else:
+        process_constraints(conversion)
+        last_message = 'Migration is accomplished.'
+
     DBAccess.close_connection_pools(conversion)
     conversion.shutdown_thread_pool_executor()
-    generate_report(conversion, 'Migration is accomplished.')
+    stop_metrics()
+    stop_tracing(conversion)
+    generate_report(conversion, last_message)
+    stop_log_pipeline()
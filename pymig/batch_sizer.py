@@ -0,0 +1,99 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+import math
+
+
+class BatchSizer:
+    """
+    Defines how many rows to retrieve from MySQL per single batch.
+    Batch size is derived from a byte budget and an average row width, rather than set as a fixed number of rows,
+    so that wide tables (with large blobs) do not blow up memory, and narrow tables are not loaded in tiny batches.
+    The row width is seeded from table's size and rows count, and then refined by actually measured batches.
+    The byte budget shrinks when COPY of a single batch takes too long, and grows back when COPY is fast again.
+    """
+    # Used when table's size and rows count are unknown (or when the table is reported as empty).
+    DEFAULT_ROW_WIDTH = 256
+
+    # Limits of a number of rows per single batch.
+    MIN_BATCH_SIZE = 1
+    MAX_BATCH_SIZE = 500000
+
+    # The byte budget never shrinks below this value.
+    MIN_BYTE_BUDGET = 64 * 1024
+
+    # Weight of the latest measured row width, comparing to the accumulated average.
+    ROW_WIDTH_SMOOTHING = 0.5
+
+    SHRINK_FACTOR = 0.5
+    GROW_FACTOR = 1.25
+
+    _max_byte_budget: int
+    _byte_budget: float
+    _target_latency: float
+    _row_width: float
+
+    __slots__ = ('_max_byte_budget', '_byte_budget', '_target_latency', '_row_width',)
+
+    def __init__(self, byte_budget: int, target_latency: float, table_data_size: float, rows_cnt: int):
+        """
+        Class constructor.
+        "byte_budget" is set in bytes, "target_latency" - in seconds, "table_data_size" - in MB.
+        """
+        self._max_byte_budget = max(self.MIN_BYTE_BUDGET, byte_budget)
+        self._byte_budget = self._max_byte_budget
+        self._target_latency = target_latency
+        self._row_width = (table_data_size * 1024 * 1024 / rows_cnt
+                           if table_data_size > 0 and rows_cnt > 0
+                           else self.DEFAULT_ROW_WIDTH)
+
+    @property
+    def batch_size(self) -> int:
+        """
+        Returns a number of rows, which fits current byte budget.
+        """
+        return self.rows_per(self._byte_budget)
+
+    def rows_per(self, size: float) -> int:
+        """
+        Returns a number of rows, which fits given amount of bytes.
+        """
+        return max(self.MIN_BATCH_SIZE, min(self.MAX_BATCH_SIZE, math.floor(size / max(1.0, self._row_width))))
+
+    def observe_batch(self, rows_cnt: int, batch_size_in_bytes: int) -> None:
+        """
+        Refines the average row width using the size of just encoded batch.
+        """
+        if rows_cnt <= 0:
+            return
+
+        measured_row_width = batch_size_in_bytes / rows_cnt
+        self._row_width += self.ROW_WIDTH_SMOOTHING * (measured_row_width - self._row_width)
+
+    def observe_latency(self, latency: float) -> None:
+        """
+        Adjusts the byte budget using the duration (in seconds) of COPY of a single batch.
+        Slow COPY means the batch is too large to keep the writer responsive, so the budget shrinks.
+        Fast COPY lets the budget grow back, up to the configured value.
+        """
+        if self._target_latency <= 0:
+            return
+
+        if latency > self._target_latency:
+            self._byte_budget = max(self.MIN_BYTE_BUDGET, self._byte_budget * self.SHRINK_FACTOR)
+        elif latency < self._target_latency / 2:
+            self._byte_budget = min(self._max_byte_budget, self._byte_budget * self.GROW_FACTOR)
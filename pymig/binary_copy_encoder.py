@@ -0,0 +1,289 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+import io
+import codecs
+import struct
+import datetime
+from decimal import Decimal
+from functools import partial
+from typing import Any, Callable, Optional, cast
+
+from pymig.conversion import Conversion
+from pymig.table_processor import map_data_types
+
+
+# Notice, rows are fetched with native Python types, and encoded directly
+# into PostgreSQL binary COPY format, so neither MySQL nor PostgreSQL perform any per-value text conversion.
+COPY_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+COPY_BINARY_TRAILER = struct.pack('!h', -1)
+
+# MySQL zero-dates are converted to this value while fetching (see get_mysql_converters),
+# and encoded as PostgreSQL "-infinity".
+NEGATIVE_INFINITY = float('-inf')
+
+_NULL = struct.pack('!i', -1)
+_PG_EPOCH_DATE = datetime.date(2000, 1, 1)
+_PG_EPOCH_ORDINAL = _PG_EPOCH_DATE.toordinal()
+_PG_EPOCH_DATETIME = datetime.datetime(2000, 1, 1)
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+_MYSQL_ZERO_DATES = ('0000-00-00', b'0000-00-00')
+_PACK_FIELDS_COUNT = struct.Struct('!h').pack
+_PACK_INT2 = struct.Struct('!ih').pack
+_PACK_INT4 = struct.Struct('!ii').pack
+_PACK_INT8 = struct.Struct('!iq').pack
+_PACK_FLOAT4 = struct.Struct('!if').pack
+_PACK_FLOAT8 = struct.Struct('!id').pack
+_PACK_LENGTH = struct.Struct('!i').pack
+_PACK_NUMERIC_HEADER = struct.Struct('!hhHH').pack
+_NUMERIC_POSITIVE = 0x0000
+_NUMERIC_NEGATIVE = 0x4000
+_NUMERIC_NAN = 0xC000
+
+
+def _encode_int2(value: int) -> bytes:
+    return _PACK_INT2(2, value)
+
+
+def _encode_int4(value: int) -> bytes:
+    return _PACK_INT4(4, value)
+
+
+def _encode_int8(value: int) -> bytes:
+    return _PACK_INT8(8, value)
+
+
+def _encode_float4(value: float) -> bytes:
+    return _PACK_FLOAT4(4, value)
+
+
+def _encode_float8(value: float) -> bytes:
+    return _PACK_FLOAT8(8, value)
+
+
+def _encode_bytes(value: bytes) -> bytes:
+    return _PACK_LENGTH(len(value)) + value
+
+
+def _encode_text(value: Any, encoding: str = 'utf-8') -> bytes:
+    if isinstance(value, bytes):
+        return _PACK_LENGTH(len(value)) + value
+
+    if isinstance(value, (set, frozenset)):
+        value = ','.join(value)
+
+    # PostgreSQL does not accept "\0" in textual values.
+    # Notice, textual values of binary COPY are converted from the session's client encoding by PostgreSQL.
+    encoded = str(value).replace('\0', '').encode(encoding)
+    return _PACK_LENGTH(len(encoded)) + encoded
+
+
+def _encode_date(value: Any) -> bytes:
+    if value is NEGATIVE_INFINITY:
+        return _PACK_INT4(4, -2 ** 31)
+
+    return _PACK_INT4(4, value.toordinal() - _PG_EPOCH_ORDINAL)
+
+
+def _encode_timestamp(value: Any) -> bytes:
+    if value is NEGATIVE_INFINITY:
+        return _PACK_INT8(8, -2 ** 63)
+
+    if not isinstance(value, datetime.datetime):
+        # MySQL DATE column, mapped to PostgreSQL timestamp.
+        value = datetime.datetime(value.year, value.month, value.day)
+
+    return _PACK_INT8(8, (value - _PG_EPOCH_DATETIME) // _ONE_MICROSECOND)
+
+
+def _encode_time(value: Any) -> bytes:
+    if isinstance(value, datetime.time):
+        value = datetime.timedelta(
+            hours=value.hour,
+            minutes=value.minute,
+            seconds=value.second,
+            microseconds=value.microsecond,
+        )
+
+    return _PACK_INT8(8, value // _ONE_MICROSECOND)
+
+
+def _encode_numeric(value: Any) -> bytes:
+    """
+    Encodes given number into PostgreSQL binary "numeric" representation:
+    a header (ndigits, weight, sign, dscale) followed by base-10000 digits.
+    """
+    value = value if isinstance(value, Decimal) else Decimal(str(value))
+
+    if value.is_nan():
+        return _PACK_LENGTH(8) + _PACK_NUMERIC_HEADER(0, 0, _NUMERIC_NAN, 0)
+
+    sign, digits_tuple, raw_exponent = value.as_tuple()
+    exponent = cast(int, raw_exponent)
+    digits = ''.join(map(str, digits_tuple))
+
+    if exponent >= 0:
+        int_digits, frac_digits = digits + '0' * exponent, ''
+    else:
+        digits = digits.rjust(-exponent, '0')
+        int_digits, frac_digits = digits[:exponent], digits[exponent:]
+
+    dscale = len(frac_digits)
+    int_digits = int_digits.lstrip('0')
+    int_digits = int_digits.rjust((len(int_digits) + 3) // 4 * 4, '0')
+    frac_digits = frac_digits.ljust((len(frac_digits) + 3) // 4 * 4, '0')
+    all_digits = int_digits + frac_digits
+    groups = [int(all_digits[i:i + 4]) for i in range(0, len(all_digits), 4)]
+    weight = len(int_digits) // 4 - 1
+
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+
+    while groups and groups[-1] == 0:
+        groups.pop()
+
+    if not groups:
+        weight, sign = 0, 0
+
+    ndigits = len(groups)
+    header = _PACK_NUMERIC_HEADER(ndigits, weight, _NUMERIC_NEGATIVE if sign else _NUMERIC_POSITIVE, dscale)
+    payload = header + struct.pack(f'!{ndigits}H', *groups)
+    return _PACK_LENGTH(len(payload)) + payload
+
+
+_ENCODERS: dict[str, Callable[[Any], bytes]] = {
+    'smallint': _encode_int2,
+    'int': _encode_int4,
+    'integer': _encode_int4,
+    'bigint': _encode_int8,
+    'real': _encode_float4,
+    'double precision': _encode_float8,
+    'numeric': _encode_numeric,
+    'decimal': _encode_numeric,
+    'date': _encode_date,
+    'timestamp': _encode_timestamp,
+    'time': _encode_time,
+    'bytea': _encode_bytes,
+    'geometry': _encode_bytes,
+    'character': _encode_text,
+    'character varying': _encode_text,
+    'text': _encode_text,
+    'json': _encode_text,
+}
+
+
+def get_column_types(conversion: Conversion, table_name: str) -> list[str]:
+    """
+    Returns a list of PostgreSQL data types of given table's columns.
+    """
+    return [
+        map_data_types(conversion.data_types_map, column['Type'])
+        for column in conversion.dic_tables[table_name].table_columns
+    ]
+
+
+def get_table_copy_format(conversion: Conversion, table_name: str) -> str:
+    """
+    Returns COPY format ("text" or "binary"), that will be used to load given table.
+    Binary format is used if, and only if it is enabled, and all table's columns have a binary encoder.
+    Notice, in "migrate only data" mode target tables are preset, hence their data types are unknown.
+    """
+    if conversion.copy_format != 'binary' or conversion.should_migrate_only_data():
+        return 'text'
+
+    if table_name not in conversion.dic_tables or not conversion.dic_tables[table_name].table_columns:
+        return 'text'
+
+    column_types = get_column_types(conversion, table_name)
+    return 'binary' if get_encoders(column_types) is not None else 'text'
+
+
+def get_encoders(column_types: list[str], encoding: str = 'utf-8') -> Optional[list[Callable[[Any], bytes]]]:
+    """
+    Returns a list of binary encoders, one per column.
+    Textual values are encoded using given (Python) encoding, which must match the COPY session's client encoding.
+    Returns None if at least one of given PostgreSQL data types has no binary encoder.
+    """
+    encoders = []
+    is_utf8 = codecs.lookup(encoding).name == 'utf-8'
+
+    for column_type in column_types:
+        encoder = _ENCODERS.get(column_type.split('(')[0].strip().lower())
+
+        if encoder is None:
+            return None
+
+        if encoder is _encode_text and not is_utf8:
+            encoder = partial(_encode_text, encoding=encoding)
+
+        encoders.append(encoder)
+
+    return encoders
+
+
+def process_mysql_data_binary(
+    batch: tuple[tuple[Any, ...], ...],
+    encoders: list[Callable[[Any], bytes]]
+) -> io.BytesIO:
+    """
+    Accepts a batch of records from ``MySQLdb``,
+    and returns this batch converted to ``io.BytesIO`` instance in PostgreSQL binary COPY format.
+    """
+    binary_stream = io.BytesIO()
+    binary_stream.write(COPY_BINARY_HEADER)
+    binary_stream.write(encode_binary_rows(batch, encoders))
+    binary_stream.write(COPY_BINARY_TRAILER)
+    binary_stream.seek(0)
+    return binary_stream
+
+
+def encode_binary_rows(
+    batch: tuple[tuple[Any, ...], ...],
+    encoders: list[Callable[[Any], bytes]]
+) -> bytes:
+    """
+    Encodes given batch of records into PostgreSQL binary tuples.
+    Notice, neither COPY header, nor COPY trailer is included.
+    """
+    fields_count = _PACK_FIELDS_COUNT(len(encoders))
+    return b''.join([
+        fields_count + b''.join([_NULL if value is None else encoder(value) for value, encoder in zip(record, encoders)])
+        for record in batch
+    ])
+
+
+def get_mysql_converters() -> dict:
+    """
+    Returns MySQLdb converters, that keep MySQL zero-dates distinguishable from NULLs.
+    By default, MySQLdb converts zero-dates to None.
+    """
+    from MySQLdb.constants import FIELD_TYPE
+    from MySQLdb.converters import conversions
+    from MySQLdb.times import Date_or_None, DateTime_or_None
+
+    def _date_or_negative_infinity(value: Any) -> Any:
+        return NEGATIVE_INFINITY if value[:10] in _MYSQL_ZERO_DATES else Date_or_None(value)
+
+    def _datetime_or_negative_infinity(value: Any) -> Any:
+        return NEGATIVE_INFINITY if value[:10] in _MYSQL_ZERO_DATES else DateTime_or_None(value)
+
+    converters = conversions.copy()
+    converters[FIELD_TYPE.DATE] = _date_or_negative_infinity
+    converters[FIELD_TYPE.DATETIME] = _datetime_or_negative_infinity
+    converters[FIELD_TYPE.TIMESTAMP] = _datetime_or_negative_infinity
+    return cast(dict, converters)
@@ -23,8 +23,10 @@ import pymig.db_access as DBAccess
 from pymig.db_vendor import DBVendor
 from pymig.fs_ops import generate_error
 from pymig.conversion import Conversion
+from pymig.tracer import traced
 
 
+@traced('stage')
 def boot(conversion: Conversion) -> None:
     """
     Boots the migration.
@@ -71,18 +73,23 @@ def get_introduction_message() -> str:
 def _check_connection(conversion: Conversion) -> str:
     """
     Checks correctness of connection details of both MySQL and PostgreSQL.
+    Notice, MySQL connection is not checked, when MySQL is not used by current run (see "should_query_source").
     """
     sql = 'SELECT 1;'
-    mysql_result = DBAccess.query(
-        conversion=conversion,
-        caller=_check_connection.__name__,
-        sql=sql,
-        vendor=DBVendor.MYSQL,
-        process_exit_on_error=False,
-        should_return_client=False
-    )
+    result_message = ''
+
+    if conversion.should_query_source():
+        mysql_result = DBAccess.query(
+            conversion=conversion,
+            caller=_check_connection.__name__,
+            sql=sql,
+            vendor=DBVendor.MYSQL,
+            process_exit_on_error=False,
+            should_return_client=False
+        )
+
+        result_message += f'	MySQL connection error: {mysql_result.error}' if mysql_result.error else ''
 
-    result_message = f'	MySQL connection error: {mysql_result.error}' if mysql_result.error else ''
     pg_result = DBAccess.query(
         conversion=conversion,
         caller=_check_connection.__name__,
@@ -0,0 +1,300 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+import os
+import sys
+import json
+import threading
+from decimal import Decimal
+from typing import Any, Optional, cast
+
+from dbutils.pooled_db import PooledDedicatedDBConnection
+
+import pymig.db_access as DBAccess
+from pymig.db_vendor import DBVendor
+from pymig.fs_ops import log, generate_error
+from pymig.conversion import Conversion
+from pymig.spool_mode import SpoolMode
+
+# Guards creation of the catalog snapshot, which is requested by concurrently running threads.
+_snapshot_lock = threading.Lock()
+
+# Name of the file, the catalog snapshot is spooled into, in "DUMP" spool mode.
+_SPOOLED_CATALOG_NAME = 'catalog.json'
+
+
+class CatalogSnapshot:
+    """
+    In-memory copy of the source catalog, retrieved by a few bulk "information_schema" queries,
+    instead of querying each table separately.
+    All the collections are keyed by original (MySQL) table names.
+    Notice:
+    1. Columns are represented the same way as "SHOW FULL COLUMNS" rows, and indexes - as "SHOW INDEX" rows.
+    2. The snapshot is never modified once loaded, so it is shared by all threads without locking.
+    3. Relations ("SHOW FULL TABLES" rows) and views (MySQL code of each view) are filled
+       only when the snapshot is read from the spool directory (see "spool_catalog_snapshot").
+    """
+    tables: dict[str, dict[str, Any]]
+    columns: dict[str, list[dict[str, Any]]]
+    indexes: dict[str, list[dict[str, Any]]]
+    foreign_keys: dict[str, list[dict[str, Any]]]
+    relations: list[dict[str, Any]]
+    views: dict[str, str]
+
+    __slots__ = ('tables', 'columns', 'indexes', 'foreign_keys', 'relations', 'views')
+
+    def __init__(self) -> None:
+        """
+        CatalogSnapshot constructor.
+        """
+        self.tables = {}
+        self.columns = {}
+        self.indexes = {}
+        self.foreign_keys = {}
+        self.relations = []
+        self.views = {}
+
+    def get_table(self, original_table_name: str) -> dict[str, Any]:
+        """
+        Returns statistics and comment of given table.
+        """
+        return self.tables.get(original_table_name, {})
+
+    def get_columns(self, original_table_name: str) -> list[dict[str, Any]]:
+        """
+        Returns columns of given table, ordered by their position.
+        """
+        return self.columns.get(original_table_name, [])
+
+    def get_indexes(self, original_table_name: str) -> list[dict[str, Any]]:
+        """
+        Returns indexes columns of given table, PK first.
+        """
+        return self.indexes.get(original_table_name, [])
+
+    def get_foreign_keys(self, original_table_name: str) -> list[dict[str, Any]]:
+        """
+        Returns foreign keys columns of given table.
+        """
+        return self.foreign_keys.get(original_table_name, [])
+
+
+def get_catalog_snapshot(conversion: Conversion) -> CatalogSnapshot:
+    """
+    Returns the catalog snapshot, which is loaded on demand.
+    Notice, in "LOAD" spool mode the snapshot is read from the spool directory, so MySQL is not queried.
+    """
+    with _snapshot_lock:
+        if conversion.catalog_snapshot is None:
+            conversion.catalog_snapshot = (_read_spooled_catalog_snapshot(conversion)
+                                           if conversion.spool_mode == SpoolMode.LOAD
+                                           else _load_catalog_snapshot(conversion))
+
+        return conversion.catalog_snapshot
+
+
+def spool_catalog_snapshot(conversion: Conversion, relations: list[dict[str, Any]], views: dict[str, str]) -> None:
+    """
+    Writes the catalog snapshot, along with given relations and MySQL code of views, into the spool directory,
+    so that subsequent run in "LOAD" spool mode does not touch the source database.
+    Notice, the file is written under a temporary name, and renamed once complete.
+    """
+    snapshot = get_catalog_snapshot(conversion)
+    spooled_catalog = {
+        'mysql_version': conversion.mysql_version,
+        'relations': relations,
+        'views': views,
+        'tables': snapshot.tables,
+        'columns': snapshot.columns,
+        'indexes': snapshot.indexes,
+        'foreign_keys': snapshot.foreign_keys,
+    }
+
+    os.makedirs(conversion.spool_dir, exist_ok=True)
+    spooled_catalog_path = os.path.join(conversion.spool_dir, _SPOOLED_CATALOG_NAME)
+
+    with open(f'{spooled_catalog_path}.part', 'w') as file:
+        json.dump(spooled_catalog, file, default=_to_json)
+
+    os.replace(f'{spooled_catalog_path}.part', spooled_catalog_path)
+    log(conversion, f'[{spool_catalog_snapshot.__name__}] Source catalog is spooled into "{spooled_catalog_path}"')
+
+
+def _read_spooled_catalog_snapshot(conversion: Conversion) -> CatalogSnapshot:
+    """
+    Reads the catalog snapshot, written by previous run in "DUMP" spool mode.
+    """
+    spooled_catalog_path = os.path.join(conversion.spool_dir, _SPOOLED_CATALOG_NAME)
+
+    if not os.path.isfile(spooled_catalog_path):
+        msg = (f'[{_read_spooled_catalog_snapshot.__name__}] "{spooled_catalog_path}" does not exist.'
+               f' Please, run the migration in "DUMP" spool mode first')
+
+        generate_error(conversion, msg)
+        sys.exit(1)
+
+    with open(spooled_catalog_path) as file:
+        spooled_catalog = json.load(file)
+
+    snapshot = CatalogSnapshot()
+    snapshot.tables = spooled_catalog['tables']
+    snapshot.columns = spooled_catalog['columns']
+    snapshot.indexes = spooled_catalog['indexes']
+    snapshot.foreign_keys = spooled_catalog['foreign_keys']
+    snapshot.relations = spooled_catalog['relations']
+    snapshot.views = spooled_catalog['views']
+    conversion.mysql_version = spooled_catalog['mysql_version']
+    log(conversion, f'[{_read_spooled_catalog_snapshot.__name__}] Source catalog is read from "{spooled_catalog_path}"')
+    return snapshot
+
+
+def _to_json(value: Any) -> Any:
+    """
+    Converts given catalog value, which is not JSON serializable by default.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+
+    if isinstance(value, bytes):
+        return value.decode()
+
+    return str(value)
+
+
+def _load_catalog_snapshot(conversion: Conversion) -> CatalogSnapshot:
+    """
+    Retrieves the source catalog by bulk queries.
+    """
+    snapshot = CatalogSnapshot()
+    sql_tables = (
+        'SELECT TABLE_NAME AS table_name, TABLE_ROWS AS rows_cnt,'
+        ' ROUND((DATA_LENGTH / 1024 / 1024), 2) AS size_in_mb, TABLE_COMMENT AS table_comment,'
+        ' AUTO_INCREMENT AS auto_increment'
+        ' FROM information_schema.TABLES'
+        " WHERE TABLE_SCHEMA = %s AND TABLE_TYPE = 'BASE TABLE';"
+    )
+
+    tables_rows = _query(conversion, sql_tables, _get_uncached_statistics_client(conversion))
+    snapshot.tables = {row['table_name']: row for row in tables_rows}
+    sql_columns = (
+        'SELECT TABLE_NAME AS table_name, COLUMN_NAME AS `Field`, COLUMN_TYPE AS `Type`,'
+        ' COLLATION_NAME AS `Collation`, IS_NULLABLE AS `Null`, COLUMN_KEY AS `Key`, COLUMN_DEFAULT AS `Default`,'
+        ' EXTRA AS `Extra`, PRIVILEGES AS `Privileges`, COLUMN_COMMENT AS `Comment`'
+        ' FROM information_schema.COLUMNS'
+        ' WHERE TABLE_SCHEMA = %s'
+        ' ORDER BY TABLE_NAME, ORDINAL_POSITION;'
+    )
+
+    snapshot.columns = _group_by_table(_query(conversion, sql_columns))
+    sql_indexes = (
+        'SELECT TABLE_NAME AS table_name, NON_UNIQUE AS `Non_unique`, INDEX_NAME AS `Key_name`,'
+        ' SEQ_IN_INDEX AS `Seq_in_index`, COLUMN_NAME AS `Column_name`, INDEX_TYPE AS `Index_type`'
+        ' FROM information_schema.STATISTICS'
+        ' WHERE TABLE_SCHEMA = %s'
+        " ORDER BY TABLE_NAME, INDEX_NAME = 'PRIMARY' DESC, INDEX_NAME, SEQ_IN_INDEX;"
+    )
+
+    snapshot.indexes = _group_by_table(_query(conversion, sql_indexes))
+    sql_foreign_keys = """
+        SELECT 
+            cols.TABLE_NAME AS table_name,
+            cols.COLUMN_NAME, refs.REFERENCED_TABLE_NAME, refs.REFERENCED_COLUMN_NAME,
+            cRefs.UPDATE_RULE, cRefs.DELETE_RULE, cRefs.CONSTRAINT_NAME 
+        FROM INFORMATION_SCHEMA.`COLUMNS` AS cols 
+        INNER JOIN INFORMATION_SCHEMA.`KEY_COLUMN_USAGE` AS refs 
+            ON refs.TABLE_SCHEMA = cols.TABLE_SCHEMA 
+                AND refs.REFERENCED_TABLE_SCHEMA = cols.TABLE_SCHEMA 
+                AND refs.TABLE_NAME = cols.TABLE_NAME 
+                AND refs.COLUMN_NAME = cols.COLUMN_NAME 
+        LEFT JOIN INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS AS cRefs 
+            ON cRefs.CONSTRAINT_SCHEMA = cols.TABLE_SCHEMA 
+                AND cRefs.CONSTRAINT_NAME = refs.CONSTRAINT_NAME 
+        WHERE cols.TABLE_SCHEMA = %s
+        ORDER BY cols.TABLE_NAME, refs.CONSTRAINT_NAME, refs.ORDINAL_POSITION;
+    """
+
+    snapshot.foreign_keys = _group_by_table(_query(conversion, sql_foreign_keys))
+    msg = (f'[{_load_catalog_snapshot.__name__}] Source catalog is loaded: {len(snapshot.tables)} tables,'
+           f' {sum(len(columns) for columns in snapshot.columns.values())} columns,'
+           f' {sum(len(indexes) for indexes in snapshot.indexes.values())} indexes columns,'
+           f' {sum(len(foreign_keys) for foreign_keys in snapshot.foreign_keys.values())} foreign keys columns')
+
+    log(conversion, msg)
+    return snapshot
+
+
+def _query(
+    conversion: Conversion,
+    sql: str,
+    client: Optional[PooledDedicatedDBConnection] = None
+) -> list[dict[str, Any]]:
+    """
+    Runs given catalog query against the source database.
+    """
+    result = DBAccess.query(
+        conversion=conversion,
+        caller=_load_catalog_snapshot.__name__,
+        sql=sql,
+        vendor=DBVendor.MYSQL,
+        process_exit_on_error=True,
+        should_return_client=False,
+        client=client,
+        bindings=(conversion.mysql_db_name,)
+    )
+
+    return cast(list[dict[str, Any]], result.data)
+
+
+def _get_uncached_statistics_client(conversion: Conversion) -> Optional[PooledDedicatedDBConnection]:
+    """
+    Returns MySQL client, which retrieves up-to-date tables statistics (rows count, size, AUTO_INCREMENT).
+    Notice, MySQL 8 caches tables statistics (24 hours by default), unless "information_schema_stats_expiry" is 0.
+    Returns None for earlier versions, which do not cache the statistics.
+    """
+    major_version = int(conversion.mysql_version.split('.')[0])
+
+    if major_version < 8 or major_version >= 10:
+        # Notice, MariaDB versions start at 10.
+        return None
+
+    result = DBAccess.query(
+        conversion=conversion,
+        caller=_get_uncached_statistics_client.__name__,
+        sql='SET SESSION information_schema_stats_expiry = 0;',
+        vendor=DBVendor.MYSQL,
+        process_exit_on_error=False,
+        should_return_client=True
+    )
+
+    if result.error:
+        DBAccess.release_db_client(conversion, result.client)
+        return None
+
+    return result.client
+
+
+def _group_by_table(rows: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """
+    Groups given catalog rows by table name, preserving their order.
+    Notice, the table name is removed from each row, so rows look the same way as per-table query results.
+    """
+    grouped_rows: dict[str, list[dict[str, Any]]] = {}
+
+    for row in rows:
+        grouped_rows.setdefault(row.pop('table_name'), []).append(row)
+
+    return grouped_rows
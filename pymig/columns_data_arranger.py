@@ -22,11 +22,14 @@ def arrange_columns_data(
     table_columns: list[dict],
     mysql_version: str,
     mysql_charset: str,
+    copy_format: str = 'text',
 ) -> str:
     """
     Arranges columns data before loading.
     Notice, the "inline" columns encoding conversion cannot be implemented,
     since MySQL's utf-8 implementation isn't the same as PostgreSQL's one.
+    In binary COPY format, columns are selected "as is" (except spatial ones),
+    since values are encoded on the client side.
     """
     select_fields_list = []
     wkb_func = 'ST_AsWKB' if float(mysql_version) >= 5.76 else 'AsWKB'
@@ -34,12 +37,17 @@ def arrange_columns_data(
     for column in table_columns:
         col_field, col_type = column['Field'], column['Type']
 
-        if is_spacial(col_type):
+        if copy_format == 'binary':
+            select_fields_list.append(f'{wkb_func}(`{col_field}`) AS `{col_field}`'
+                                      if is_spacial(col_type)
+                                      else f'`{col_field}`')
+        elif is_spacial(col_type):
             # Apply HEX(ST_AsWKB(...)) due to the issue, described at https://bugs.mysql.com/bug.php?id=69798
-            select_fields_list.append(f'IFNULL(CONCAT(\'\\x\', HEX({wkb_func}(`{col_field}`))), \'\\\\N\')'
-                                      f' AS `{col_field}`')
+            # PostGIS accepts hex-encoded WKB as a textual representation of geometry, so no decoding is required.
+            select_fields_list.append(f'IFNULL(HEX({wkb_func}(`{col_field}`)), \'\\\\N\') AS `{col_field}`')
         elif is_binary(col_type):
-            select_fields_list.append(f'IFNULL(CONCAT(\'\\x\', HEX(`{col_field}`)), \'\\\\N\') AS `{col_field}`')
+            # COPY turns "\\x" into "\x", hence the value is parsed by PostgreSQL as bytea in hex format.
+            select_fields_list.append(f'IFNULL(CONCAT(\'\\\\\\\\x\', HEX(`{col_field}`)), \'\\\\N\') AS `{col_field}`')
         elif is_bit(col_type):
             select_fields_list.append('IFNULL(BIN(`{0}`), \'\\\\N\') AS `{0}`'.format(col_field))
         elif is_date_time(col_type):
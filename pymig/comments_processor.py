@@ -15,88 +15,83 @@ __license__ = """
     along with this program (please see the "LICENSE.md" file).
     If not, see <http://www.gnu.org/licenses/gpl.txt>.
 """
-from typing import cast, Any
-
 import pymig.db_access as DBAccess
 import pymig.extra_config_processor as ExtraConfigProcessor
 from pymig.fs_ops import log
 from pymig.conversion import Conversion
 from pymig.db_vendor import DBVendor
+from pymig.catalog_snapshot import get_catalog_snapshot
 
 
 def process_comments(conversion: Conversion, table_name: str) -> None:
     """
     Migrates comments.
+    All the table's comments are created within a single transaction.
+    Notice, if the transaction fails, the comments are created one by one,
+    so that a single failing comment does not prevent the others from being created.
     """
+    log_path = conversion.dic_tables[table_name].table_log_path
     msg = f'[{process_comments.__name__}] Creates comments for table "{conversion.schema}"."{table_name}"...'
-    log(conversion, msg, conversion.dic_tables[table_name].table_log_path)
-    _process_table_comments(conversion, table_name)
-    _process_columns_comments(conversion, table_name)
-
-
-def _process_table_comments(conversion: Conversion, table_name: str) -> None:
-    """
-    Creates table comments.
-    """
-    sql_select_comment = (f"SELECT table_comment AS table_comment FROM information_schema.tables "
-                          f"WHERE table_schema = '{conversion.mysql_db_name}' AND table_name = "
-                          f"'{ExtraConfigProcessor.get_table_name(conversion, table_name, should_get_original=True)}';")
-
-    select_comments_result = DBAccess.query(
-        conversion=conversion,
-        caller=_process_table_comments.__name__,
-        sql=sql_select_comment,
-        vendor=DBVendor.MYSQL,
-        process_exit_on_error=False,
-        should_return_client=False
-    )
+    log(conversion, msg, log_path)
+    original_table_name = ExtraConfigProcessor.get_table_name(conversion, table_name, should_get_original=True)
+    statements = _get_table_comment_sql(conversion, table_name, original_table_name) + [
+        _get_column_comment_sql(conversion, table_name, original_table_name, column)
+        for column in conversion.dic_tables[table_name].table_columns
+        if column['Comment'] != ''
+    ]
 
-    if select_comments_result.error:
+    if not statements:
         return
 
-    select_comments_result_data = cast(list[dict[str, Any]], select_comments_result.data)
-    comment = _escape_quotes(select_comments_result_data[0]['table_comment'])
-    sql_create_comment = f'COMMENT ON TABLE "{conversion.schema}"."{table_name}" IS \'{comment}\';'
-    create_comment_result = DBAccess.query(
+    create_comments_result = DBAccess.query(
         conversion=conversion,
-        caller=_process_table_comments.__name__,
-        sql=sql_create_comment,
+        caller=process_comments.__name__,
+        sql=' '.join(statements),
         vendor=DBVendor.PG,
         process_exit_on_error=False,
-        should_return_client=False
+        should_return_client=False,
+        should_return_programming_error=True
     )
 
-    if create_comment_result.error:
-        return
+    if not create_comments_result.error:
+        msg = (f'[{process_comments.__name__}] Successfully set {len(statements)} comments'
+               f' for table "{conversion.schema}"."{table_name}"')
 
-    msg = (f'[{_process_table_comments.__name__}]'
-           f' Successfully set comment for table "{conversion.schema}"."{table_name}"')
+        log(conversion, msg, log_path)
+        return
 
-    log(conversion, msg, conversion.dic_tables[table_name].table_log_path)
+    for statement in statements:
+        DBAccess.query(
+            conversion=conversion,
+            caller=process_comments.__name__,
+            sql=statement,
+            vendor=DBVendor.PG,
+            process_exit_on_error=False,
+            should_return_client=False
+        )
 
 
-def _process_columns_comments(conversion: Conversion, table_name: str) -> None:
+def _get_table_comment_sql(conversion: Conversion, table_name: str, original_table_name: str) -> list[str]:
     """
-    Creates columns comments.
+    Returns a statement, that creates table comment, if the table has one.
     """
-    original_table_name = ExtraConfigProcessor.get_table_name(conversion, table_name, should_get_original=True)
-    params = [
-        [conversion, table_name, original_table_name, column]
-        for column in conversion.dic_tables[table_name].table_columns
-        if column['Comment'] != ''
-    ]
+    table = get_catalog_snapshot(conversion).get_table(original_table_name)
+
+    if not table or not table['table_comment']:
+        return []
 
-    conversion.run_concurrently(func=_set_column_comment, params_list=params)
+    comment = _escape_quotes(table['table_comment'])
+    return [f'COMMENT ON TABLE "{conversion.schema}"."{table_name}" IS \'{comment}\';']
 
 
-def _set_column_comment(
+def _get_column_comment_sql(
     conversion: Conversion,
     table_name: str,
     original_table_name: str,
     column: dict
-) -> None:
+) -> str:
     """
-    Creates comment on specified column.
+    Returns a statement, that creates comment on specified column.
     """
     column_name = ExtraConfigProcessor.get_column_name(
         conversion=conversion,
@@ -106,22 +101,7 @@ def _set_column_comment(
     )
 
     comment = _escape_quotes(column['Comment'])
-    create_comment_result = DBAccess.query(
-        conversion=conversion,
-        caller=_set_column_comment.__name__,
-        sql=f'COMMENT ON COLUMN "{conversion.schema}"."{table_name}"."{column_name}" IS \'{comment}\';',
-        vendor=DBVendor.PG,
-        process_exit_on_error=False,
-        should_return_client=False
-    )
-
-    if create_comment_result.error:
-        return
-
-    msg = (f'[{_set_column_comment.__name__}] Set comment for'
-           f' "{conversion.schema}"."{table_name}" column: "{column_name}"...')
-
-    log(conversion, msg, conversion.dic_tables[table_name].table_log_path)
+    return f'COMMENT ON COLUMN "{conversion.schema}"."{table_name}"."{column_name}" IS \'{comment}\';'
 
 
 def _escape_quotes(string: str) -> str:
@@ -15,52 +15,218 @@ __license__ = """
     along with this program (please see the "LICENSE.md" file).
     If not, see <http://www.gnu.org/licenses/gpl.txt>.
 """
+from typing import Optional, cast
+from concurrent.futures import Future
+
 import pymig.migration_state_manager as MigrationStateManager
 from pymig.conversion import Conversion
+from pymig.fs_ops import generate_error
+from pymig.tracer import traced
 from pymig.indexes_processor import create_indexes
-from pymig.enum_processor import process_enum
-from pymig.sequences_processor import set_sequence_value, create_sequence
-from pymig.null_processor import process_null
-from pymig.default_processor import process_default
+from pymig.enum_processor import get_enum_clauses
+from pymig.sequences_processor import set_sequence_value, create_sequence, adjust_sequence_value
+from pymig.null_processor import get_null_clauses
+from pymig.default_processor import get_default_clauses
 from pymig.comments_processor import process_comments
-from pymig.view_generator import generate_views
-from pymig.foreign_key_processor import set_foreign_keys
+from pymig.view_generator import get_view_sql, get_referenced_relations, create_view
+from pymig.foreign_key_processor import get_foreign_keys, set_foreign_key, validate_foreign_key
+from pymig.index_build_scheduler import wait_for_index_builds
+from pymig.table_processor import set_logged, alter_table
+from pymig.task_graph import TaskGraph, get_resolved_future
 
 
-def process_constraints(conversion: Conversion) -> None:
+def schedule_constraints(conversion: Conversion, tables_to_load: set[str]) -> dict[str, Future]:
     """
-    Continues migration process after data loading.
+    Builds the dependency graph of the work, that follows data loading, and starts running it.
+    Each piece of work starts as soon as its inputs are ready, instead of waiting for the whole stage:
+    1. Table's constraints and indexes - once the table is loaded.
+    2. A foreign key - once indexes of both the table and the referenced table are built.
+    3. A view - once the views it references are created (tables exist since the structure is loaded).
+    Returns Futures, which the data loader must resolve, as soon as each of given tables is loaded.
+    Notice:
+    1. The rest of the tables are considered loaded (by previous runs).
+    2. If the data loader fails a table's Future (some of its data-chunks are not loaded),
+       neither the table's constraints, nor its foreign keys are processed, so they are processed by the next run.
     """
-    are_table_constraints_loaded = MigrationStateManager.get(conversion, 'per_table_constraints_loaded')
+    graph = TaskGraph(conversion)
+    conversion.post_load_graph = graph
+    tables_loaded = {
+        table_name: Future() if table_name in tables_to_load else get_resolved_future(table_name)
+        for table_name in conversion.tables_to_migrate
+    }
+
+    if MigrationStateManager.get(conversion, 'per_table_constraints_loaded'):
+        tables_processed = {table_name: get_resolved_future(table_name) for table_name in conversion.tables_to_migrate}
+    else:
+        # Notice, a task, returned by "process_constraints_per_table", is completed once the table's indexes are built.
+        tables_processed = {
+            table_name: graph.add_task(
+                process_constraints_per_table,
+                [conversion, table_name],
+                [table_loaded],
+                skip_on_failed_dependency=True,
+            )
+            for table_name, table_loaded in tables_loaded.items()
+        }
+
+        # Notice, sequences, initialized by AUTO_INCREMENT values, are checked against the loaded data,
+        # once the tables' PK indexes are built.
+        sequences_adjusted = [
+            graph.add_task(
+                adjust_sequence_value,
+                [conversion, table_name],
+                [table_processed],
+                skip_on_failed_dependency=True,
+            )
+            for table_name, table_processed in tables_processed.items()
+        ] if conversion.sequence_initialization == 'AUTO_INCREMENT' else []
 
-    if not are_table_constraints_loaded:
-        params = [[conversion, table_name] for table_name in conversion.tables_to_migrate]
-        conversion.run_concurrently(func=process_constraints_per_table, params_list=params)
+        graph.add_task(
+            MigrationStateManager.set,
+            [conversion, 'per_table_constraints_loaded'],
+            list(tables_processed.values()) + sequences_adjusted,
+            skip_on_failed_dependency=True,
+        )
 
     if conversion.should_migrate_only_data():
-        MigrationStateManager.set(conversion, 'per_table_constraints_loaded', 'foreign_keys_loaded', 'views_loaded')
-    else:
-        MigrationStateManager.set(conversion, 'per_table_constraints_loaded')
-        set_foreign_keys(conversion)
-        MigrationStateManager.set(conversion, 'foreign_keys_loaded')
-        generate_views(conversion)
-        MigrationStateManager.set(conversion, 'views_loaded')
+        MigrationStateManager.set(conversion, 'foreign_keys_loaded', 'views_loaded')
+        return tables_loaded
+
+    if not MigrationStateManager.get(conversion, 'foreign_keys_loaded'):
+        _schedule_foreign_keys(conversion, graph, tables_processed)
+
+    if not MigrationStateManager.get(conversion, 'views_loaded'):
+        _schedule_views(conversion, graph)
+
+    return tables_loaded
+
+
+@traced('stage')
+def process_constraints(conversion: Conversion) -> None:
+    """
+    Waits for the work, that follows data loading, to complete, and finalizes the migration.
+    """
+    if conversion.post_load_graph is None:
+        # All the data was loaded by previous runs.
+        schedule_constraints(conversion, set())
+
+    cast(TaskGraph, conversion.post_load_graph).wait()
+    conversion.post_load_graph = None
+    wait_for_index_builds(conversion)
+    incomplete_data_chunks_cnt = MigrationStateManager.get_incomplete_data_chunks_cnt(conversion)
+
+    if incomplete_data_chunks_cnt > 0:
+        msg = (f'[{process_constraints.__name__}] {incomplete_data_chunks_cnt} data-chunks are not loaded entirely.'
+               f' Please, run the migration again, in order to resume loading')
+
+        generate_error(conversion, msg)
+        return
 
     # !!!Note, dropping of data - pool and state - logs tables MUST be the last step of migration process.
     MigrationStateManager.drop_data_pool_table(conversion)
+    MigrationStateManager.drop_progress_ledger_table(conversion)
     MigrationStateManager.drop_state_logs_table(conversion)
 
 
-def process_constraints_per_table(conversion: Conversion, table_name: str) -> None:
+def _schedule_foreign_keys(conversion: Conversion, graph: TaskGraph, tables_processed: dict[str, Future]) -> None:
+    """
+    Schedules creation of each foreign key, right after indexes of both related tables are built.
+    In "foreign_keys_not_valid" mode, each foreign key is validated right after it is created.
+    """
+    foreign_keys_created = []
+
+    for table_name in conversion.tables_to_migrate:
+        for constraint_name, constraint in get_foreign_keys(conversion, table_name).items():
+            referenced_table_name = cast(str, constraint['referenced_table_name'])
+            dependencies = [tables_processed[table_name]]
+
+            if referenced_table_name in tables_processed and referenced_table_name != table_name:
+                dependencies.append(tables_processed[referenced_table_name])
+
+            params = [conversion, table_name, constraint_name, constraint]
+            foreign_key_created = graph.add_task(set_foreign_key, params, dependencies, skip_on_failed_dependency=True)
+
+            if conversion.foreign_keys_not_valid:
+                params = [conversion, table_name, constraint_name, foreign_key_created]
+                foreign_key_created = graph.add_task(
+                    validate_foreign_key,
+                    params,
+                    [foreign_key_created],
+                    skip_on_failed_dependency=True,
+                )
+
+            foreign_keys_created.append(foreign_key_created)
+
+    graph.add_task(
+        MigrationStateManager.set,
+        [conversion, 'foreign_keys_loaded'],
+        foreign_keys_created,
+        skip_on_failed_dependency=True,
+    )
+
+
+def _schedule_views(conversion: Conversion, graph: TaskGraph) -> None:
+    """
+    Schedules creation of each view, right after the views it references are created.
+    Notice, views are scheduled in the order of their dependencies, so each dependency is scheduled first.
+    """
+    views_sql: dict[str, Optional[str]] = dict(conversion.run_concurrently(
+        func=lambda view_name: (view_name, get_view_sql(conversion, view_name)),
+        params_list=[[view_name] for view_name in conversion.views_to_migrate],
+    ))
+
+    views_created: dict[str, Future] = {}
+
+    def _schedule_view(view_name: str, path: tuple[str, ...]) -> Future:
+        if view_name not in views_created:
+            referenced_views = sorted(
+                relation_name
+                for relation_name in get_referenced_relations(views_sql[view_name] or '')
+                if relation_name in views_sql and relation_name not in path
+            )
+
+            dependencies = [
+                _schedule_view(referenced_view, path + (view_name,))
+                for referenced_view in referenced_views
+            ]
+
+            params = [conversion, view_name, views_sql[view_name]]
+            views_created[view_name] = graph.add_task(create_view, params, dependencies)
+
+        return views_created[view_name]
+
+    for view_name in views_sql:
+        _schedule_view(view_name, ())
+
+    graph.add_task(MigrationStateManager.set, [conversion, 'views_loaded'], list(views_created.values()))
+
+
+def process_constraints_per_table(conversion: Conversion, table_name: str) -> Optional[Future]:
     """
     Processes given table's constraints.
+    Returns a Future, which is resolved when all the table's indexes are built.
     """
     if conversion.should_migrate_only_data():
-        return set_sequence_value(conversion, table_name)
+        set_sequence_value(conversion, table_name)
+        return None
+
+    # Notice, all the clauses are applied by a single "ALTER TABLE", so the table is scanned only once.
+    alter_table(
+        conversion,
+        table_name,
+        get_enum_clauses(conversion, table_name)
+        + get_null_clauses(conversion, table_name)
+        + get_default_clauses(conversion, table_name),
+    )
 
-    process_enum(conversion, table_name)
-    process_null(conversion, table_name)
-    process_default(conversion, table_name)
     create_sequence(conversion, table_name)
-    create_indexes(conversion, table_name)
+
+    if conversion.should_load_into_unlogged_tables():
+        # Notice, the table is switched to LOGGED before its indexes are built,
+        # since SET LOGGED rewrites the table together with all its indexes.
+        set_logged(conversion, table_name)
+
+    # Notice, indexes are built in background, by the global index build scheduler.
+    indexes_built = create_indexes(conversion, table_name)
     process_comments(conversion, table_name)
+    return indexes_built
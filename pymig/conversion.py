@@ -16,12 +16,22 @@ __license__ = """
     If not, see <http://www.gnu.org/licenses/gpl.txt>.
 """
 import os
-from typing import cast, Optional, Any, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from typing import cast, Optional, Any, Callable, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
 
 from dbutils.pooled_db import PooledDB
 
 from pymig.table import Table
+from pymig.loader_transport import LoaderTransport
+from pymig.spool_mode import SpoolMode
+from pymig.metrics_export import MetricsExport
+from pymig.profiling_mode import ProfilingMode
+
+if TYPE_CHECKING:
+    from pymig.index_build_scheduler import IndexBuildScheduler
+    from pymig.catalog_snapshot import CatalogSnapshot
+    from pymig.task_graph import TaskGraph
 
 
 class Conversion:
@@ -54,6 +64,46 @@ class Conversion:
     delimiter: str
     debug: bool
     number_of_loader_processes: int
+    data_chunk_size: float
+    copy_format: str
+    loader_transport: LoaderTransport
+    shared_memory_slots_count: int
+    shared_memory_slot_size: int
+    batch_byte_budget: int
+    batch_target_latency: float
+    index_build_memory_budget: int
+    maintenance_work_mem: int
+    max_parallel_maintenance_workers: int
+    index_build_scheduler: Optional['IndexBuildScheduler']
+    load_into_unlogged_tables: bool
+    copy_freeze: bool
+    loader_priorities: dict[str, int]
+    spool_mode: SpoolMode
+    spool_dir: str
+    spool_compression: str
+    spool_segment_size: int
+    offline_source_dir: Optional[str]
+    offline_source_csv: dict[str, Any]
+    estimate_rows_count: bool
+    catalog_snapshot: Optional['CatalogSnapshot']
+    post_load_graph: Optional['TaskGraph']
+    foreign_keys_not_valid: bool
+    foreign_keys_validation_concurrency: int
+    foreign_keys_validation_semaphore: threading.BoundedSemaphore
+    foreign_keys_validation_times: dict[str, float]
+    sequence_initialization: str
+    quiet_console: bool
+    metrics_export: MetricsExport
+    metrics_export_interval: float
+    metrics_port: int
+    metrics_host: str
+    metrics_path: str
+    profiling_modes: set[ProfilingMode]
+    profiles_dir_path: str
+    trace: bool
+    traces_dir_path: str
+    trace_path: str
+    log_rotation_size: int
     index_types_map: dict[str, str]
     index_types_map_addr: str
     _thread_pool_executor: ThreadPoolExecutor
@@ -65,6 +115,16 @@ class Conversion:
         'views_to_migrate', 'data_pool', 'dic_tables', 'mysql_db_name', 'schema', 'max_each_db_connection_pool_size',
         'runs_in_test_mode', 'remove_test_resources', 'migrate_only_data', 'delimiter', 'debug',
         'number_of_loader_processes', '_thread_pool_executor', 'index_types_map', 'index_types_map_addr',
+        'data_chunk_size', 'copy_format', 'loader_transport', 'shared_memory_slots_count', 'shared_memory_slot_size',
+        'batch_byte_budget', 'batch_target_latency', 'index_build_memory_budget', 'maintenance_work_mem',
+        'max_parallel_maintenance_workers', 'index_build_scheduler', 'load_into_unlogged_tables',
+        'copy_freeze', 'loader_priorities', 'spool_mode', 'spool_dir', 'spool_compression', 'spool_segment_size',
+        'offline_source_dir', 'offline_source_csv', 'estimate_rows_count', 'catalog_snapshot',
+        'post_load_graph', 'foreign_keys_not_valid', 'foreign_keys_validation_concurrency',
+        'foreign_keys_validation_semaphore', 'foreign_keys_validation_times', 'sequence_initialization',
+        'quiet_console', 'log_rotation_size', 'metrics_export', 'metrics_export_interval', 'metrics_port',
+        'metrics_host', 'metrics_path', 'profiling_modes', 'profiles_dir_path', 'trace', 'traces_dir_path',
+        'trace_path',
     )
 
     def __init__(self, config: dict):
@@ -110,6 +170,121 @@ class Conversion:
         self.delimiter = self.config['delimiter'] if 'delimiter' in self.config else ','
         self.debug = self.config['debug'] if 'debug' in self.config else False
         self.number_of_loader_processes = self._parse_number_of_loader_processes()
+        self.data_chunk_size = float(self.config['data_chunk_size'] if 'data_chunk_size' in self.config else 1024)
+        self.copy_format = self.config['copy_format'].lower() if 'copy_format' in self.config else 'text'
+        self.loader_transport = LoaderTransport(self.config['loader_transport'].upper()
+                                                if 'loader_transport' in self.config
+                                                else LoaderTransport.DEFAULT)
+
+        self.shared_memory_slots_count = (self.config['shared_memory_slots_count']
+                                          if 'shared_memory_slots_count' in self.config
+                                          else 8)
+
+        # Notice, the "shared_memory_slot_size" config parameter is set in MB.
+        self.shared_memory_slot_size = 1024 * 1024 * (self.config['shared_memory_slot_size']
+                                                      if 'shared_memory_slot_size' in self.config
+                                                      else 4)
+
+        # Notice, the "batch_byte_budget" config parameter is set in MB.
+        self.batch_byte_budget = int(1024 * 1024 * (self.config['batch_byte_budget']
+                                                    if 'batch_byte_budget' in self.config
+                                                    else 8))
+
+        self.batch_target_latency = float(self.config['batch_target_latency']
+                                          if 'batch_target_latency' in self.config
+                                          else 2)
+
+        # Notice, both "index_build_memory_budget" and "maintenance_work_mem" config parameters are set in MB.
+        self.index_build_memory_budget = (self.config['index_build_memory_budget']
+                                          if 'index_build_memory_budget' in self.config
+                                          else 1024)
+
+        self.maintenance_work_mem = (self.config['maintenance_work_mem']
+                                     if 'maintenance_work_mem' in self.config
+                                     else 256)
+
+        self.max_parallel_maintenance_workers = (self.config['max_parallel_maintenance_workers']
+                                                 if 'max_parallel_maintenance_workers' in self.config
+                                                 else 2)
+
+        self.index_build_scheduler = None
+
+        self.load_into_unlogged_tables = (self.config['load_into_unlogged_tables']
+                                          if 'load_into_unlogged_tables' in self.config
+                                          else False)
+
+        self.copy_freeze = self.config['copy_freeze'] if 'copy_freeze' in self.config else False
+        self.loader_priorities = self.config['loader_priorities'] if 'loader_priorities' in self.config else {}
+        self.spool_mode = SpoolMode(self.config['spool_mode'].upper()
+                                    if 'spool_mode' in self.config
+                                    else SpoolMode.DISABLED)
+
+        self.spool_dir = (self.config['spool_dir']
+                          if self.config.get('spool_dir')
+                          else os.path.join(self.logs_dir_path, 'spool'))
+
+        self.spool_compression = (self.config['spool_compression'].lower()
+                                  if 'spool_compression' in self.config
+                                  else 'gzip')
+
+        # Notice, the "spool_segment_size" config parameter is set in MB.
+        self.spool_segment_size = 1024 * 1024 * (self.config['spool_segment_size']
+                                                 if 'spool_segment_size' in self.config
+                                                 else 256)
+
+        self.offline_source_dir = self.config['offline_source_dir'] if self.config.get('offline_source_dir') else None
+        self.offline_source_csv = {
+            'delimiter': ',',
+            'quote': '"',
+            'escape': '"',
+            'null': '',
+            'header': False,
+            **(self.config['offline_source_csv'] if 'offline_source_csv' in self.config else {}),
+        }
+
+        self.estimate_rows_count = self.config['estimate_rows_count'] if 'estimate_rows_count' in self.config else False
+        self.catalog_snapshot = None
+        self.post_load_graph = None
+        self.foreign_keys_not_valid = (self.config['foreign_keys_not_valid']
+                                       if 'foreign_keys_not_valid' in self.config
+                                       else False)
+
+        self.foreign_keys_validation_concurrency = max(1, self.config['foreign_keys_validation_concurrency']
+                                                       if 'foreign_keys_validation_concurrency' in self.config
+                                                       else 4)
+
+        self.foreign_keys_validation_semaphore = threading.BoundedSemaphore(self.foreign_keys_validation_concurrency)
+        self.foreign_keys_validation_times = {}
+        self.sequence_initialization = (self.config['sequence_initialization'].upper()
+                                        if 'sequence_initialization' in self.config
+                                        else 'MAX')
+
+        self.quiet_console = self.config['quiet_console'] if 'quiet_console' in self.config else False
+
+        # Notice, the "log_rotation_size" config parameter is set in MB.
+        self.log_rotation_size = 1024 * 1024 * (self.config['log_rotation_size']
+                                                if 'log_rotation_size' in self.config
+                                                else 100)
+
+        self.metrics_export = MetricsExport(self.config['metrics_export'].upper()
+                                            if 'metrics_export' in self.config
+                                            else MetricsExport.JSON)
+
+        self.metrics_export_interval = (self.config['metrics_export_interval']
+                                        if 'metrics_export_interval' in self.config
+                                        else 10)
+
+        self.metrics_port = self.config['metrics_port'] if 'metrics_port' in self.config else 9464
+        self.metrics_host = self.config['metrics_host'] if 'metrics_host' in self.config else '127.0.0.1'
+        self.metrics_path = os.path.join(self.logs_dir_path, 'metrics.json')
+        self.profiling_modes = ({ProfilingMode(mode.upper()) for mode in self.config['profiling_modes']}
+                                if 'profiling_modes' in self.config
+                                else set())
+
+        self.profiles_dir_path = os.path.join(self.logs_dir_path, 'profiles')
+        self.trace = self.config['trace'] if 'trace' in self.config else False
+        self.traces_dir_path = os.path.join(self.logs_dir_path, 'trace')
+        self.trace_path = os.path.join(self.logs_dir_path, 'trace.json')
 
         # Notice, all the threads in this pool will execute io-bound tasks only (sending queries to dbs asynchronously).
         self._thread_pool_executor = ThreadPoolExecutor(max_workers=self.max_each_db_connection_pool_size)
@@ -167,8 +342,34 @@ class Conversion:
 
         return parallel_execution_result
 
+    def submit(self, func: Callable, *params: Any) -> Future:
+        """
+        Runs given function asynchronously, and returns its Future.
+        """
+        return self._thread_pool_executor.submit(func, *params)
+
     def should_migrate_only_data(self) -> bool:
         """
         Checks if there are actions to take other than data migration.
+        Notice, migration from the offline source is always data-only, since the source structure is not available.
+        """
+        return self.migrate_only_data or self.should_load_from_offline_source()
+
+    def should_load_from_offline_source(self) -> bool:
+        """
+        Checks if the data should be loaded from "mysqldump --tab" or CSV files, instead of MySQL server.
+        """
+        return self.offline_source_dir is not None
+
+    def should_query_source(self) -> bool:
+        """
+        Checks if MySQL server is used by current run.
+        Notice, neither the offline source, nor "LOAD" spool mode (the catalog is spooled by "DUMP" run) touch MySQL.
+        """
+        return not self.should_load_from_offline_source() and self.spool_mode != SpoolMode.LOAD
+
+    def should_load_into_unlogged_tables(self) -> bool:
+        """
+        Checks if tables should be created as UNLOGGED, and switched to LOGGED after data loading.
         """
-        return self.migrate_only_data
+        return self.load_into_unlogged_tables and not self.should_migrate_only_data()
@@ -16,7 +16,8 @@ __license__ = """
     If not, see <http://www.gnu.org/licenses/gpl.txt>.
 """
 import json
-from typing import cast, Any
+import math
+from typing import cast, Any, Optional
 
 import pymig.db_access as DBAccess
 import pymig.extra_config_processor as ExtraConfigProcessor
@@ -24,6 +25,8 @@ from pymig.db_vendor import DBVendor
 from pymig.fs_ops import log
 from pymig.columns_data_arranger import arrange_columns_data
 from pymig.conversion import Conversion
+from pymig.catalog_snapshot import get_catalog_snapshot
+from pymig.binary_copy_encoder import get_table_copy_format, get_column_types
 
 
 def prepare_data_chunks(
@@ -33,48 +36,192 @@ def prepare_data_chunks(
 ) -> None:
     """
     Prepares a list of tables metadata.
+    Large tables are split into several data-chunks by ranges of an integer key,
+    so that different loader processes can load the same table simultaneously.
+    Notice, in "estimate_rows_count" mode rows count is taken from the catalog snapshot,
+    so the table is not scanned by COUNT(1).
     """
     if have_data_chunks_processed:
         return
 
     log_path = conversion.dic_tables[table_name].table_log_path
     original_table_name = ExtraConfigProcessor.get_table_name(conversion, table_name, True)
+    table_columns = conversion.dic_tables[table_name].table_columns
+    copy_format = get_table_copy_format(conversion, table_name)
 
     select_field_list = arrange_columns_data(
-        table_columns=conversion.dic_tables[table_name].table_columns,
+        table_columns=table_columns,
         mysql_version=conversion.mysql_version,
         mysql_charset=conversion.source_con_string['charset'],
+        copy_format=copy_format,
     )
 
-    table_data_size = _get_size(conversion=conversion, original_table_name=original_table_name)
-    rows_cnt = _get_rows_cnt(conversion=conversion, original_table_name=original_table_name)
+    table_statistics = get_catalog_snapshot(conversion).get_table(original_table_name)
+    table_data_size = (float(table_statistics['size_in_mb'])
+                       if table_statistics.get('size_in_mb') is not None
+                       else _get_size(conversion=conversion, original_table_name=original_table_name))
+
+    is_rows_cnt_estimated = conversion.estimate_rows_count and table_statistics.get('rows_cnt') is not None
+    rows_cnt = (int(table_statistics['rows_cnt'])
+                if is_rows_cnt_estimated
+                else _get_rows_cnt(conversion=conversion, original_table_name=original_table_name))
+
+    split_column = _get_split_column(table_columns)
+    key_ranges = _get_key_ranges(
+        conversion=conversion,
+        original_table_name=original_table_name,
+        split_column=split_column,
+        table_data_size=table_data_size,
+    )
+
+    chunks_cnt = len(key_ranges)
+    estimated = ' (estimated)' if is_rows_cnt_estimated else ''
     msg = (f'[{prepare_data_chunks.__name__}] Total rows to insert into'
-           f' "{conversion.schema}"."{table_name}": {rows_cnt}')
+           f' "{conversion.schema}"."{table_name}": {rows_cnt}{estimated}, data-chunks: {chunks_cnt}')
 
     log(conversion, msg, log_path)
-    meta = {
-        'table_name': table_name,
-        'select_field_list': select_field_list,
-        'rows_cnt': rows_cnt,
-        'table_data_size': table_data_size,
-    }
+    metas = [
+        {
+            'table_name': table_name,
+            'select_field_list': select_field_list,
+            'rows_cnt': rows_cnt,
+            'is_rows_cnt_estimated': is_rows_cnt_estimated,
+            'table_data_size': table_data_size,
+            'copy_format': copy_format,
+            'column_types': get_column_types(conversion, table_name) if copy_format == 'binary' else [],
+            'split_column': split_column,
+            'split_column_index': _get_column_index(table_columns, split_column),
+            'range_start': range_start,
+            'range_end': range_end,
+            'chunk_id': chunk_id,
+            'chunks_cnt': chunks_cnt,
+        }
+        for chunk_id, (range_start, range_end) in enumerate(key_ranges)
+    ]
+
+    insert_data_chunks(conversion, metas)
 
+
+def insert_data_chunks(conversion: Conversion, metas: list[dict[str, Any]]) -> None:
+    """
+    Inserts given data-chunks metadata into the data-pool.
+    """
+    values = ','.join(['(%s)'] * len(metas))
     sql = (f'INSERT INTO "{conversion.schema}"."data_pool_{conversion.schema}{conversion.mysql_db_name}"("metadata")'
-           f' VALUES (%(meta)s);')
+           f' VALUES {values};')
 
     DBAccess.query(
         conversion=conversion,
-        caller=prepare_data_chunks.__name__,
+        caller=insert_data_chunks.__name__,
         sql=sql,
         vendor=DBVendor.PG,
         process_exit_on_error=True,
         should_return_client=False,
         client=None,
-        bindings={
-            'meta': json.dumps(meta)
-        }
+        bindings=tuple(json.dumps(meta) for meta in metas)
+    )
+
+
+def get_range_condition(
+    quoted_column_name: str,
+    range_start: Optional[int],
+    range_end: Optional[int]
+) -> str:
+    """
+    Returns a condition, that restricts given (already quoted) column to the data-chunk's key range.
+    Returns an empty string if the data-chunk covers the whole table.
+    Notice, range bounds are inclusive.
+    """
+    conditions = []
+
+    if range_start is not None:
+        conditions.append(f'{quoted_column_name} >= {range_start}')
+
+    if range_end is not None:
+        conditions.append(f'{quoted_column_name} <= {range_end}')
+
+    return ' AND '.join(conditions)
+
+
+def _get_split_column(table_columns: list[dict[str, Any]]) -> Optional[str]:
+    """
+    Returns a name of the column, that can be used to split given table into data-chunks.
+    It is either a single-column integer primary key, or a NOT NULL integer unique key.
+    Returns None if no such column found.
+    """
+    primary_key_columns = [column for column in table_columns if column['Key'] == 'PRI']
+
+    if len(primary_key_columns) == 1 and _is_integer(primary_key_columns[0]['Type']):
+        return cast(str, primary_key_columns[0]['Field'])
+
+    for column in table_columns:
+        if column['Key'] == 'UNI' and column['Null'].lower() == 'no' and _is_integer(column['Type']):
+            return cast(str, column['Field'])
+
+    return None
+
+
+def _get_column_index(table_columns: list[dict[str, Any]], column_name: Optional[str]) -> Optional[int]:
+    """
+    Returns a position of given column within the select field list.
+    """
+    if column_name is None:
+        return None
+
+    return [column['Field'] for column in table_columns].index(column_name)
+
+
+def _is_integer(data_type: str) -> bool:
+    """
+    Defines if given type is one of MySQL integer types.
+    """
+    base_type = data_type.split('(')[0].split(' ')[0].lower()
+    return base_type in ('tinyint', 'smallint', 'mediumint', 'int', 'integer', 'bigint')
+
+
+def _get_key_ranges(
+    conversion: Conversion,
+    original_table_name: str,
+    split_column: Optional[str],
+    table_data_size: float
+) -> list[tuple[Optional[int], Optional[int]]]:
+    """
+    Returns a list of inclusive key ranges, one per data-chunk.
+    Notice, the first and the last ranges are open-ended, so no record can be left behind.
+    """
+    whole_table: list[tuple[Optional[int], Optional[int]]] = [(None, None)]
+
+    if split_column is None or conversion.data_chunk_size <= 0 or table_data_size <= conversion.data_chunk_size:
+        return whole_table
+
+    result = DBAccess.query(
+        conversion=conversion,
+        caller=_get_key_ranges.__name__,
+        sql=(f'SELECT MIN(`{split_column}`) AS min_value, MAX(`{split_column}`) AS max_value'
+             f' FROM `{original_table_name}`;'),
+        vendor=DBVendor.MYSQL,
+        process_exit_on_error=False,
+        should_return_client=False
     )
 
+    if result.error or not result.data or result.data[0]['min_value'] is None:
+        return whole_table
+
+    min_value, max_value = int(result.data[0]['min_value']), int(result.data[0]['max_value'])
+    keys_span = max_value - min_value + 1
+    chunks_cnt = min(math.ceil(table_data_size / conversion.data_chunk_size), keys_span)
+    step = math.ceil(keys_span / chunks_cnt)
+    key_ranges: list[tuple[Optional[int], Optional[int]]] = []
+
+    for range_start in range(min_value, max_value + 1, step):
+        range_end = range_start + step - 1
+        key_ranges.append((
+            None if range_start == min_value else range_start,
+            None if range_end >= max_value else range_end,
+        ))
+
+    return key_ranges
+
 
 def _get_rows_cnt(conversion: Conversion, original_table_name: str) -> int:
     """
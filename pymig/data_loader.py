@@ -16,23 +16,66 @@ __license__ = """
     If not, see <http://www.gnu.org/licenses/gpl.txt>.
 """
 import io
-from typing import Optional, Any, cast
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import sys
+import time
+import multiprocessing
+from functools import partial
+from multiprocessing.util import Finalize
+from typing import Optional, Any, Union, Callable, cast
+from concurrent.futures import ProcessPoolExecutor, Future, as_completed
 
+from psycopg2.extensions import (
+    encodings as pg_encodings,
+    connection as PgConnection,
+    cursor as PgCursor,
+    STATUS_READY,
+)
 from dbutils.pooled_db import PooledDedicatedDBConnection
 
 import pymig.db_access as DBAccess
 import pymig.migration_state_manager as MigrationStateManager
 import pymig.extra_config_processor as ExtraConfigProcessor
+import pymig.metrics as Metrics
 from pymig.db_vendor import DBVendor
 from pymig.fs_ops import log, generate_error
 from pymig.conversion import Conversion
-from pymig.constraints_processor import process_constraints_per_table
+from pymig.constraints_processor import schedule_constraints
+from pymig.data_pool_scheduler import schedule_data_pool
 from pymig.utils import track_memory, get_cpu_count
-from pymig.mysql_data_processor import process_mysql_data
+from pymig.mysql_data_processor import process_mysql_data, process_mysql_data_to_string
+from pymig.mysql_stream_reader import MySQLStreamReader
+from pymig.loader_transport import LoaderTransport
+from pymig.spool_mode import SpoolMode
+from pymig.log_pipeline import attach_log_pipeline, get_log_queue
+from pymig.metrics import attach_metrics, get_metrics_queue
+from pymig.profiler import record_timing, profile_process
+from pymig.tracer import traced, trace_span, add_span
+from pymig.offline_source import OffsetRangeReader, READ_SIZE as OFFLINE_SOURCE_READ_SIZE
+from pymig.spool import SpoolWriter, READ_SIZE as SPOOL_READ_SIZE, get_spool_dir, is_dumped, get_segments, open_segment
+from pymig.shared_memory_ring_buffer import SharedMemoryRingBuffer
+from pymig.batch_sizer import BatchSizer
+from pymig.data_chunks_processor import get_range_condition
+from pymig.binary_copy_encoder import (
+    COPY_BINARY_HEADER,
+    COPY_BINARY_TRAILER,
+    get_encoders,
+    get_mysql_converters,
+    process_mysql_data_binary,
+    encode_binary_rows,
+)
+
+# Notice, following variables are set by "_init_writer_session", and used only within write-worker processes.
+# Each write-worker keeps a single PostgreSQL session throughout its lifetime.
+_writer_conversion: Optional[Conversion] = None
+_writer_client: Optional[PgConnection] = None
+
+# Is set when a batch fails.
+# The rest of the data-chunk's batches are skipped, so the data-chunk can be resumed (or reloaded) from this point.
+_writer_chunk_failed = False
 
 
 @track_memory
+@traced('stage')
 def send_data(conversion: Conversion) -> None:
     """
     Sends the data to the loader processes.
@@ -40,11 +83,6 @@ def send_data(conversion: Conversion) -> None:
     if len(conversion.data_pool) == 0:
         return
 
-    params_list: list[list[dict[str, Any]]] = [
-        [conversion.config, meta]
-        for meta in conversion.data_pool
-    ]
-
     number_of_workers = min(
         conversion.max_each_db_connection_pool_size,
         len(conversion.data_pool),
@@ -52,17 +90,84 @@ def send_data(conversion: Conversion) -> None:
         conversion.number_of_loader_processes,
     )
 
-    with ProcessPoolExecutor(max_workers=number_of_workers) as executor:
-        futures = [executor.submit(_load, *params) for params in params_list]
+    params_list: list[list[dict[str, Any]]] = [
+        [conversion.config, meta]
+        for meta in schedule_data_pool(conversion, number_of_workers)
+    ]
+
+    # Large tables are split into several data-chunks.
+    # Table's constraints must be processed only after the last data-chunk of this table is loaded.
+    chunks_left: dict[str, int] = {}
+
+    for meta in conversion.data_pool:
+        chunks_left[meta['table_name']] = chunks_left.get(meta['table_name'], 0) + 1
+
+    Metrics.set_gauge('', 'loader_processes', number_of_workers)
+
+    for table_name, table_chunks_cnt in chunks_left.items():
+        Metrics.set_gauge(table_name, 'data_chunks_pending', table_chunks_cnt)
+
+    # Notice, in "DUMP" spool mode the data is loaded into target tables by a subsequent run in "LOAD" spool mode.
+    tables_loaded = (schedule_constraints(conversion, set(chunks_left))
+                     if conversion.spool_mode != SpoolMode.DUMP
+                     else {})
+
+    # Loader processes send their log records and metric events to the main process.
+    with ProcessPoolExecutor(
+        max_workers=number_of_workers,
+        initializer=_init_loader_process,
+        initargs=(get_log_queue(), get_metrics_queue()),
+    ) as executor:
+        futures = {executor.submit(_load, *params): params[1]['table_name'] for params in params_list}
+        failed_tables: set[str] = set()
 
         for future in as_completed(futures):
+            just_populated_table_name = futures[future]
+
             try:
-                just_populated_table_name = future.result()
-                process_constraints_per_table(conversion, just_populated_table_name)
+                future.result()
             except Exception as e:
                 generate_error(conversion, repr(e))
+                failed_tables.add(just_populated_table_name)
+
+            chunks_left[just_populated_table_name] -= 1
+            Metrics.set_gauge(just_populated_table_name, 'data_chunks_pending', chunks_left[just_populated_table_name])
+
+            if chunks_left[just_populated_table_name] == 0 and just_populated_table_name in tables_loaded:
+                _resolve_table_loaded(
+                    conversion,
+                    just_populated_table_name,
+                    tables_loaded[just_populated_table_name],
+                    just_populated_table_name in failed_tables,
+                )
+
+
+def _resolve_table_loaded(conversion: Conversion, table_name: str, table_loaded: Future, has_failed: bool) -> None:
+    """
+    Resolves given table's Future, once all its data-chunks are processed.
+    The table's constraints, indexes, and then foreign keys are processed in background.
+    Notice, errors of loader processes are mostly reported, rather than raised,
+    so the table is considered loaded only if the progress-ledger marks all its data-chunks as completed.
+    Otherwise, the Future is failed, and the table is processed by the next run, which resumes the loading.
+    """
+    if not has_failed and MigrationStateManager.get_incomplete_data_chunks_cnt(conversion, table_name) == 0:
+        table_loaded.set_result(table_name)
+        return
+
+    msg = (f'[{_resolve_table_loaded.__name__}] "{conversion.schema}"."{table_name}" is not loaded entirely.'
+           f' Its constraints, indexes and foreign keys will be processed by the next run')
 
-    MigrationStateManager.set(conversion, 'per_table_constraints_loaded')
+    generate_error(conversion, msg)
+    table_loaded.set_exception(RuntimeError(msg))
+
+
+def _init_loader_process(log_queue: Optional[Any], metrics_queue: Optional[Any]) -> None:
+    """
+    Initializes the loader process.
+    Notice, this function runs in separate process.
+    """
+    attach_log_pipeline(log_queue)
+    attach_metrics(metrics_queue)
 
 
 def _load(config: dict, data_pool_item: dict) -> str:
@@ -71,23 +176,138 @@ def _load(config: dict, data_pool_item: dict) -> str:
     Notice, this function runs in separate process.
     """
     conversion = Conversion(config)
+    Metrics.add_to_gauge('', 'loader_processes_busy', 1)
+    span_name = f'load "{data_pool_item["table_name"]}" #{data_pool_item["chunk_id"] + 1}'
+
+    try:
+        with trace_span(conversion, span_name, 'table', {'data_pool_id': data_pool_item['_id']}):
+            return _load_data_chunk(conversion, data_pool_item)
+    finally:
+        Metrics.add_to_gauge('', 'loader_processes_busy', -1)
+
+
+def _load_data_chunk(conversion: Conversion, data_pool_item: dict) -> str:
+    """
+    Loads given data-chunk, using the transport, defined by current configuration.
+    """
     table_name = data_pool_item['table_name']
-    msg = f'[{_load.__name__}] Loading the data into "{conversion.schema}"."{table_name}" table...'
+    data_pool_id = data_pool_item['_id']
+    msg = (f'[{_load_data_chunk.__name__}] Loading the data into "{conversion.schema}"."{table_name}" table'
+           f' (data-chunk {data_pool_item["chunk_id"] + 1} of {data_pool_item["chunks_cnt"]})...')
+
     log(conversion, msg)
-    is_recovery_mode = data_transferred(conversion, data_pool_item['_id'])
 
-    if is_recovery_mode:
-        pg_client = DBAccess.get_db_client(conversion, DBVendor.PG)
-        delete_data_pool_item(conversion, data_pool_item['_id'], pg_client)
-        return cast(str, data_pool_item['table_name'])
+    if conversion.should_load_from_offline_source():
+        return _load_from_offline_source(conversion, data_pool_item)
+
+    if conversion.spool_mode == SpoolMode.LOAD:
+        return _load_from_spool(conversion, data_pool_item)
+
+    if conversion.spool_mode == SpoolMode.DUMP and is_dumped(get_spool_dir(conversion, data_pool_id)):
+        log(conversion, f'[{_load_data_chunk.__name__}] Data-chunk #{data_pool_id} of "{table_name}" is already dumped')
+        return cast(str, table_name)
+
+    progress = (MigrationStateManager.get_data_chunk_progress(conversion, data_pool_id)
+                if conversion.spool_mode != SpoolMode.DUMP
+                else None)
+
+    range_start = data_pool_item['range_start']
+
+    if progress is not None and progress['is_completed']:
+        # The data-chunk had been loaded entirely, before the migration was interrupted.
+        if not conversion.should_load_into_unlogged_tables():
+            delete_data_pool_item(conversion, data_pool_id)
 
-    return cast(str, populate_table_worker(
+        return cast(str, table_name)
+
+    if progress is not None:
+        if progress['high_water_mark'] is not None:
+            # Notice, all rows up to the high-water mark are committed, so the loading resumes right after it.
+            range_start = progress['high_water_mark'] + 1
+            msg = (f'[{_load_data_chunk.__name__}] Resuming "{conversion.schema}"."{table_name}"'
+                   f' data-chunk #{data_pool_id}'
+                   f' after {data_pool_item["split_column"]} = {progress["high_water_mark"]}'
+                   f' ({progress["rows_loaded"]} rows are already loaded)')
+
+            log(conversion, msg)
+        elif not _restart_data_chunk(conversion, data_pool_item):
+            return cast(str, table_name)
+
+    populated_table_name = populate_table_worker(
         conversion=conversion,
-        table_name=data_pool_item['table_name'],
+        table_name=table_name,
         select_field_list=data_pool_item['select_field_list'],
         rows_cnt=data_pool_item['rows_cnt'],
-        data_pool_id=data_pool_item['_id'],
-    ))
+        table_data_size=data_pool_item['table_data_size'],
+        data_pool_id=data_pool_id,
+        copy_format=data_pool_item['copy_format'],
+        column_types=data_pool_item['column_types'],
+        range_condition=get_range_condition(
+            quoted_column_name=f'`{data_pool_item["split_column"]}`',
+            range_start=range_start,
+            range_end=data_pool_item['range_end'],
+        ),
+        # Notice, COPY FREEZE truncates the table, so it is used only if no rows are loaded by previous runs.
+        freeze=(conversion.copy_freeze
+                and conversion.spool_mode != SpoolMode.DUMP
+                and not conversion.should_migrate_only_data()
+                and data_pool_item['chunks_cnt'] == 1
+                and progress is None),
+        split_column=data_pool_item['split_column'],
+        split_column_index=data_pool_item['split_column_index'],
+    )
+
+    if data_pool_item.get('is_rows_cnt_estimated') and conversion.spool_mode != SpoolMode.DUMP:
+        # Notice, exact rows count is known only once the data-chunk is loaded, see the progress-ledger.
+        _log_loaded_rows_cnt(conversion, data_pool_item)
+
+    return cast(str, populated_table_name)
+
+
+def _restart_data_chunk(conversion: Conversion, data_pool_item: dict) -> bool:
+    """
+    Removes partially loaded data of given data-chunk, which cannot be resumed, since it has no split key.
+    Such data-chunk always covers the whole table, so the table is truncated.
+    Returns False if the data cannot be removed safely.
+    """
+    table_name = data_pool_item['table_name']
+
+    if conversion.should_migrate_only_data() or data_pool_item['chunks_cnt'] != 1:
+        # In "migrate_only_data" mode the table may contain the data, which was not loaded by the migration.
+        msg = (f'[{_restart_data_chunk.__name__}] "{conversion.schema}"."{table_name}" is loaded partially,'
+               f' and cannot be resumed. Please, clean the table manually, and rerun the migration.')
+
+        generate_error(conversion, msg)
+        return False
+
+    DBAccess.query(
+        conversion=conversion,
+        caller=_restart_data_chunk.__name__,
+        sql=_get_truncate_sql(conversion, table_name),
+        vendor=DBVendor.PG,
+        process_exit_on_error=True,
+        should_return_client=False
+    )
+
+    MigrationStateManager.reset_data_chunk_progress(conversion, data_pool_item['_id'])
+    log(conversion, f'[{_restart_data_chunk.__name__}] Restarting "{conversion.schema}"."{table_name}" loading')
+    return True
+
+
+def _log_loaded_rows_cnt(conversion: Conversion, data_pool_item: dict) -> None:
+    """
+    Logs exact rows count of given data-chunk, loaded so far, along with its estimated rows count.
+    """
+    progress = MigrationStateManager.get_data_chunk_progress(conversion, data_pool_item['_id'])
+
+    if progress is None:
+        return
+
+    msg = (f'[{_log_loaded_rows_cnt.__name__}] Rows loaded into "{conversion.schema}"."{data_pool_item["table_name"]}"'
+           f' (data-chunk #{data_pool_item["_id"]}): {progress["rows_loaded"]},'
+           f' estimated rows count of the table: {data_pool_item["rows_cnt"]}')
+
+    log(conversion, msg)
 
 
 @track_memory
@@ -96,132 +316,716 @@ def populate_table_worker(
     table_name: str,
     select_field_list: str,
     rows_cnt: int,
+    table_data_size: float,
     data_pool_id: int,
+    copy_format: str = 'text',
+    column_types: Optional[list[str]] = None,
+    range_condition: str = '',
+    freeze: bool = False,
+    split_column: Optional[str] = None,
+    split_column_index: Optional[int] = None,
 ) -> str:
     """
-    Inserts given table's data using "PostgreSQL COPY".
+    Inserts given table's data (or a key range of it) using "PostgreSQL COPY".
+    If "freeze" is set, the table is truncated and loaded using "COPY ... FREEZE" within a single transaction.
+    Notice, "freeze" is allowed only if the data-chunk covers the whole table.
     Returns a name of just loaded table.
     """
     original_table_name = ExtraConfigProcessor.get_table_name(conversion, table_name, True)
-    sql = f'SELECT {select_field_list} FROM `{original_table_name}`;'
-    original_session_replication_role = None
-    text_stream: Optional[io.StringIO] = None
-    pg_cursor, pg_client, mysql_client, mysql_cursor = None, None, None, None
+    where_clause = f' WHERE {range_condition}' if range_condition else ''
+
+    # When batches are committed separately, rows are retrieved in the split key order,
+    # so that the loading can be resumed from the last committed key (the high-water mark).
+    # Other load paths load the whole data-chunk within a single transaction, hence need no ordering.
+    tracks_high_water_mark = (split_column is not None
+                              and conversion.spool_mode != SpoolMode.DUMP
+                              and conversion.loader_transport == LoaderTransport.DEFAULT
+                              and not freeze)
+
+    order_by_clause = f' ORDER BY `{split_column}`' if tracks_high_water_mark else ''
+    sql = f'SELECT {select_field_list} FROM `{original_table_name}`{where_clause}{order_by_clause};'
+    mysql_client, mysql_cursor = None, None
+    encoders = (get_encoders(column_types or [], pg_encodings[conversion.target_con_string['charset'].upper()])
+                if copy_format == 'binary'
+                else None)
+
+    batch_sizer = BatchSizer(
+        byte_budget=conversion.batch_byte_budget,
+        target_latency=conversion.batch_target_latency,
+        table_data_size=table_data_size,
+        rows_cnt=rows_cnt,
+    )
 
     try:
-        mysql_client = DBAccess.get_mysql_unbuffered_client(conversion)
+        mysql_client = DBAccess.get_mysql_unbuffered_client(
+            conversion=conversion,
+            conv=get_mysql_converters() if encoders is not None else None,
+        )
+
         mysql_cursor = mysql_client.cursor()
         mysql_cursor.execute(sql)  # Notice, no significant memory allocations happen until mysql_cursor.fetchmany call.
-        number_of_inserted_rows = 0
-
-        # Notice:
-        # 1.
-        # We get maximal performance boost with only one write-worker.
-        # 2.
-        # This way first process (reader-process) constantly retrieves data from source db
-        # and submits it to the second process (writer-process or write-worker), which inserts the data into target db.
-        # 3.
-        # Retrieval rate of the reader-process is roughly equal to insertion rate of the writer-process (write-worker),
-        # hence only a small amount of data is buffered in executor's "Call Queue".
-        # It allows to keep memory consumption low.
-        # 4.
-        # !!!No need to increase number of write-workers, since write-worker always writes data to the same table,
-        # which means it writes data to the same location on disk,
-        # which means when one write-worker writes data - other write-workers wait.
-        # While other write-workers wait, reader-process continues submitting data from source db.
-        # This data is buffered in executor's "Call Queue" - hence memory consumption gets higher without
-        # significant performance increase.
-        with ProcessPoolExecutor(max_workers=1) as executor:
-            batch_size = 30000
-            buffered_batches = 0
-            max_buffered_batches = 3
-
-            while True:
-                # Notice:
-                # 1. Additional memory allocation happens below.
-                # 2. This "while True" loop DOES NOT aggregate memory, so memory consumption level remains steady.
-                # 3. The data retrieved by "mysql_cursor.fetchmany" is eventually copied to the write-worker.
-                # 4. Batch size of 30000 rows seems reasonable for maximal speed without memory spikes.
-                # 5. !!!Significant increase of batch size DOES NOT lead to noticeable performance improvement.
-                batch: tuple[tuple[str, ...], ...] = mysql_cursor.fetchmany(batch_size)
-                buffered_batches += 1
-                rows_to_insert = len(batch)
-
-                if rows_to_insert == 0:
-                    # No more records to insert.
-                    break
-
-                text_stream = process_mysql_data(batch)
-
-                _arrange_and_load_batch_params = [
-                    conversion.config,
-                    table_name,
-                    text_stream,
-                    rows_cnt,
-                    rows_to_insert,
-                    number_of_inserted_rows,
-                ]
-
-                future = executor.submit(_arrange_and_load_batch, *_arrange_and_load_batch_params)  # type: ignore
-
-                # !!!Below, use only "is None" comparison, and not "if not..."
-                # _arrange_and_load_batch always returns string (which may be empty),
-                # while the original value of "original_session_replication_role" is None.
-                # This way it is possible to distinguish between the first batch and the rest.
-                if original_session_replication_role is None or buffered_batches > max_buffered_batches:
-                    for completed_future in as_completed([future]):
-                        try:
-                            original_session_replication_role = completed_future.result()
-                        except Exception as ex:
-                            generate_error(conversion, repr(ex))
-                        finally:
-                            buffered_batches -= 1
+
+        if conversion.spool_mode == SpoolMode.DUMP:
+            _dump_data(conversion, table_name, data_pool_id, mysql_cursor, encoders, batch_sizer)
+        elif conversion.loader_transport == LoaderTransport.STREAM:
+            _stream_data(conversion, table_name, data_pool_id, mysql_cursor, encoders, rows_cnt, batch_sizer, freeze)
+        elif conversion.loader_transport == LoaderTransport.SHARED_MEMORY:
+            _transfer_via_shared_memory(
+                conversion=conversion,
+                table_name=table_name,
+                data_pool_id=data_pool_id,
+                mysql_cursor=mysql_cursor,
+                encoders=encoders,
+                rows_cnt=rows_cnt,
+                batch_sizer=batch_sizer,
+                freeze=freeze,
+            )
+        else:
+            _load_in_batches(
+                conversion=conversion,
+                table_name=table_name,
+                data_pool_id=data_pool_id,
+                mysql_cursor=mysql_cursor,
+                encoders=encoders,
+                rows_cnt=rows_cnt,
+                batch_sizer=batch_sizer,
+                freeze=freeze,
+                split_column_index=split_column_index if tracks_high_water_mark else None,
+            )
     except Exception as e:
         msg = 'Data retrieved by following MySQL query has been rejected by the target PostgreSQL server.'
         error_message = f'[{populate_table_worker.__name__}] {e}\n\t--[{populate_table_worker.__name__}] {msg}'
         generate_error(conversion, error_message, sql)
     finally:
-        for resource in (text_stream, pg_cursor, mysql_cursor, mysql_client):
+        for resource in (mysql_cursor, mysql_client):
             if resource:
                 resource.close()
 
-        delete_data_pool_item(
-            conversion=conversion,
-            data_pool_id=data_pool_id,
-            pg_client=cast(PooledDedicatedDBConnection, pg_client),
-            original_session_replication_role=original_session_replication_role,
-        )
+        if _should_delete_data_pool_item(conversion, data_pool_id):
+            delete_data_pool_item(conversion, data_pool_id)
 
         return table_name
 
 
-def _arrange_and_load_batch(
+def _load_from_offline_source(conversion: Conversion, data_pool_item: dict) -> str:
+    """
+    Loads given data-chunk (a byte range of a source file) within a single transaction.
+    The data-chunk is marked as completed within the same transaction,
+    so an interrupted data-chunk is simply reloaded on the next run.
+    """
+    table_name = data_pool_item['table_name']
+    data_pool_id = data_pool_item['_id']
+    progress = MigrationStateManager.get_data_chunk_progress(conversion, data_pool_id)
+
+    if progress is None or not progress['is_completed']:
+        sql_copy = _get_copy_sql(conversion, table_name, data_pool_item['copy_format'])
+        pg_client = open_writer_session(conversion)
+
+        try:
+            with OffsetRangeReader(
+                path=data_pool_item['source_file'],
+                start=data_pool_item['source_range_start'],
+                end=data_pool_item['source_range_end'],
+            ) as reader:
+                pg_cursor = pg_client.cursor()
+                copy_started_at = time.perf_counter()
+                # Notice, copy_expert uses only the "read" method of given file-like object.
+                pg_cursor.copy_expert(sql=sql_copy, file=reader, size=OFFLINE_SOURCE_READ_SIZE)  # type: ignore
+                rows_loaded = pg_cursor.rowcount
+                _record_progress(pg_cursor, conversion, data_pool_id, rows_loaded, is_completed=True)
+                pg_client.commit()  # type: ignore
+                pg_cursor.close()  # type: ignore
+
+            Metrics.observe(table_name, 'copy_seconds', time.perf_counter() - copy_started_at)
+            Metrics.increment(table_name, 'rows_loaded_total', rows_loaded)
+            Metrics.increment(table_name, 'bytes_transferred_total',
+                              data_pool_item['source_range_end'] - data_pool_item['source_range_start'])
+
+            msg = (f'[{_load_from_offline_source.__name__}] Loaded {rows_loaded} rows'
+                   f' into "{conversion.schema}"."{table_name}" (data-chunk #{data_pool_id})')
+
+            log(conversion, msg)
+        except Exception as e:
+            pg_client.rollback()  # type: ignore
+            generate_error(conversion, f'[{_load_from_offline_source.__name__}] {type(e).__name__} {repr(e)}', sql_copy)
+        finally:
+            pg_client.close()  # type: ignore
+
+    if _should_delete_data_pool_item(conversion, data_pool_id):
+        delete_data_pool_item(conversion, data_pool_id)
+
+    return cast(str, table_name)
+
+
+def _should_delete_data_pool_item(conversion: Conversion, data_pool_id: int) -> bool:
+    """
+    Checks if given data-chunk can be removed from the data-pool, after an attempt to load it.
+    The data-chunk is kept:
+    1. If it is not loaded entirely, so it will be resumed on the next run.
+    2. In "load_into_unlogged_tables" mode, until the table is switched to LOGGED.
+    3. In "DUMP" spool mode, until it is loaded from the spool.
+    """
+    if conversion.spool_mode == SpoolMode.DUMP or conversion.should_load_into_unlogged_tables():
+        return False
+
+    progress = MigrationStateManager.get_data_chunk_progress(conversion, data_pool_id)
+    return progress is not None and bool(progress['is_completed'])
+
+
+def _dump_data(
+    conversion: Conversion,
+    table_name: str,
+    data_pool_id: int,
+    mysql_cursor: Any,
+    encoders: Optional[list[Callable[[Any], bytes]]],
+    batch_sizer: BatchSizer
+) -> None:
+    """
+    Retrieves the data from unbuffered MySQL cursor,
+    and writes it into compressed spool segments, formatted for "PostgreSQL COPY".
+    The segments are loaded by a subsequent run in "LOAD" spool mode, see "_load_from_spool".
+    """
+    if encoders is not None:
+        encode: Callable[[Any], bytes] = partial(encode_binary_rows, encoders=encoders)
+        header, trailer = COPY_BINARY_HEADER, COPY_BINARY_TRAILER
+    else:
+        encode = partial(_encode_text_payload, encoding=pg_encodings[conversion.target_con_string['charset'].upper()])
+        header, trailer = b'', b''
+
+    spool_writer = SpoolWriter(
+        spool_dir=get_spool_dir(conversion, data_pool_id),
+        compression=conversion.spool_compression,
+        segment_size=conversion.spool_segment_size,
+        header=header,
+        trailer=trailer,
+    )
+
+    while True:
+        fetch_started_at = time.perf_counter()
+        batch = mysql_cursor.fetchmany(batch_sizer.batch_size)
+        Metrics.observe(table_name, 'batch_fetch_seconds', time.perf_counter() - fetch_started_at)
+
+        if not batch:
+            break
+
+        encode_started_at = time.perf_counter()
+        payload = encode(batch)
+        Metrics.observe(table_name, 'batch_encode_seconds', time.perf_counter() - encode_started_at)
+        batch_sizer.observe_batch(len(batch), len(payload))
+        spool_writer.write(payload, len(batch))
+        Metrics.increment(table_name, 'rows_loaded_total', len(batch))
+        Metrics.increment(table_name, 'bytes_transferred_total', len(payload))
+
+    spool_writer.close()
+    msg = (f'[{_dump_data.__name__}] Dumped {spool_writer.rows_written} rows of "{table_name}"'
+           f' (data-chunk #{data_pool_id}) into {spool_writer.segments_cnt} spool segments')
+
+    log(conversion, msg)
+
+
+def _load_from_spool(conversion: Conversion, data_pool_item: dict) -> str:
+    """
+    Loads given data-chunk from its spool segments, one segment per transaction.
+    Id of the last loaded segment is recorded in the progress-ledger (as the high-water mark)
+    within the same transaction, so the loading is resumed from the next segment.
+    """
+    table_name = data_pool_item['table_name']
+    data_pool_id = data_pool_item['_id']
+    spool_dir = get_spool_dir(conversion, data_pool_id)
+
+    if not is_dumped(spool_dir):
+        msg = (f'[{_load_from_spool.__name__}] Data-chunk #{data_pool_id} of "{table_name}" is not dumped.'
+               f' Please, run the migration in "DUMP" spool mode first.')
+
+        generate_error(conversion, msg)
+        return cast(str, table_name)
+
+    progress = MigrationStateManager.get_data_chunk_progress(conversion, data_pool_id)
+    last_loaded_segment_id = progress['high_water_mark'] if progress and progress['high_water_mark'] else 0
+    sql_copy = _get_copy_sql(conversion, table_name, data_pool_item['copy_format'])
+    pg_client = open_writer_session(conversion)
+
+    try:
+        if progress is None or not progress['is_completed']:
+            for segment_id, segment_path in get_segments(spool_dir):
+                if segment_id <= last_loaded_segment_id:
+                    continue
+
+                with open_segment(segment_path) as segment:
+                    pg_cursor = pg_client.cursor()
+                    copy_started_at = time.perf_counter()
+                    pg_cursor.copy_expert(sql=sql_copy, file=segment, size=SPOOL_READ_SIZE)  # type: ignore
+                    rows_loaded = pg_cursor.rowcount
+                    _record_progress(pg_cursor, conversion, data_pool_id, rows_loaded, segment_id)
+                    pg_client.commit()  # type: ignore
+                    pg_cursor.close()  # type: ignore
+
+                Metrics.observe(table_name, 'copy_seconds', time.perf_counter() - copy_started_at)
+                Metrics.increment(table_name, 'rows_loaded_total', rows_loaded)
+
+                msg = (f'[{_load_from_spool.__name__}] Loaded spool segment #{segment_id}'
+                       f' of "{conversion.schema}"."{table_name}" (data-chunk #{data_pool_id})')
+
+                log(conversion, msg)
+
+            pg_cursor = pg_client.cursor()
+            _record_progress(pg_cursor, conversion, data_pool_id, 0, is_completed=True)
+            pg_client.commit()  # type: ignore
+            pg_cursor.close()  # type: ignore
+    except Exception as e:
+        pg_client.rollback()  # type: ignore
+        generate_error(conversion, f'[{_load_from_spool.__name__}] {type(e).__name__} {repr(e)}', sql_copy)
+    finally:
+        pg_client.close()  # type: ignore
+
+    if _should_delete_data_pool_item(conversion, data_pool_id):
+        delete_data_pool_item(conversion, data_pool_id)
+
+    return cast(str, table_name)
+
+
+def _load_in_batches(
+    conversion: Conversion,
+    table_name: str,
+    data_pool_id: int,
+    mysql_cursor: Any,
+    encoders: Optional[list[Callable[[Any], bytes]]],
+    rows_cnt: int,
+    batch_sizer: BatchSizer,
+    freeze: bool,
+    split_column_index: Optional[int]
+) -> None:
+    """
+    Retrieves the data from unbuffered MySQL cursor in batches,
+    and submits each batch to the write-worker, which loads it using "PostgreSQL COPY".
+    Batch size is defined by given BatchSizer, which is fed with each batch's size and COPY duration.
+    Each batch is committed separately, unless "freeze" is set.
+    In the latter case, all batches are loaded within a single transaction, which is committed at the end.
+    If "split_column_index" is set, the split key of each batch's last row is recorded as the high-water mark.
+    """
+    number_of_inserted_rows = 0
+
+    # Notice:
+    # 1.
+    # We get maximal performance boost with only one write-worker.
+    # 2.
+    # This way first process (reader-process) constantly retrieves data from source db
+    # and submits it to the second process (writer-process or write-worker), which inserts the data into target db.
+    # 3.
+    # Retrieval rate of the reader-process is roughly equal to insertion rate of the writer-process (write-worker),
+    # hence only a small amount of data is buffered in executor's "Call Queue".
+    # It allows to keep memory consumption low.
+    # 4.
+    # !!!No need to increase number of write-workers, since write-worker always writes data to the same table,
+    # which means it writes data to the same location on disk,
+    # which means when one write-worker writes data - other write-workers wait.
+    # While other write-workers wait, reader-process continues submitting data from source db.
+    # This data is buffered in executor's "Call Queue" - hence memory consumption gets higher without
+    # significant performance increase.
+    # 5.
+    # The write-worker opens its PostgreSQL session once (see "_init_writer_session"),
+    # and reuses it for all batches of current data-chunk.
+    with ProcessPoolExecutor(
+        max_workers=1,
+        initializer=_init_writer_session,
+        initargs=(conversion.config, get_log_queue(), get_metrics_queue()),
+    ) as executor:
+        batch_id = 0
+        buffered_batches = 0
+        max_buffered_batches = 3
+
+        while True:
+            # Notice:
+            # 1. Additional memory allocation happens below.
+            # 2. This "while True" loop DOES NOT aggregate memory, so memory consumption level remains steady.
+            # 3. The data retrieved by "mysql_cursor.fetchmany" is eventually copied to the write-worker.
+            # 4. Batch size is derived from a byte budget, so wide rows do not lead to memory spikes.
+            # 5. !!!Significant increase of batch size DOES NOT lead to noticeable performance improvement.
+            batch_id += 1
+            span_args = {'table_name': table_name, 'batch_id': batch_id}
+            fetch_started_at = time.perf_counter()
+
+            with trace_span(conversion, 'fetch', 'batch', span_args):
+                batch: tuple[tuple[str, ...], ...] = mysql_cursor.fetchmany(batch_sizer.batch_size)
+
+            fetch_latency = time.perf_counter() - fetch_started_at
+            Metrics.observe(table_name, 'batch_fetch_seconds', fetch_latency)
+            record_timing(conversion, table_name, batch_id, 'fetch', fetch_latency)
+            buffered_batches += 1
+            rows_to_insert = len(batch)
+
+            if rows_to_insert == 0:
+                # No more records to insert.
+                break
+
+            encode_started_at = time.perf_counter()
+
+            with trace_span(conversion, 'process_mysql_data', 'batch', span_args):
+                data_stream: Union[io.StringIO, io.BytesIO] = (process_mysql_data_binary(batch, encoders)
+                                                               if encoders is not None
+                                                               else process_mysql_data(batch))
+
+            encode_latency = time.perf_counter() - encode_started_at
+            Metrics.observe(table_name, 'batch_encode_seconds', encode_latency)
+            record_timing(conversion, table_name, batch_id, 'process_mysql_data', encode_latency)
+
+            # Notice, for text format the size is measured in characters, which is accurate enough.
+            batch_size_in_bytes = data_stream.seek(0, io.SEEK_END)
+            batch_sizer.observe_batch(rows_to_insert, batch_size_in_bytes)
+            Metrics.increment(table_name, 'bytes_transferred_total', batch_size_in_bytes)
+            data_stream.seek(0)
+
+            _arrange_and_load_batch_params = [
+                table_name,
+                data_pool_id,
+                data_stream,
+                'binary' if encoders is not None else 'text',
+                rows_cnt,
+                rows_to_insert,
+                number_of_inserted_rows,
+                freeze,
+                int(batch[-1][split_column_index]) if split_column_index is not None else None,
+                batch_id,
+                time.time(),
+            ]
+
+            future = executor.submit(_arrange_and_load_batch, *_arrange_and_load_batch_params)  # type: ignore
+            future.add_done_callback(partial(_observe_copy_latency, batch_sizer))
+            Metrics.set_gauge(table_name, 'write_queue_depth', buffered_batches)
+
+            if buffered_batches > max_buffered_batches:
+                for completed_future in as_completed([future]):
+                    try:
+                        completed_future.result()
+                    except Exception as ex:
+                        generate_error(conversion, repr(ex))
+                    finally:
+                        buffered_batches -= 1
+
+        executor.submit(_complete_data_chunk, table_name, data_pool_id).result()
+        Metrics.set_gauge(table_name, 'write_queue_depth', 0)
+
+
+def _observe_copy_latency(batch_sizer: BatchSizer, future: Future) -> None:
+    """
+    Passes COPY duration of just loaded batch to given BatchSizer.
+    Notice, failed batches are reported by the write-worker itself.
+    """
+    if not future.cancelled() and future.exception() is None:
+        batch_sizer.observe_latency(future.result())
+
+
+def _stream_data(
+    conversion: Conversion,
+    table_name: str,
+    data_pool_id: int,
+    mysql_cursor: Any,
+    encoders: Optional[list[Callable[[Any], bytes]]],
+    rows_cnt: int,
+    batch_sizer: BatchSizer,
+    freeze: bool
+) -> None:
+    """
+    Streams the data from unbuffered MySQL cursor directly into "PostgreSQL COPY", within the current process.
+    Rows are pulled from MySQL on demand, as COPY consumes them,
+    so only a few small batches are kept in memory at any moment, regardless of rows width.
+    Notice, the whole data-chunk is loaded within a single transaction.
+    """
+    if encoders is not None:
+        stream_reader = MySQLStreamReader(
+            mysql_cursor=mysql_cursor,
+            encode=partial(encode_binary_rows, encoders=encoders),
+            header=COPY_BINARY_HEADER,
+            trailer=COPY_BINARY_TRAILER,
+            fetch_size=batch_sizer.rows_per(MySQLStreamReader.READ_SIZE),
+        )
+    else:
+        stream_reader = MySQLStreamReader(
+            mysql_cursor=mysql_cursor,
+            encode=process_mysql_data_to_string,
+            fetch_size=batch_sizer.rows_per(MySQLStreamReader.READ_SIZE),
+        )
+
+    pg_client = open_writer_session(conversion)
+
+    try:
+        pg_cursor = pg_client.cursor()
+
+        if freeze:
+            pg_cursor.execute(_get_truncate_sql(conversion, table_name))  # type: ignore
+
+        sql_copy = _get_copy_sql(conversion, table_name, 'binary' if encoders is not None else 'text', freeze)
+        copy_started_at = time.perf_counter()
+        # Notice, copy_expert uses only the "read" method of given file-like object.
+        pg_cursor.copy_expert(sql=sql_copy, file=stream_reader, size=MySQLStreamReader.READ_SIZE)  # type: ignore
+        _record_progress(pg_cursor, conversion, data_pool_id, stream_reader.rows_read, is_completed=True)
+        pg_client.commit()  # type: ignore
+        pg_cursor.close()  # type: ignore
+
+        # Notice, the COPY duration includes the retrieval of the data, since rows are pulled as COPY consumes them.
+        Metrics.observe(table_name, 'copy_seconds', time.perf_counter() - copy_started_at)
+        Metrics.increment(table_name, 'rows_loaded_total', stream_reader.rows_read)
+        Metrics.increment(table_name, 'bytes_transferred_total', stream_reader.bytes_read)
+        msg = (f'[{_stream_data.__name__}] Just inserted: {stream_reader.rows_read} rows, '
+               f'Total rows to insert into "{conversion.schema}"."{table_name}": {rows_cnt}')
+
+        log(conversion, msg)
+    finally:
+        pg_client.close()  # type: ignore
+
+
+def _transfer_via_shared_memory(
+    conversion: Conversion,
+    table_name: str,
+    data_pool_id: int,
+    mysql_cursor: Any,
+    encoders: Optional[list[Callable[[Any], bytes]]],
+    rows_cnt: int,
+    batch_sizer: BatchSizer,
+    freeze: bool
+) -> None:
+    """
+    Retrieves the data from unbuffered MySQL cursor, encodes it into COPY payloads,
+    and passes the payloads to the writer process through shared memory ring buffer.
+    The writer process loads the whole data-chunk using a single "PostgreSQL COPY" (and a single transaction).
+    Notice:
+    1. Unlike the default transport, nothing is pickled and sent through a pipe.
+    2. Memory consumption is bounded by the ring buffer's slots count,
+       since the reader blocks until the writer frees a slot.
+    """
+    if encoders is not None:
+        copy_format = 'binary'
+        encode: Callable[[Any], bytes] = partial(encode_binary_rows, encoders=encoders)
+    else:
+        copy_format = 'text'
+        encode = partial(_encode_text_payload, encoding=pg_encodings[conversion.target_con_string['charset'].upper()])
+
+    ring_buffer = SharedMemoryRingBuffer(
+        slots_count=conversion.shared_memory_slots_count,
+        slot_size=conversion.shared_memory_slot_size,
+    )
+
+    writer_process = multiprocessing.Process(
+        target=_consume_ring_buffer,
+        args=(
+            conversion.config,
+            table_name,
+            data_pool_id,
+            copy_format,
+            ring_buffer,
+            rows_cnt,
+            freeze,
+            get_log_queue(),
+            get_metrics_queue(),
+        ),
+    )
+
+    writer_process.start()
+    ring_buffer.watch_peer(writer_process)
+
+    try:
+        if copy_format == 'binary':
+            ring_buffer.write(COPY_BINARY_HEADER)
+
+        while True:
+            # Each batch should roughly fit a single slot.
+            fetch_started_at = time.perf_counter()
+            batch = mysql_cursor.fetchmany(batch_sizer.rows_per(ring_buffer.slot_size))
+            Metrics.observe(table_name, 'batch_fetch_seconds', time.perf_counter() - fetch_started_at)
+
+            if not batch:
+                break
+
+            encode_started_at = time.perf_counter()
+            payload = encode(batch)
+            Metrics.observe(table_name, 'batch_encode_seconds', time.perf_counter() - encode_started_at)
+            batch_sizer.observe_batch(len(batch), len(payload))
+            ring_buffer.write(payload)
+            Metrics.increment(table_name, 'bytes_transferred_total', len(payload))
+
+        if copy_format == 'binary':
+            ring_buffer.write(COPY_BINARY_TRAILER)
+
+        ring_buffer.close_writing()
+    except Exception:
+        ring_buffer.abort()
+        raise
+    finally:
+        writer_process.join()
+        ring_buffer.release(unlink=True)
+
+    if writer_process.exitcode != 0:
+        raise BrokenPipeError(f'Writer process for "{conversion.schema}"."{table_name}" has failed')
+
+
+def _encode_text_payload(batch: tuple[tuple[str, ...], ...], encoding: str) -> bytes:
+    """
+    Converts given batch to TSV, encoded with given encoding.
+    """
+    return process_mysql_data_to_string(batch).encode(encoding)
+
+
+def _consume_ring_buffer(
     conversion_config: dict,
     table_name: str,
-    text_stream: io.StringIO,
+    data_pool_id: int,
+    copy_format: str,
+    ring_buffer: SharedMemoryRingBuffer,
     rows_cnt: int,
-    rows_to_insert: int,
-    number_of_inserted_rows: int
-) -> str:
+    freeze: bool,
+    log_queue: Optional[Any],
+    metrics_queue: Optional[Any]
+) -> None:
     """
-    Formats a batch of data as csv, and passes it to PG COPY.
+    Loads COPY payloads from shared memory ring buffer into given table.
     Notice, this function runs in separate process.
     """
+    attach_log_pipeline(log_queue)
+    attach_metrics(metrics_queue)
+    ring_buffer.watch_peer(multiprocessing.parent_process())
     conversion = Conversion(conversion_config)
-    original_session_replication_role = ''  # !!!MUST be left as an empty string.
+    pg_client = None
 
     try:
-        pg_client = DBAccess.get_db_client(conversion, DBVendor.PG)
+        pg_client = open_writer_session(conversion)
         pg_cursor = pg_client.cursor()
 
-        if conversion.should_migrate_only_data():
-            original_session_replication_role = disable_triggers(conversion, pg_client)
+        if freeze:
+            pg_cursor.execute(_get_truncate_sql(conversion, table_name))  # type: ignore
+
+        sql_copy = _get_copy_sql(conversion, table_name, copy_format, freeze)
+        copy_started_at = time.perf_counter()
+        pg_cursor.copy_expert(sql=sql_copy, file=ring_buffer, size=ring_buffer.slot_size)  # type: ignore
+        rows_loaded = pg_cursor.rowcount
+        _record_progress(pg_cursor, conversion, data_pool_id, rows_loaded, is_completed=True)
+        pg_client.commit()  # type: ignore
+        Metrics.observe(table_name, 'copy_seconds', time.perf_counter() - copy_started_at)
+        Metrics.increment(table_name, 'rows_loaded_total', rows_loaded)
+        msg = (f'[{_consume_ring_buffer.__name__}] Just inserted: {rows_loaded} rows, '
+               f'Total rows to insert into "{conversion.schema}"."{table_name}": {rows_cnt}')
+
+        pg_cursor.close()  # type: ignore
+        log(conversion, msg)
+    except Exception as e:
+        ring_buffer.abort()
+        generate_error(conversion, f'[{_consume_ring_buffer.__name__}] {type(e).__name__} {repr(e)}')
+        sys.exit(1)
+    finally:
+        ring_buffer.release(unlink=False)
+
+        if pg_client:
+            pg_client.close()  # type: ignore
+
+
+def _init_writer_session(conversion_config: dict, log_queue: Optional[Any], metrics_queue: Optional[Any]) -> None:
+    """
+    Initializes the write-worker process.
+    Creates the Conversion instance and the PostgreSQL session, used by all batches, loaded by current process.
+    Notice, this function runs in separate process.
+    """
+    global _writer_conversion, _writer_client
+    attach_log_pipeline(log_queue)
+    attach_metrics(metrics_queue)
+    _writer_conversion = Conversion(conversion_config)
+    _writer_client = open_writer_session(_writer_conversion)
+    profile_process(_writer_conversion, 'write_worker')
+
+    # Closes the session when the write-worker process exits.
+    # Notice, the session may be reopened, see "_reset_writer_session".
+    Finalize(None, _close_writer_session, exitpriority=0)
+
+
+def _close_writer_session() -> None:
+    """
+    Closes current PostgreSQL session of the write-worker.
+    Notice, this function runs in separate process.
+    """
+    if _writer_client is not None and not _writer_client.closed:
+        _writer_client.close()  # type: ignore
+
+
+def open_writer_session(conversion: Conversion) -> PgConnection:
+    """
+    Opens PostgreSQL session, dedicated to loading the data.
+    The session is configured once, and must be closed by the caller:
+    1. session_replication_role - all triggers and rules are disabled (in "migrate_only_data" mode only).
+       Notice, there is no need to restore the original value, since the session is never reused by others.
+    2. synchronous_commit - COPY commits do not wait for WAL flush.
+       Loaded data becomes durable as soon as the data-pool item is deleted (synchronously) by the loader.
+    3. search_path - target schema.
+    """
+    pg_client = DBAccess.get_pg_dedicated_client(conversion)
+    session_settings = ['SET synchronous_commit = off;', f'SET search_path = "{conversion.schema}";']
+
+    if conversion.should_migrate_only_data():
+        session_settings.append('SET session_replication_role = replica;')
 
-        sql_copy = (f'COPY "{conversion.schema}"."{table_name}" FROM STDIN'
-                    f' WITH(FORMAT text, DELIMITER \'\t\', ENCODING \'{conversion.target_con_string["charset"]}\');')
+    pg_cursor = pg_client.cursor()
+    pg_cursor.execute(''.join(session_settings))  # type: ignore
+    pg_cursor.close()  # type: ignore
+    pg_client.commit()  # type: ignore
+    return pg_client
+
+
+def _arrange_and_load_batch(
+    table_name: str,
+    data_pool_id: int,
+    data_stream: Union[io.StringIO, io.BytesIO],
+    copy_format: str,
+    rows_cnt: int,
+    rows_to_insert: int,
+    number_of_inserted_rows: int,
+    freeze: bool,
+    high_water_mark: Optional[int],
+    batch_id: int,
+    submitted_at: float
+) -> float:
+    """
+    Passes a batch of data, formatted as tsv or as PostgreSQL binary tuples, to PG COPY.
+    Uses the PostgreSQL session of current write-worker.
+    The progress-ledger is updated within the same transaction.
+    If "freeze" is set, the batch is not committed, see "_complete_data_chunk".
+    Returns COPY duration (in seconds).
+    Notice, this function runs in separate process.
+    """
+    global _writer_chunk_failed
+    conversion = cast(Conversion, _writer_conversion)
+    pg_client = cast(PgConnection, _writer_client)
+    copy_latency = 0.0
+
+    # Notice, the transfer includes pickling, passing through the executor's queue, and unpickling of the batch.
+    record_timing(conversion, table_name, batch_id, 'transfer', time.time() - submitted_at)
+
+    if _writer_chunk_failed:
+        return copy_latency
+
+    try:
+        pg_cursor = pg_client.cursor()
 
-        pg_cursor.copy_expert(sql=sql_copy, file=text_stream)
-        pg_client.commit()
+        if freeze and pg_client.status == STATUS_READY:
+            # The first batch of the "COPY FREEZE" transaction.
+            pg_cursor.execute(_get_truncate_sql(conversion, table_name))  # type: ignore
+
+        sql_copy = _get_copy_sql(conversion, table_name, copy_format, freeze)
+        span_started_at = time.time()
+        copy_started_at = time.perf_counter()
+        pg_cursor.copy_expert(sql=sql_copy, file=data_stream)  # type: ignore
+        copy_expert_latency = time.perf_counter() - copy_started_at
+        _record_progress(pg_cursor, conversion, data_pool_id, rows_to_insert, high_water_mark)
+
+        if not freeze:
+            pg_client.commit()  # type: ignore
+
+        copy_latency = time.perf_counter() - copy_started_at
+        record_timing(conversion, table_name, batch_id, 'copy_expert', copy_expert_latency)
+        add_span(conversion, 'copy', 'batch', span_started_at, {'table_name': table_name, 'batch_id': batch_id})
+
+        # Notice, the commit phase includes the progress-ledger update.
+        record_timing(conversion, table_name, batch_id, 'commit', copy_latency - copy_expert_latency)
+        pg_cursor.close()  # type: ignore
+        Metrics.observe(table_name, 'copy_seconds', copy_latency)
+        Metrics.increment(table_name, 'rows_loaded_total', rows_to_insert)
+        Metrics.increment(table_name, 'batches_loaded_total')
 
         number_of_inserted_rows += rows_to_insert
         msg = (f'[{_arrange_and_load_batch.__name__}] Just inserted: {number_of_inserted_rows} more rows, '
@@ -229,125 +1033,144 @@ def _arrange_and_load_batch(
 
         log(conversion, msg)
     except Exception as e:
+        _writer_chunk_failed = True
         error_message = f'[{_arrange_and_load_batch.__name__}] {type(e).__name__} {repr(e)}'
         generate_error(conversion, error_message)
-    finally:
-        return original_session_replication_role
+        _reset_writer_session()
 
+    return copy_latency
 
-def delete_data_pool_item(
-    conversion: Conversion,
-    data_pool_id: int,
-    pg_client: PooledDedicatedDBConnection,
-    original_session_replication_role: Optional[str] = None,
-) -> None:
+
+def _reset_writer_session() -> None:
     """
-    Deletes given record from the data-pool.
+    Rolls back current transaction of the write-worker's PostgreSQL session.
+    If the session is broken (the rollback fails, or the connection is closed), opens a new one.
+    Notice, this function runs in separate process.
     """
-    data_pool_table_name = MigrationStateManager.get_data_pool_table_name(conversion)
-    sql = f'DELETE FROM {data_pool_table_name} WHERE id = {data_pool_id};'
-    result = DBAccess.query(
-        conversion=conversion,
-        caller=delete_data_pool_item.__name__,
-        sql=sql,
-        vendor=DBVendor.PG,
-        process_exit_on_error=False,
-        should_return_client=True,
-        client=pg_client
-    )
+    global _writer_client
+    conversion = cast(Conversion, _writer_conversion)
+    pg_client = cast(PgConnection, _writer_client)
 
-    log(conversion, f'[{delete_data_pool_item.__name__}] Deleted #{data_pool_id} from data-pool')
+    try:
+        if not pg_client.closed:
+            pg_client.rollback()  # type: ignore
+            return
+    except Exception as e:
+        generate_error(conversion, f'[{_reset_writer_session.__name__}] {type(e).__name__} {repr(e)}')
 
-    if original_session_replication_role and result.client:
-        enable_triggers(conversion, result.client, original_session_replication_role)
+    try:
+        pg_client.close()  # type: ignore
+    except Exception:
+        pass  # The connection is broken anyway.
 
+    try:
+        _writer_client = open_writer_session(conversion)
+    except Exception as e:
+        generate_error(conversion, f'[{_reset_writer_session.__name__}] {type(e).__name__} {repr(e)}')
+
+
+def _complete_data_chunk(table_name: str, data_pool_id: int) -> None:
+    """
+    Marks the data-chunk of current write-worker as completed, and commits.
+    In "COPY FREEZE" mode, this commit is the one, which makes all the data-chunk's batches visible.
+    Notice, this function runs in separate process.
+    """
+    conversion = cast(Conversion, _writer_conversion)
+    pg_client = cast(PgConnection, _writer_client)
 
-def enable_triggers(
+    if _writer_chunk_failed:
+        msg = (f'[{_complete_data_chunk.__name__}] "{conversion.schema}"."{table_name}" data-chunk #{data_pool_id}'
+               f' is not loaded entirely, and will be resumed on the next run')
+
+        generate_error(conversion, msg)
+        return
+
+    pg_cursor = pg_client.cursor()
+    _record_progress(pg_cursor, conversion, data_pool_id, 0, is_completed=True)
+    pg_client.commit()  # type: ignore
+    pg_cursor.close()  # type: ignore
+
+
+def _record_progress(
+    pg_cursor: PgCursor,
     conversion: Conversion,
-    pg_client: PooledDedicatedDBConnection,
-    original_session_replication_role: str
+    data_pool_id: int,
+    rows_loaded: int,
+    high_water_mark: Optional[int] = None,
+    is_completed: bool = False
 ) -> None:
     """
-    Enables all triggers and rules for current database session.
-    !!!DO NOT release the client, it will be released after current data-chunk deletion.
+    Updates given data-chunk's progress-ledger record.
+    Notice, the caller commits, so the record is updated within the same transaction as the COPY.
     """
-    DBAccess.query(
-        conversion=conversion,
-        caller=enable_triggers.__name__,
-        sql=f'SET session_replication_role = {original_session_replication_role};',
-        vendor=DBVendor.PG,
-        process_exit_on_error=False,
-        should_return_client=False,
-        client=pg_client
-    )
+    progress_ledger_table_name = MigrationStateManager.get_progress_ledger_table_name(conversion)
+    sql = (f'INSERT INTO {progress_ledger_table_name} AS ledger'
+           ' (data_pool_id, high_water_mark, rows_loaded, is_completed) VALUES (%s, %s, %s, %s)'
+           ' ON CONFLICT (data_pool_id) DO UPDATE SET'
+           ' high_water_mark = COALESCE(EXCLUDED.high_water_mark, ledger.high_water_mark),'
+           ' rows_loaded = ledger.rows_loaded + EXCLUDED.rows_loaded,'
+           ' is_completed = EXCLUDED.is_completed;')
 
+    pg_cursor.execute(sql, (data_pool_id, high_water_mark, rows_loaded, is_completed))  # type: ignore
 
-def disable_triggers(
-    conversion: Conversion,
-    pg_client: PooledDedicatedDBConnection
-) -> str:
+
+def _get_copy_sql(conversion: Conversion, table_name: str, copy_format: str, freeze: bool = False) -> str:
     """
-    Disables all triggers and rules for current database session.
-    !!!DO NOT release the client, it will be released after current data-chunk deletion.
+    Returns COPY statement for given table and format.
     """
-    original_session_replication_role = 'origin'
-    query_result = DBAccess.query(
-        conversion=conversion,
-        caller=disable_triggers.__name__,
-        sql='SHOW session_replication_role;',
-        vendor=DBVendor.PG,
-        process_exit_on_error=False,
-        should_return_client=True,
-        client=pg_client
-    )
+    if copy_format == 'binary':
+        copy_options = 'FORMAT binary'
+    elif copy_format == 'csv':
+        # Notice, CSV files come from the offline source only, and their header (if any) is skipped while splitting.
+        csv_options = conversion.offline_source_csv
+        copy_options = (f'FORMAT csv, ENCODING \'{conversion.target_con_string["charset"]}\''
+                        f', DELIMITER {_get_literal(csv_options["delimiter"])}'
+                        f', QUOTE {_get_literal(csv_options["quote"])}'
+                        f', ESCAPE {_get_literal(csv_options["escape"])}'
+                        f', NULL {_get_literal(csv_options["null"])}')
+    else:
+        copy_options = f'FORMAT text, DELIMITER \'\t\', ENCODING \'{conversion.target_con_string["charset"]}\''
 
-    if query_result.data:
-        original_session_replication_role = query_result.data[0]['session_replication_role']
+    if freeze:
+        # Notice, FREEZE requires the table to be created or truncated within current transaction.
+        copy_options += ', FREEZE'
 
-    DBAccess.query(
-        conversion=conversion,
-        caller=disable_triggers.__name__,
-        sql='SET session_replication_role = replica;',
-        vendor=DBVendor.PG,
-        process_exit_on_error=False,
-        should_return_client=False,
-        client=query_result.client
-    )
+    return f'COPY "{conversion.schema}"."{table_name}" FROM STDIN WITH({copy_options});'
 
-    return original_session_replication_role
 
+def _get_literal(value: str) -> str:
+    """
+    Returns given value as a PostgreSQL string literal.
+    """
+    escaped_value = value.replace("'", "''")
+    return f"'{escaped_value}'"
 
-def data_transferred(conversion: Conversion, data_pool_id: int) -> bool:
+
+def _get_truncate_sql(conversion: Conversion, table_name: str) -> str:
     """
-    Enforces consistency before processing a chunk of data.
-    Ensures there are no data duplications.
-    In case of normal execution - it is a good practice.
-    In case of rerunning migration after unexpected failure - it is absolutely mandatory.
+    Returns TRUNCATE statement for given table.
     """
-    data_pool_table_name = MigrationStateManager.get_data_pool_table_name(conversion)
-    result = DBAccess.query(
-        conversion=conversion,
-        caller=data_transferred.__name__,
-        sql=f'SELECT metadata AS metadata FROM {data_pool_table_name} WHERE id = {data_pool_id};',
-        vendor=DBVendor.PG,
-        process_exit_on_error=True,
-        should_return_client=True
-    )
+    return f'TRUNCATE "{conversion.schema}"."{table_name}";'
 
-    result_data = cast(list[dict[str, Any]], result.data)
-    metadata = result_data[0]['metadata']
-    table_name = metadata['table_name']
-    target_table_name = f'"{conversion.schema}"."{table_name}"'
 
-    probe = DBAccess.query(
+def delete_data_pool_item(
+    conversion: Conversion,
+    data_pool_id: int,
+    pg_client: Optional[PooledDedicatedDBConnection] = None
+) -> None:
+    """
+    Deletes given record from the data-pool.
+    """
+    data_pool_table_name = MigrationStateManager.get_data_pool_table_name(conversion)
+    sql = f'DELETE FROM {data_pool_table_name} WHERE id = {data_pool_id};'
+    DBAccess.query(
         conversion=conversion,
-        caller=data_transferred.__name__,
-        sql=f'SELECT * FROM {target_table_name} LIMIT 1 OFFSET 0;',
+        caller=delete_data_pool_item.__name__,
+        sql=sql,
         vendor=DBVendor.PG,
-        process_exit_on_error=True,
+        process_exit_on_error=False,
         should_return_client=False,
-        client=result.client
+        client=pg_client
     )
 
-    probe_data = cast(list[dict[str, Any]], probe.data)
-    return len(probe_data) != 0
+    log(conversion, f'[{delete_data_pool_item.__name__}] Deleted #{data_pool_id} from data-pool')
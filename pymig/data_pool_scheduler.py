@@ -0,0 +1,94 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+import heapq
+from typing import Any
+
+from pymig.fs_ops import log
+from pymig.conversion import Conversion
+
+
+def schedule_data_pool(conversion: Conversion, number_of_workers: int) -> list[dict[str, Any]]:
+    """
+    Returns the data-pool, ordered for loading.
+    Data-chunks are ordered by user-defined priority ("loader_priorities"), and then by the longest job first:
+    the larger the data-chunk (by data size, and then by rows count) - the earlier it is loaded.
+    This way the largest data-chunks do not start last, leaving other loader processes idle.
+    Notice, loader processes pick data-chunks in the submission order, as they become free.
+    """
+    scheduled_data_pool = sorted(
+        conversion.data_pool,
+        key=lambda meta: (
+            -_get_priority(conversion, meta['table_name']),
+            -_get_chunk_data_size(meta),
+            -_get_chunk_rows_cnt(meta),
+        ),
+    )
+
+    _log_predicted_makespan(conversion, scheduled_data_pool, number_of_workers)
+    return scheduled_data_pool
+
+
+def _get_priority(conversion: Conversion, table_name: str) -> int:
+    """
+    Returns user-defined loading priority of given table.
+    Tables with greater priority are loaded first. Default priority is 0.
+    """
+    return int(conversion.loader_priorities[table_name]) if table_name in conversion.loader_priorities else 0
+
+
+def _get_chunk_data_size(meta: dict[str, Any]) -> float:
+    """
+    Returns estimated size (in MB) of given data-chunk.
+    """
+    return float(meta['table_data_size']) / max(1, int(meta['chunks_cnt']))
+
+
+def _get_chunk_rows_cnt(meta: dict[str, Any]) -> float:
+    """
+    Returns estimated rows count of given data-chunk.
+    """
+    return float(meta['rows_cnt']) / max(1, int(meta['chunks_cnt']))
+
+
+def _log_predicted_makespan(
+    conversion: Conversion,
+    scheduled_data_pool: list[dict[str, Any]],
+    number_of_workers: int
+) -> None:
+    """
+    Simulates given schedule, and logs predicted makespan, measured in MB loaded by the busiest loader process.
+    The makespan is compared to its lower bound: an even share of the total size, or the largest data-chunk.
+    """
+    if not scheduled_data_pool or number_of_workers < 1:
+        return
+
+    workers_loads = [0.0] * number_of_workers
+
+    for meta in scheduled_data_pool:
+        # Each data-chunk goes to the loader process, which becomes free first.
+        heapq.heapreplace(workers_loads, workers_loads[0] + _get_chunk_data_size(meta))
+
+    chunks_data_sizes = [_get_chunk_data_size(meta) for meta in scheduled_data_pool]
+    lower_bound = max(sum(chunks_data_sizes) / number_of_workers, max(chunks_data_sizes))
+    makespan = max(workers_loads)
+    msg = (f'[{_log_predicted_makespan.__name__}] Data-chunks to load: {len(scheduled_data_pool)},'
+           f' loader processes: {number_of_workers}\n'
+           f'\t--[{_log_predicted_makespan.__name__}] Predicted makespan: {makespan:.2f} MB'
+           f' on the busiest loader process (lower bound: {lower_bound:.2f} MB)')
+
+    log(conversion, msg)
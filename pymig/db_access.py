@@ -16,10 +16,12 @@ __license__ = """
     If not, see <http://www.gnu.org/licenses/gpl.txt>.
 """
 import sys
+import time
 from typing import Optional, Union
 
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.extensions import connection as PgConnection
 from dbutils.pooled_db import PooledDB, PooledDedicatedDBConnection
 from MySQLdb import (
     Connection as MySQLdbConnection,
@@ -30,6 +32,7 @@ from pymig.db_access_query_result import DBAccessQueryResult
 from pymig.fs_ops import generate_error
 from pymig.db_vendor import DBVendor
 from pymig.conversion import Conversion
+from pymig.tracer import add_span, get_sql_args
 
 
 def _ensure_mysql_connection(conversion: Conversion) -> None:
@@ -107,19 +110,42 @@ def close_connection_pools(conversion: Conversion) -> None:
                 generate_error(conversion, f'[{close_connection_pools.__name__}] {repr(e)}')
 
 
-def get_mysql_unbuffered_client(conversion: Conversion) -> MySQLdbConnection:
+def get_mysql_unbuffered_client(conversion: Conversion, conv: Optional[dict] = None) -> MySQLdbConnection:
     """
     Returns MySQL unbuffered client.
+    If given, "conv" overrides MySQLdb default type converters.
     """
-    return MySQLdbConnection(
-        port=conversion.source_con_string['port'],
-        host=conversion.source_con_string['host'],
-        user=conversion.source_con_string['user'],
-        password=conversion.source_con_string['password'],
-        charset=conversion.source_con_string['charset'],
-        database=conversion.source_con_string['database'],
-        cursorclass=MySQLdbCursors.SSCursor,
-    )
+    connection_details = {
+        'port': conversion.source_con_string['port'],
+        'host': conversion.source_con_string['host'],
+        'user': conversion.source_con_string['user'],
+        'password': conversion.source_con_string['password'],
+        'charset': conversion.source_con_string['charset'],
+        'database': conversion.source_con_string['database'],
+        'cursorclass': MySQLdbCursors.SSCursor,
+    }
+
+    if conv:
+        connection_details['conv'] = conv
+
+    return MySQLdbConnection(**connection_details)
+
+
+def get_pg_dedicated_client(conversion: Conversion) -> PgConnection:
+    """
+    Returns PostgreSQL client, which is not a part of the connection pool.
+    Intended for long-lived sessions, which state must not leak to other pool users.
+    """
+    connection_details = {
+        'port': conversion.target_con_string['port'],
+        'host': conversion.target_con_string['host'],
+        'user': conversion.target_con_string['user'],
+        'password': conversion.target_con_string['password'],
+        'database': conversion.target_con_string['database'],
+        'client_encoding': conversion.target_con_string['charset'],
+    }
+
+    return psycopg2.connect(**connection_details)
 
 
 def get_db_client(
@@ -185,6 +211,7 @@ def query(
     Performs appropriate actions (requesting/releasing client) against target connections pool.
     """
     cursor, data, error = None, None, None
+    started_at = time.time()
 
     try:
         if not client:
@@ -200,7 +227,10 @@ def query(
             cursor.execute(sql)
 
         client.commit()
-        data = cursor.fetchall()
+
+        # Notice, statements, which return no rows (DDL, for instance), must not be fetched,
+        # since psycopg2 raises ProgrammingError("no results to fetch") otherwise.
+        data = cursor.fetchall() if cursor.description is not None else []
 
         if isinstance(data, tuple):
             data = list(data)
@@ -225,6 +255,7 @@ def query(
 
         # Determines if the client (instance of PooledDedicatedDBConnection) should be released.
         _release_db_client_if_necessary(conversion, client, should_return_client)
+        add_span(conversion, caller, vendor.value.lower(), started_at, get_sql_args(sql))
         return DBAccessQueryResult(client=client, data=data, error=error)
 
 
@@ -237,18 +268,10 @@ def query_without_transaction(
     Sends given query to the target PostgreSQL database without wrapping it with transaction.
     """
     client, cursor, error = None, None, None
+    started_at = time.time()
 
     try:
-        connection_details = {
-            'port': conversion.target_con_string['port'],
-            'host': conversion.target_con_string['host'],
-            'user': conversion.target_con_string['user'],
-            'password': conversion.target_con_string['password'],
-            'database': conversion.target_con_string['database'],
-            'client_encoding': conversion.target_con_string['charset'],
-        }
-
-        client = psycopg2.connect(**connection_details)
+        client = get_pg_dedicated_client(conversion)
         client.set_isolation_level(0)  # type: ignore
         cursor = client.cursor()
         cursor.execute(sql)  # type: ignore
@@ -260,4 +283,5 @@ def query_without_transaction(
             cursor.close()  # type: ignore
 
     release_db_client(conversion, client)
+    add_span(conversion, caller, DBVendor.PG.value.lower(), started_at, get_sql_args(sql))
     return DBAccessQueryResult(client=None, data=None, error=error)
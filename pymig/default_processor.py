@@ -15,20 +15,18 @@ __license__ = """
     along with this program (please see the "LICENSE.md" file).
     If not, see <http://www.gnu.org/licenses/gpl.txt>.
 """
-import pymig.db_access as DBAccess
 import pymig.extra_config_processor as ExtraConfigProcessor
 from pymig.table_processor import map_data_types
 from pymig.conversion import Conversion
-from pymig.db_vendor import DBVendor
 from pymig.fs_ops import log
 
 
-def process_default(conversion: Conversion, table_name: str) -> None:
+def get_default_clauses(conversion: Conversion, table_name: str) -> list[str]:
     """
     Determines which columns of the given table have default value.
-    Sets default values where appropriate.
+    Returns "ALTER TABLE" clauses, that set default values where appropriate.
     """
-    msg = f'[{process_default.__name__}] Determines default values for table: "{conversion.schema}"."{table_name}"'
+    msg = f'[{get_default_clauses.__name__}] Determines default values for table: "{conversion.schema}"."{table_name}"'
     log(conversion, msg, conversion.dic_tables[table_name].table_log_path)
     original_table_name = ExtraConfigProcessor.get_table_name(conversion, table_name, should_get_original=True)
 
@@ -55,29 +53,26 @@ def process_default(conversion: Conversion, table_name: str) -> None:
         'UTC_TIMESTAMP': "(NOW() AT TIME ZONE 'UTC')",
     }
 
-    params = [
-        [
-            conversion, table_name, original_table_name, column, sql_reserved_values,
+    return [
+        _get_default_clause(
+            conversion, original_table_name, column, sql_reserved_values,
             pg_numeric_types, pg_bit_types, pg_binary_types,
-        ]
+        )
         for column in conversion.dic_tables[table_name].table_columns
     ]
 
-    conversion.run_concurrently(func=_set_default, params_list=params)
 
-
-def _set_default(
+def _get_default_clause(
     conversion: Conversion,
-    table_name: str,
     original_table_name: str,
     column: dict,
     sql_reserved_values: dict[str, str],
-    pg_numeric_types: tuple[str],
-    pg_bit_types: tuple[str],
-    pg_binary_types: tuple[str],
-) -> None:
+    pg_numeric_types: tuple[str, ...],
+    pg_bit_types: tuple[str, ...],
+    pg_binary_types: tuple[str, ...],
+) -> str:
     """
-    Sets default value for given column.
+    Returns a clause, that sets default value for given column.
     """
     pg_data_type = map_data_types(conversion.data_types_map, column['Type'])
     column_name = ExtraConfigProcessor.get_column_name(
@@ -87,41 +82,28 @@ def _set_default(
         should_get_original=False
     )
 
-    sql = f'ALTER TABLE "{conversion.schema}"."{table_name}" ALTER COLUMN "{column_name}" SET DEFAULT'
+    sql = f'ALTER COLUMN "{column_name}" SET DEFAULT'
     is_of_bit_type = _is_of_type(pg_data_type=pg_data_type, pg_types=pg_bit_types)
     is_of_binary_type = _is_of_type(pg_data_type=pg_data_type, pg_types=pg_binary_types)
     is_of_numeric_type = _is_of_type(pg_data_type=pg_data_type, pg_types=pg_numeric_types)
 
     if column['Default'] in sql_reserved_values:
-        sql += f" {sql_reserved_values[column['Default']]};"
+        sql += f" {sql_reserved_values[column['Default']]}"
     elif column['Default'] is None:
-        sql += ' NULL;'
+        sql += ' NULL'
     elif is_of_bit_type and column['Default'] is not None:
-        sql += f" {column['Default']};"  # bit varying
+        sql += f" {column['Default']}"  # bit varying
     elif is_of_binary_type and column['Default'] is not None:
-        sql += f" '\\x{column['Default']}';"  # bytea
+        sql += f" '\\x{column['Default']}'"  # bytea
     elif is_of_numeric_type and column['Default'] is not None:
-        sql += f" '{column['Default']}';"
+        sql += f" '{column['Default']}'"
     else:
-        sql += f" {column['Default']};"
-
-    result = DBAccess.query(
-        conversion=conversion,
-        caller=_set_default.__name__,
-        sql=sql,
-        vendor=DBVendor.PG,
-        process_exit_on_error=False,
-        should_return_client=False
-    )
-
-    if not result.error:
-        msg = (f'[{_set_default.__name__}] Sets default value for'
-               f' "{conversion.schema}"."{table_name}"."{column_name}"...')
+        sql += f" {column['Default']}"
 
-        log(conversion, msg, conversion.dic_tables[table_name].table_log_path)
+    return sql
 
 
-def _is_of_type(pg_data_type: str, pg_types: tuple[str]) -> bool:
+def _is_of_type(pg_data_type: str, pg_types: tuple[str, ...]) -> bool:
     """
     Defines if given pg_data_type is related to one of types from pg_types tuple.
     """
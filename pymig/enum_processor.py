@@ -17,30 +17,26 @@ __license__ = """
 """
 from typing import cast
 
-import pymig.db_access as DBAccess
 import pymig.extra_config_processor as ExtraConfigProcessor
 from pymig.conversion import Conversion
-from pymig.db_vendor import DBVendor
 from pymig.utils import get_index_of
 from pymig.fs_ops import log
 
 
-def process_enum(conversion: Conversion, table_name: str) -> None:
+def get_enum_clauses(conversion: Conversion, table_name: str) -> list[str]:
     """
     Defines which columns of the given table are of type "enum".
-    Sets an appropriate constraint, if appropriate.
+    Returns "ALTER TABLE" clauses, that set an appropriate constraint.
     """
-    msg = f'[{process_enum.__name__}] Defines "ENUMs" for table "{conversion.schema}"."{table_name}"'
+    msg = f'[{get_enum_clauses.__name__}] Defines "ENUMs" for table "{conversion.schema}"."{table_name}"'
     log(conversion, msg, conversion.dic_tables[table_name].table_log_path)
     original_table_name = ExtraConfigProcessor.get_table_name(conversion, table_name, True)
-    params = [
-        [conversion, table_name, original_table_name, column]
+    return [
+        _get_enum_clause(conversion, original_table_name, column)
         for column in conversion.dic_tables[table_name].table_columns
         if _is_enum(column)
     ]
 
-    conversion.run_concurrently(func=_set_enum, params_list=params)
-
 
 def _is_enum(column: dict) -> bool:
     """
@@ -53,15 +49,9 @@ def _is_enum(column: dict) -> bool:
     return False
 
 
-def _set_enum(
-    conversion: Conversion,
-    table_name: str,
-    original_table_name: str,
-    column: dict
-) -> None:
+def _get_enum_clause(conversion: Conversion, original_table_name: str, column: dict) -> str:
     """
-    Checks if given column is an enum.
-    Sets the enum, if appropriate.
+    Returns a clause, that restricts given enum column to its values.
     """
     column_name = ExtraConfigProcessor.get_column_name(
         conversion=conversion,
@@ -71,16 +61,4 @@ def _set_enum(
     )
 
     enum_values = column['Type'].split('(')[1]  # Exists due to EnumProcessor._is_enum execution result.
-    sql = f'ALTER TABLE "{conversion.schema}"."{table_name}" ADD CHECK ("{column_name}" IN ({enum_values});'
-    result = DBAccess.query(
-        conversion=conversion,
-        caller=_set_enum.__name__,
-        sql=sql,
-        vendor=DBVendor.PG,
-        process_exit_on_error=False,
-        should_return_client=False
-    )
-
-    if not result.error:
-        msg = f'[{_set_enum.__name__}] Set "ENUM" for "{conversion.schema}"."{table_name}"."{column_name}"...'
-        log(conversion, msg, conversion.dic_tables[table_name].table_log_path)
+    return f'ADD CHECK ("{column_name}" IN ({enum_values})'
@@ -15,90 +15,39 @@ __license__ = """
     along with this program (please see the "LICENSE.md" file).
     If not, see <http://www.gnu.org/licenses/gpl.txt>.
 """
+import time
 from typing import cast, Union
+from concurrent.futures import Future
 
 import pymig.db_access as DBAccess
-import pymig.migration_state_manager as MigrationStateManager
 import pymig.extra_config_processor as ExtraConfigProcessor
 from pymig.fs_ops import log
 from pymig.db_vendor import DBVendor
 from pymig.conversion import Conversion
+from pymig.catalog_snapshot import get_catalog_snapshot
 
 
-def set_foreign_keys(conversion: Conversion) -> None:
+def get_foreign_keys(conversion: Conversion, table_name: str) -> dict[str, dict[str, Union[str, list[str]]]]:
     """
-    Starts a process of foreign keys migration.
+    Returns foreign keys of given table, keyed by constraint names.
     """
-    foreign_keys_processed = MigrationStateManager.get(conversion, 'foreign_keys_loaded')
-
-    if foreign_keys_processed:
-        return
-
-    params = [[conversion, table_name] for table_name in conversion.tables_to_migrate]
-    conversion.run_concurrently(func=_get_foreign_keys_metadata, params_list=params)
-
-
-def _get_foreign_keys_metadata(conversion: Conversion, table_name: str) -> None:
-    """
-    Retrieves foreign keys metadata.
-    """
-    msg = (f'[{_get_foreign_keys_metadata.__name__}]'
+    msg = (f'[{get_foreign_keys.__name__}]'
            f' Search foreign keys for table "{conversion.schema}"."{table_name}"...')
 
     log(conversion, msg)
-    sql = f"""
-        SELECT 
-            cols.COLUMN_NAME, refs.REFERENCED_TABLE_NAME, refs.REFERENCED_COLUMN_NAME,
-            cRefs.UPDATE_RULE, cRefs.DELETE_RULE, cRefs.CONSTRAINT_NAME 
-        FROM INFORMATION_SCHEMA.`COLUMNS` AS cols 
-        INNER JOIN INFORMATION_SCHEMA.`KEY_COLUMN_USAGE` AS refs 
-            ON refs.TABLE_SCHEMA = cols.TABLE_SCHEMA 
-                AND refs.REFERENCED_TABLE_SCHEMA = cols.TABLE_SCHEMA 
-                AND refs.TABLE_NAME = cols.TABLE_NAME 
-                AND refs.COLUMN_NAME = cols.COLUMN_NAME 
-        LEFT JOIN INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS AS cRefs 
-            ON cRefs.CONSTRAINT_SCHEMA = cols.TABLE_SCHEMA 
-                AND cRefs.CONSTRAINT_NAME = refs.CONSTRAINT_NAME 
-        LEFT JOIN INFORMATION_SCHEMA.`KEY_COLUMN_USAGE` AS links 
-            ON links.TABLE_SCHEMA = cols.TABLE_SCHEMA 
-                AND links.REFERENCED_TABLE_SCHEMA = cols.TABLE_SCHEMA 
-                AND links.REFERENCED_TABLE_NAME = cols.TABLE_NAME 
-                AND links.REFERENCED_COLUMN_NAME = cols.COLUMN_NAME 
-        LEFT JOIN INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS AS cLinks 
-            ON cLinks.CONSTRAINT_SCHEMA = cols.TABLE_SCHEMA 
-                AND cLinks.CONSTRAINT_NAME = links.CONSTRAINT_NAME 
-        WHERE cols.TABLE_SCHEMA = '{conversion.mysql_db_name}' AND cols.TABLE_NAME
-         = '{ExtraConfigProcessor.get_table_name(conversion, table_name, should_get_original=True)}';
-    """
-
-    result = DBAccess.query(
-        conversion=conversion,
-        caller=_get_foreign_keys_metadata.__name__,
-        sql=sql,
-        vendor=DBVendor.MYSQL,
-        process_exit_on_error=False,
-        should_return_client=False
-    )
-
-    if result.error:
-        return
-
+    original_table_name = ExtraConfigProcessor.get_table_name(conversion, table_name, should_get_original=True)
+    rows = get_catalog_snapshot(conversion).get_foreign_keys(original_table_name)
     extra_rows = ExtraConfigProcessor.parse_foreign_keys(conversion, table_name)
-    full_rows = (result.data or []) + extra_rows
-    _set_foreign_keys_for_given_table(conversion, table_name, full_rows)
-    msg = (f'[{_get_foreign_keys_metadata.__name__}]'
-           f' Foreign keys for table "{conversion.schema}"."{table_name}" are set...')
-
-    log(conversion, msg)
+    return _get_constraints(conversion, table_name, rows + extra_rows)
 
 
-def _set_foreign_keys_for_given_table(
+def _get_constraints(
     conversion: Conversion,
     table_name: str,
     rows: list[dict]
-) -> None:
+) -> dict[str, dict[str, Union[str, list[str]]]]:
     """
-    Sets foreign keys for given table.
+    Groups given foreign keys columns by constraints.
     """
     constraints: dict[str, dict[str, Union[str, list[str]]]] = {}
     original_table_name = ExtraConfigProcessor.get_table_name(conversion, table_name, should_get_original=True)
@@ -139,7 +88,7 @@ def _set_foreign_keys_for_given_table(
 
             constraint_column_name.append(f'"{current_column_name}"')
             constraint_referenced_column_name.append(f'"{current_referenced_column_name}"')
-            return
+            continue
 
         constraints[row['CONSTRAINT_NAME']] = {}
         constraints[row['CONSTRAINT_NAME']]['column_name'] = [f'"{current_column_name}"']
@@ -148,33 +97,87 @@ def _set_foreign_keys_for_given_table(
         constraints[row['CONSTRAINT_NAME']]['update_rule'] = row['UPDATE_RULE']
         constraints[row['CONSTRAINT_NAME']]['delete_rule'] = row['DELETE_RULE']
 
-    params = [[conversion, constraints, foreign_key, table_name] for foreign_key in constraints.keys()]
-    conversion.run_concurrently(func=_set_single_foreign_key, params_list=params)
+    return constraints
 
 
-def _set_single_foreign_key(
+def set_foreign_key(
     conversion: Conversion,
-    constraints: dict,
-    foreign_key: dict,
-    table_name: str
-) -> None:
+    table_name: str,
+    constraint_name: str,
+    constraint: dict
+) -> bool:
     """
     Creates a single foreign key.
+    In "foreign_keys_not_valid" mode, the foreign key is created as "NOT VALID", so existing rows are not checked,
+    and must be validated later by "validate_foreign_key".
+    Returns true on success.
     """
-    foreign_key_column_names = ','.join(constraints[foreign_key]['column_name'])
-    referenced_table_name = constraints[foreign_key]['referenced_table_name']
-    referenced_column_names = ','.join(constraints[foreign_key]['referenced_column_name'])
-    update_rule = constraints[foreign_key]['update_rule']
-    delete_rule = constraints[foreign_key]['delete_rule']
-    sql = (f'ALTER TABLE "{conversion.schema}"."{table_name}" ADD FOREIGN KEY ({foreign_key_column_names})'
+    foreign_key_column_names = ','.join(constraint['column_name'])
+    referenced_table_name = constraint['referenced_table_name']
+    referenced_column_names = ','.join(constraint['referenced_column_name'])
+    update_rule = constraint['update_rule']
+    delete_rule = constraint['delete_rule']
+    sql_add_constraint = (f'ADD CONSTRAINT "{constraint_name}" FOREIGN KEY'
+                          if conversion.foreign_keys_not_valid
+                          else 'ADD FOREIGN KEY')
+
+    sql_not_valid = ' NOT VALID' if conversion.foreign_keys_not_valid else ''
+    sql = (f'ALTER TABLE "{conversion.schema}"."{table_name}" {sql_add_constraint} ({foreign_key_column_names})'
            f' REFERENCES "{conversion.schema}"."{referenced_table_name}"({referenced_column_names})'
-           f' ON UPDATE {update_rule} ON DELETE {delete_rule};')
+           f' ON UPDATE {update_rule} ON DELETE {delete_rule}{sql_not_valid};')
 
-    DBAccess.query(
+    result = DBAccess.query(
         conversion=conversion,
-        caller=_set_single_foreign_key.__name__,
+        caller=set_foreign_key.__name__,
         sql=sql,
         vendor=DBVendor.PG,
         process_exit_on_error=False,
-        should_return_client=False
+        should_return_client=False,
+        should_return_programming_error=True
     )
+
+    return not result.error
+
+
+def validate_foreign_key(
+    conversion: Conversion,
+    table_name: str,
+    constraint_name: str,
+    foreign_key_created: Future
+) -> None:
+    """
+    Validates given "NOT VALID" foreign key, once it is created.
+    Notice:
+    1. VALIDATE CONSTRAINT locks the table in SHARE UPDATE EXCLUSIVE mode only,
+       so it does not block other tables' validations, and reads/writes of the table itself.
+    2. A number of simultaneous validations is limited by "foreign_keys_validation_concurrency".
+    """
+    if not foreign_key_created.result():
+        msg = (f'[{validate_foreign_key.__name__}] Foreign key "{constraint_name}"'
+               f' of "{conversion.schema}"."{table_name}" is not created, so it is not validated')
+
+        log(conversion, msg)
+        return
+
+    with conversion.foreign_keys_validation_semaphore:
+        validation_begin = time.time()
+        result = DBAccess.query(
+            conversion=conversion,
+            caller=validate_foreign_key.__name__,
+            sql=f'ALTER TABLE "{conversion.schema}"."{table_name}" VALIDATE CONSTRAINT "{constraint_name}";',
+            vendor=DBVendor.PG,
+            process_exit_on_error=False,
+            should_return_client=False,
+            should_return_programming_error=True
+        )
+
+        validation_time = time.time() - validation_begin
+
+    if result.error:
+        return
+
+    conversion.foreign_keys_validation_times[f'{table_name}.{constraint_name}'] = validation_time
+    msg = (f'[{validate_foreign_key.__name__}] Foreign key "{constraint_name}"'
+           f' of "{conversion.schema}"."{table_name}" is validated in {validation_time:.2f} seconds')
+
+    log(conversion, msg)
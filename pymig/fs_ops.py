@@ -20,6 +20,7 @@ import json
 from typing import Optional, cast
 
 from pymig.conversion import Conversion
+from pymig.log_pipeline import emit
 
 
 def create_logs_directory(conversion: Conversion) -> None:
@@ -29,6 +30,12 @@ def create_logs_directory(conversion: Conversion) -> None:
     _create_directory(conversion.logs_dir_path, create_logs_directory.__name__)
     _create_directory(conversion.not_created_views_path, create_logs_directory.__name__)
 
+    if conversion.profiling_modes:
+        _create_directory(conversion.profiles_dir_path, create_logs_directory.__name__)
+
+    if conversion.trace:
+        _create_directory(conversion.traces_dir_path, create_logs_directory.__name__)
+
 
 def _create_directory(directory_path: str, log_title: str) -> None:
     """
@@ -69,24 +76,34 @@ def _get_logs_prefix() -> str:
 def generate_error(conversion: Conversion, message: str, sql: str = '') -> None:
     """
     Writes a detailed error message to the "/errors-only.log" file.
+    Notice, errors are printed to the console even in "quiet_console" mode.
     """
     message = _get_logs_prefix() + message + (f'\n\n\tSQL: {sql}\n\n' if sql else '')
-    log(conversion, message)
-    write_to_file(conversion.error_logs_path, 'a', message)
+    log(conversion, message, is_console_output_forced=True)
+    emit(conversion.error_logs_path, message)
 
 
-def log(conversion: Conversion, message: str, table_log_path: Optional[str] = None) -> None:
+def log(
+    conversion: Conversion,
+    message: str,
+    table_log_path: Optional[str] = None,
+    is_console_output_forced: bool = False
+) -> None:
     """
-    Outputs given log.
+    Outputs given log, unless running in "quiet_console" mode.
     Writes given log to the "/all.log" file.
     If necessary, writes given log to the "/{tableName}.log" file.
+    Notice, the files are written by the log pipeline (when started), see "pymig.log_pipeline".
     """
     message = _get_logs_prefix() + message
-    print(message)
-    write_to_file(conversion.all_logs_path, 'a', f'\n{message}\n')
+
+    if is_console_output_forced or not conversion.quiet_console:
+        print(message)
+
+    emit(conversion.all_logs_path, f'\n{message}\n')
 
     if table_log_path:
-        write_to_file(table_log_path, 'a', f'\n{message}\n')
+        emit(table_log_path, f'\n{message}\n')
 
 
 def read_config(base_dir: str, config_file_name: str = 'config.json') -> dict:
@@ -0,0 +1,244 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+import itertools
+import threading
+from queue import PriorityQueue
+from concurrent.futures import Future
+from typing import Optional, Any, cast
+
+from psycopg2.extensions import connection as PgConnection
+
+import pymig.db_access as DBAccess
+from pymig.db_vendor import DBVendor
+from pymig.fs_ops import log, generate_error
+from pymig.conversion import Conversion
+from pymig.tracer import trace_span, get_sql_args
+
+# Guards lazy creation of the scheduler, since tables' constraints may be processed concurrently.
+_scheduler_lock = threading.Lock()
+
+
+class IndexBuildScheduler:
+    """
+    Builds indexes of all tables through a single, global, priority queue.
+    1. Indexes of larger tables are built first, and PK is built before other indexes of the same table.
+    2. A number of simultaneous builds is limited by "index_build_memory_budget" / "maintenance_work_mem",
+       so that builds do not compete for memory and I/O.
+    3. Each builder thread holds its own PostgreSQL session,
+       configured once with "maintenance_work_mem" and "max_parallel_maintenance_workers".
+    """
+    # Is placed into the queue per each builder thread on shutdown.
+    # Notice, it has the lowest priority, so all the pending builds are processed first.
+    _SHUTDOWN_PRIORITY = (float('inf'), float('inf'))
+
+    _conversion: Conversion
+    _queue: PriorityQueue
+    _sequence: itertools.count
+    _threads: list[threading.Thread]
+    _lock: threading.Lock
+    _builds_left: dict[str, int]
+    _table_futures: dict[str, Future]
+
+    __slots__ = ('_conversion', '_queue', '_sequence', '_threads', '_lock', '_builds_left', '_table_futures',)
+
+    def __init__(self, conversion: Conversion):
+        """
+        Class constructor.
+        Starts builder threads.
+        """
+        self._conversion = conversion
+        self._queue = PriorityQueue()
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._builds_left = {}
+        self._table_futures = {}
+        self._threads = [
+            threading.Thread(target=self._run_builder, name=f'index-builder-{thread_id}', daemon=True)
+            for thread_id in range(get_concurrency(conversion))
+        ]
+
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, table_name: str, statements: list[tuple[bool, str]]) -> Future:
+        """
+        Schedules given table's index builds.
+        "statements" is a list of tuples (is_primary_key, sql).
+        Returns a Future, which is resolved with the table name, when all the table's indexes are built.
+        """
+        table_future: Future = Future()
+        table_size = _get_table_size(self._conversion, table_name)
+
+        with self._lock:
+            self._builds_left[table_name] = len(statements)
+            self._table_futures[table_name] = table_future
+
+        for is_primary_key, sql in statements:
+            priority = (-table_size, 0 if is_primary_key else 1)
+            self._queue.put((priority, next(self._sequence), table_name, sql))
+
+        return table_future
+
+    def shutdown(self) -> None:
+        """
+        Waits for all scheduled index builds to complete, and stops builder threads.
+        """
+        for _ in self._threads:
+            self._queue.put((self._SHUTDOWN_PRIORITY, next(self._sequence), '', ''))
+
+        for thread in self._threads:
+            thread.join()
+
+    def _run_builder(self) -> None:
+        """
+        Builds indexes from the queue, one at a time, using a dedicated PostgreSQL session.
+        """
+        pg_client: Optional[PgConnection] = None
+
+        while True:
+            priority, _, table_name, sql = self._queue.get()
+
+            if priority == self._SHUTDOWN_PRIORITY:
+                break
+
+            try:
+                if pg_client is None:
+                    pg_client = _open_index_build_session(self._conversion)
+
+                with trace_span(self._conversion, f'index build "{table_name}"', 'pg', get_sql_args(sql)):
+                    pg_cursor = pg_client.cursor()
+                    pg_cursor.execute(sql)  # type: ignore
+                    pg_client.commit()  # type: ignore
+                    pg_cursor.close()  # type: ignore
+            except Exception as e:
+                generate_error(self._conversion, f'[{self._run_builder.__name__}] {repr(e)}', sql)
+                pg_client = self._reset_session(pg_client)
+            finally:
+                self._complete_build(table_name)
+
+        if pg_client is not None:
+            pg_client.close()  # type: ignore
+
+    def _reset_session(self, pg_client: Optional[PgConnection]) -> Optional[PgConnection]:
+        """
+        Rolls back current transaction of given index build session.
+        Returns None, if the session is broken (the rollback fails, or the connection is closed),
+        so that the next build opens a new session.
+        """
+        if pg_client is None:
+            return None
+
+        try:
+            if not pg_client.closed:
+                pg_client.rollback()  # type: ignore
+                return pg_client
+        except Exception as e:
+            generate_error(self._conversion, f'[{self._reset_session.__name__}] {type(e).__name__} {repr(e)}')
+
+        try:
+            pg_client.close()  # type: ignore
+        except Exception:
+            pass  # The connection is broken anyway.
+
+        return None
+
+    def _complete_build(self, table_name: str) -> None:
+        """
+        Marks one of given table's builds as completed.
+        Resolves the table's Future, once the last build is completed.
+        """
+        with self._lock:
+            self._builds_left[table_name] -= 1
+
+            if self._builds_left[table_name] != 0:
+                return
+
+            table_future = self._table_futures.pop(table_name)
+            del self._builds_left[table_name]
+
+        table_future.set_result(table_name)
+
+
+def get_concurrency(conversion: Conversion) -> int:
+    """
+    Returns a number of simultaneous index builds, that fits the memory budget.
+    """
+    concurrency = conversion.index_build_memory_budget // max(1, conversion.maintenance_work_mem)
+    return max(1, min(concurrency, conversion.max_each_db_connection_pool_size))
+
+
+def schedule_index_builds(conversion: Conversion, table_name: str, statements: list[tuple[bool, str]]) -> Future:
+    """
+    Schedules given table's index builds using the global scheduler, which is created on demand.
+    """
+    if not statements:
+        table_future: Future = Future()
+        table_future.set_result(table_name)
+        return table_future
+
+    with _scheduler_lock:
+        if conversion.index_build_scheduler is None:
+            conversion.index_build_scheduler = IndexBuildScheduler(conversion)
+
+        scheduler = conversion.index_build_scheduler
+
+    return scheduler.submit(table_name, statements)
+
+
+def wait_for_index_builds(conversion: Conversion) -> None:
+    """
+    Waits for all scheduled index builds to complete.
+    """
+    with _scheduler_lock:
+        scheduler, conversion.index_build_scheduler = conversion.index_build_scheduler, None
+
+    if scheduler is not None:
+        scheduler.shutdown()
+        log(conversion, f'[{wait_for_index_builds.__name__}] All PK/indices are set')
+
+
+def _open_index_build_session(conversion: Conversion) -> PgConnection:
+    """
+    Opens PostgreSQL session, dedicated to building indexes.
+    """
+    pg_client = DBAccess.get_pg_dedicated_client(conversion)
+    pg_cursor = pg_client.cursor()
+    sql = (f"SET maintenance_work_mem = '{conversion.maintenance_work_mem}MB';"
+           f' SET max_parallel_maintenance_workers = {conversion.max_parallel_maintenance_workers};')
+
+    pg_cursor.execute(sql)  # type: ignore
+    pg_cursor.close()  # type: ignore
+    pg_client.commit()  # type: ignore
+    return pg_client
+
+
+def _get_table_size(conversion: Conversion, table_name: str) -> int:
+    """
+    Returns given table's size (in bytes).
+    """
+    result = DBAccess.query(
+        conversion=conversion,
+        caller=_get_table_size.__name__,
+        sql=f'SELECT pg_relation_size(\'"{conversion.schema}"."{table_name}"\') AS table_size;',
+        vendor=DBVendor.PG,
+        process_exit_on_error=False,
+        should_return_client=False
+    )
+
+    result_data = cast(list[dict[str, Any]], result.data)
+    return int(result_data[0]['table_size']) if result_data else 0
@@ -15,34 +15,24 @@ __license__ = """
     along with this program (please see the "LICENSE.md" file).
     If not, see <http://www.gnu.org/licenses/gpl.txt>.
 """
-from typing import Union, cast, Any
+from typing import Union, cast
+from concurrent.futures import Future
 
 import pymig.extra_config_processor as ExtraConfigProcessor
-import pymig.db_access as DBAccess
 from pymig.conversion import Conversion
 from pymig.fs_ops import log
-from pymig.db_vendor import DBVendor
+from pymig.index_build_scheduler import schedule_index_builds
+from pymig.catalog_snapshot import get_catalog_snapshot
 
 
-def create_indexes(conversion: Conversion, table_name: str) -> None:
+def create_indexes(conversion: Conversion, table_name: str) -> Future:
     """
-    Creates indexes, including PK, on given table.
+    Schedules creation of indexes, including PK, on given table.
+    Returns a Future, which is resolved when all the table's indexes are created.
     """
     original_table_name = ExtraConfigProcessor.get_table_name(conversion, table_name, should_get_original=True)
-    show_index_result = DBAccess.query(
-        conversion=conversion,
-        caller=create_indexes.__name__,
-        sql=f'SHOW INDEX FROM `{original_table_name}`;',
-        vendor=DBVendor.MYSQL,
-        process_exit_on_error=False,
-        should_return_client=False
-    )
-
-    if show_index_result.error:
-        return
-
     pg_indexes: dict[str, dict[str, Union[str, int, list[str]]]] = {}
-    show_index_result_data = cast(list[dict[str, Any]], show_index_result.data)
+    show_index_result_data = get_catalog_snapshot(conversion).get_indexes(original_table_name)
 
     for index in show_index_result_data:
         pg_column_name = ExtraConfigProcessor.get_column_name(
@@ -62,34 +52,35 @@ def create_indexes(conversion: Conversion, table_name: str) -> None:
             'index_type': f' USING {_get_index_type(conversion=conversion, index_type=index["Index_type"])}',
         }
 
-    params = [
-        [conversion, index_name, table_name, pg_indexes, idx]
+    statements = [
+        (index_name.lower() == 'primary', _get_index_sql(conversion, index_name, table_name, pg_indexes, idx))
         for idx, index_name in enumerate(pg_indexes.keys())
     ]
 
-    conversion.run_concurrently(func=_set_index, params_list=params)
+    table_future = schedule_index_builds(conversion, table_name, statements)
     msg = f'[{create_indexes.__name__}] "{conversion.schema}"."{table_name}": PK/indices are successfully set...'
-    log(conversion, msg, conversion.dic_tables[table_name].table_log_path)
+    table_future.add_done_callback(lambda _: log(conversion, msg, conversion.dic_tables[table_name].table_log_path))
+    return table_future
 
 
-def _set_index(
+def _get_index_sql(
     conversion: Conversion,
     index_name: str,
     table_name: str,
-    pg_indexes: dict[str, Union[str, bool]],
+    pg_indexes: dict[str, dict[str, Union[str, int, list[str]]]],
     idx: int
-) -> None:
+) -> str:
     """
-    Sets appropriate index.
+    Returns a statement, that sets appropriate index.
     """
     sql_add_index = ''
 
     if index_name.lower() == 'primary':
-        column_names_list = cast(dict[str, Union[str, int, list[str]]], pg_indexes[index_name])
+        column_names_list = pg_indexes[index_name]
         primary_key = ','.join(cast(list[str], column_names_list['column_name']))
         sql_add_index += f'ALTER TABLE "{conversion.schema}"."{table_name}" ADD PRIMARY KEY({primary_key});'
     else:
-        pg_index_name = cast(dict[str, Union[str, int, list[str]]], pg_indexes[index_name])
+        pg_index_name = pg_indexes[index_name]
         column_name_list = cast(list[str], pg_index_name['column_name'])
         column_name = f"{column_name_list[0][1:-1]}{str(idx)}"
         index_type = 'UNIQUE' if pg_index_name['is_unique'] else ''
@@ -99,14 +90,7 @@ def _set_index(
         sql_add_index += f" {pg_index_name['index_type']} "
         sql_add_index += f"({','.join(cast(list[str], pg_index_name['column_name']))});"
 
-    DBAccess.query(
-        conversion=conversion,
-        caller=_set_index.__name__,
-        sql=sql_add_index,
-        vendor=DBVendor.PG,
-        process_exit_on_error=False,
-        should_return_client=False
-    )
+    return sql_add_index
 
 
 def _get_index_type(conversion: Conversion, index_type: str) -> str:
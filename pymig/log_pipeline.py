@@ -0,0 +1,161 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+import os
+import queue
+import atexit
+import threading
+import multiprocessing
+from typing import Any, Optional
+
+# Maximal number of records, written by a single batch.
+_BATCH_SIZE = 10000
+
+# Maximal time (in seconds) a record may wait in the queue before it is written.
+_FLUSH_INTERVAL = 0.5
+
+# Number of rotated files kept for each log.
+_ROTATED_FILES_CNT = 5
+
+# Queue of (path, text) records, shared by the main process and all its descendants.
+# Notice, it is None, until the pipeline is started (or attached to), and then records are written directly.
+_log_queue: Optional[Any] = None
+
+_writer_thread: Optional[threading.Thread] = None
+
+
+def start_log_pipeline(rotation_size: int) -> None:
+    """
+    Starts the log writer thread in the main process.
+    From now on, log records of the main process, and of the processes attached to the pipeline,
+    are passed through a queue, and written into files by a single writer in batches.
+    Files, larger than "rotation_size" bytes, are rotated. Zero "rotation_size" means no rotation.
+    """
+    global _log_queue, _writer_thread
+    _log_queue = multiprocessing.Queue()
+    _writer_thread = threading.Thread(target=_write_records, args=(_log_queue, rotation_size), daemon=True)
+    _writer_thread.start()
+    atexit.register(stop_log_pipeline)
+
+
+def stop_log_pipeline() -> None:
+    """
+    Writes all pending records, and stops the log writer thread.
+    """
+    global _log_queue, _writer_thread
+
+    if _log_queue is None or _writer_thread is None:
+        return
+
+    _log_queue.put(None)
+    _writer_thread.join()
+    _log_queue, _writer_thread = None, None
+
+
+def get_log_queue() -> Optional[Any]:
+    """
+    Returns the queue of current process, which is passed to child processes, see "attach_log_pipeline".
+    """
+    return _log_queue
+
+
+def attach_log_pipeline(log_queue: Optional[Any]) -> None:
+    """
+    Makes current (child) process send its log records to the main process's writer, through given queue.
+    """
+    global _log_queue
+    _log_queue = log_queue
+
+
+def emit(path: str, text: str) -> None:
+    """
+    Appends given text to the file under given path, either through the pipeline, or directly.
+    """
+    if _log_queue is not None:
+        _log_queue.put((path, text))
+        return
+
+    with open(path, 'a') as file:
+        file.write(text)
+
+
+def _write_records(log_queue: Any, rotation_size: int) -> None:
+    """
+    Collects log records from given queue, and writes them in batches: each file is opened once per batch.
+    """
+    files_sizes: dict[str, int] = {}
+    is_stopped = False
+
+    while not is_stopped:
+        try:
+            record = log_queue.get(timeout=_FLUSH_INTERVAL)
+        except queue.Empty:
+            continue
+
+        records: list[tuple[str, str]] = []
+
+        while record is not None:
+            records.append(record)
+
+            if len(records) >= _BATCH_SIZE:
+                break
+
+            try:
+                record = log_queue.get_nowait()
+            except queue.Empty:
+                break
+
+        is_stopped = record is None
+        texts_by_path: dict[str, list[str]] = {}
+
+        for path, text in records:
+            texts_by_path.setdefault(path, []).append(text)
+
+        for path, texts in texts_by_path.items():
+            _write_batch(path, ''.join(texts), rotation_size, files_sizes)
+
+
+def _write_batch(path: str, text: str, rotation_size: int, files_sizes: dict[str, int]) -> None:
+    """
+    Appends given text to given file, rotating the file, if it grows larger than "rotation_size" bytes.
+    """
+    if path not in files_sizes:
+        files_sizes[path] = os.path.getsize(path) if os.path.exists(path) else 0
+
+    if rotation_size > 0 and files_sizes[path] > 0 and files_sizes[path] + len(text) > rotation_size:
+        _rotate(path)
+        files_sizes[path] = 0
+
+    try:
+        with open(path, 'a') as file:
+            file.write(text)
+    except Exception as e:
+        print(f'\t--[{_write_batch.__name__}] Failed to write into {path} due to {repr(e)}')
+
+    files_sizes[path] += len(text)
+
+
+def _rotate(path: str) -> None:
+    """
+    Renames given file to "{path}.1", shifting previously rotated files: "{path}.1" to "{path}.2", and so on.
+    The oldest rotated file is removed.
+    """
+    for index in range(_ROTATED_FILES_CNT - 1, 0, -1):
+        if os.path.exists(f'{path}.{index}'):
+            os.replace(f'{path}.{index}', f'{path}.{index + 1}')
+
+    os.replace(path, f'{path}.1')
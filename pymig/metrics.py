@@ -0,0 +1,457 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+import os
+import json
+import time
+import queue
+import atexit
+import threading
+import multiprocessing
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Optional
+
+from pymig.conversion import Conversion
+from pymig.metrics_export import MetricsExport
+
+# Upper bounds (in seconds) of histograms buckets.
+_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float('inf'))
+
+# Prefix of all metric names in Prometheus text format.
+_PROMETHEUS_PREFIX = 'pymig_'
+
+# Queue of metric events, shared by the main process and all its descendants.
+# Notice, it is None, unless metrics export is enabled, and then all the recording functions are no-ops.
+_metrics_queue: Optional[Any] = None
+
+_collector_thread: Optional[threading.Thread] = None
+
+_http_server: Optional[ThreadingHTTPServer] = None
+
+
+class Histogram:
+    """
+    Cumulative histogram of observed durations (in seconds).
+    """
+    counts: list[int]
+    count: int
+    sum: float
+    max: float
+
+    __slots__ = ('counts', 'count', 'sum', 'max')
+
+    def __init__(self) -> None:
+        """
+        Class constructor.
+        """
+        self.counts = [0] * len(_BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Adds given value to the histogram.
+        """
+        for index, upper_bound in enumerate(_BUCKETS):
+            if value <= upper_bound:
+                self.counts[index] += 1
+
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def to_dict(self) -> dict:
+        """
+        Returns JSON-serializable representation of the histogram.
+        """
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'avg': round(self.sum / self.count, 6) if self.count else 0.0,
+            'max': round(self.max, 6),
+            'buckets': {_format_bound(bound): cnt for bound, cnt in zip(_BUCKETS, self.counts)},
+        }
+
+
+class MetricsRegistry:
+    """
+    Aggregates metric events of the migration run, per table and globally.
+    Notice:
+    1. Global values are stored under the empty table name.
+    2. Rates are recalculated by "update_rates" once per export interval.
+    """
+    started_at: float
+    counters: dict[str, dict[str, float]]
+    gauges: dict[str, dict[str, float]]
+    histograms: dict[str, dict[str, Histogram]]
+    rates: dict[str, dict[str, float]]
+    last_progress_at: dict[str, float]
+    _previous_counters: dict[str, dict[str, float]]
+    _previous_rates_update_at: float
+    lock: threading.Lock
+
+    __slots__ = (
+        'started_at', 'counters', 'gauges', 'histograms', 'rates', 'last_progress_at', '_previous_counters',
+        '_previous_rates_update_at', 'lock',
+    )
+
+    def __init__(self) -> None:
+        """
+        Class constructor.
+        """
+        self.started_at = time.time()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self.rates = {}
+        self.last_progress_at = {}
+        self._previous_counters = {}
+        self._previous_rates_update_at = self.started_at
+        self.lock = threading.Lock()
+
+    def apply(self, event: tuple[str, str, str, float]) -> None:
+        """
+        Applies given event (kind, table name, metric name, value) to the registry.
+        Counters and histograms are aggregated both per table and globally.
+        """
+        kind, table_name, name, value = event
+
+        if kind == 'set':
+            self.gauges.setdefault(table_name, {})[name] = value
+            return
+
+        if kind == 'add':
+            gauges = self.gauges.setdefault(table_name, {})
+            gauges[name] = gauges.get(name, 0) + value
+            return
+
+        for key in {table_name, ''}:
+            if kind == 'increment':
+                counters = self.counters.setdefault(key, {})
+                counters[name] = counters.get(name, 0) + value
+            else:
+                self.histograms.setdefault(key, {}).setdefault(name, Histogram()).observe(value)
+
+        if kind == 'increment' and name == 'rows_loaded_total':
+            self.last_progress_at[table_name] = time.time()
+
+    def update_rates(self) -> None:
+        """
+        Calculates rows/s and bytes/s since the previous call, and since the beginning of the run.
+        """
+        now = time.time()
+        interval = max(now - self._previous_rates_update_at, 1e-6)
+        elapsed = max(now - self.started_at, 1e-6)
+
+        for key, counters in self.counters.items():
+            previous_counters = self._previous_counters.get(key, {})
+            rates = self.rates.setdefault(key, {})
+
+            for counter_name, rate_name in (('rows_loaded_total', 'rows'), ('bytes_transferred_total', 'bytes')):
+                value = counters.get(counter_name, 0)
+                rates[f'{rate_name}_per_second'] = (value - previous_counters.get(counter_name, 0)) / interval
+                rates[f'{rate_name}_per_second_average'] = value / elapsed
+
+        self._previous_counters = {key: dict(counters) for key, counters in self.counters.items()}
+        self._previous_rates_update_at = now
+
+    def get_derived_gauges(self, table_name: str) -> dict[str, float]:
+        """
+        Returns gauges, calculated upon request:
+        1. "seconds_since_last_progress" - for tables, which are still being loaded.
+        2. "loader_utilization" - a share of busy loader processes (globally).
+        """
+        gauges = self.gauges.get(table_name, {})
+        derived_gauges = {}
+
+        if table_name and gauges.get('data_chunks_pending', 0) > 0:
+            last_progress_at = self.last_progress_at.get(table_name, self.started_at)
+            derived_gauges['seconds_since_last_progress'] = time.time() - last_progress_at
+
+        if not table_name and gauges.get('loader_processes', 0) > 0:
+            derived_gauges['loader_utilization'] = gauges.get('loader_processes_busy', 0) / gauges['loader_processes']
+
+        return derived_gauges
+
+    def to_dict(self) -> dict:
+        """
+        Returns JSON-serializable snapshot of all the metrics.
+        """
+        def get_section(table_name: str) -> dict:
+            gauges = {**self.gauges.get(table_name, {}), **self.get_derived_gauges(table_name)}
+            histograms = self.histograms.get(table_name, {})
+            return {
+                'counters': self.counters.get(table_name, {}),
+                'rates': {name: round(rate, 3) for name, rate in self.rates.get(table_name, {}).items()},
+                'gauges': {name: round(value, 3) for name, value in gauges.items()},
+                'histograms': {name: histogram.to_dict() for name, histogram in histograms.items()},
+            }
+
+        table_names = sorted((set(self.counters) | set(self.gauges) | set(self.histograms)) - {''})
+        return {
+            'timestamp': time.time(),
+            'elapsed_seconds': round(time.time() - self.started_at, 3),
+            'global': get_section(''),
+            'tables': {table_name: get_section(table_name) for table_name in table_names},
+        }
+
+    def to_prometheus(self) -> str:
+        """
+        Returns all the metrics in Prometheus text exposition format.
+        Per table values are labeled by the "table" label, and global values have no labels.
+        """
+        families: dict[str, tuple[str, list[str]]] = {}
+
+        def add_sample(
+            family_name: str,
+            metric_type: str,
+            table_name: str,
+            value: float,
+            suffix: str = '',
+            extra_label: str = ''
+        ) -> None:
+            labels = [f'table="{_escape_label(table_name)}"'] if table_name else []
+            labels += [extra_label] if extra_label else []
+            labels_str = '{' + ','.join(labels) + '}' if labels else ''
+            samples = families.setdefault(_PROMETHEUS_PREFIX + family_name, (metric_type, []))[1]
+            samples.append(f'{_PROMETHEUS_PREFIX}{family_name}{suffix}{labels_str} {value}')
+
+        for table_name in sorted(set(self.counters) | set(self.gauges) | set(self.histograms) | set(self.rates)):
+            for name, value in self.counters.get(table_name, {}).items():
+                add_sample(name, 'counter', table_name, value)
+
+            gauges = {
+                **self.gauges.get(table_name, {}),
+                **self.rates.get(table_name, {}),
+                **self.get_derived_gauges(table_name),
+            }
+
+            for name, value in gauges.items():
+                add_sample(name, 'gauge', table_name, value)
+
+            for name, histogram in self.histograms.get(table_name, {}).items():
+                for bound, cnt in zip(_BUCKETS, histogram.counts):
+                    add_sample(name, 'histogram', table_name, cnt, '_bucket', f'le="{_format_bound(bound)}"')
+
+                add_sample(name, 'histogram', table_name, histogram.sum, '_sum')
+                add_sample(name, 'histogram', table_name, histogram.count, '_count')
+
+        lines = []
+
+        for family_name, (metric_type, samples) in families.items():
+            lines.append(f'# TYPE {family_name} {metric_type}')
+            lines.extend(samples)
+
+        return '\n'.join(lines) + '\n'
+
+
+def start_metrics(conversion: Conversion) -> None:
+    """
+    Starts the metrics collector thread in the main process, unless metrics export is disabled.
+    The collector aggregates metric events of the main process, and of the processes attached to the metrics
+    (see "attach_metrics"), and either rewrites the "/metrics.json" file once per "metrics_export_interval",
+    or serves the metrics in Prometheus text format on "metrics_host":"metrics_port".
+    """
+    global _metrics_queue, _collector_thread, _http_server
+
+    if conversion.metrics_export == MetricsExport.DISABLED:
+        return
+
+    registry = MetricsRegistry()
+
+    if conversion.metrics_export == MetricsExport.PROMETHEUS:
+        server_address = (conversion.metrics_host, conversion.metrics_port)
+        _http_server = ThreadingHTTPServer(server_address, _get_request_handler(registry))
+        _http_server.daemon_threads = True
+        threading.Thread(target=_http_server.serve_forever, daemon=True).start()
+
+    _metrics_queue = multiprocessing.Queue()
+    _collector_thread = threading.Thread(
+        target=_collect,
+        args=(
+            _metrics_queue,
+            registry,
+            conversion.metrics_export,
+            conversion.metrics_path,
+            conversion.metrics_export_interval,
+        ),
+        daemon=True,
+    )
+
+    _collector_thread.start()
+    atexit.register(stop_metrics)
+
+
+def stop_metrics() -> None:
+    """
+    Applies all pending metric events, exports the final values, and stops the collector.
+    """
+    global _metrics_queue, _collector_thread, _http_server
+
+    if _metrics_queue is None or _collector_thread is None:
+        return
+
+    _metrics_queue.put(None)
+    _collector_thread.join()
+
+    if _http_server is not None:
+        _http_server.shutdown()
+        _http_server.server_close()
+
+    _metrics_queue, _collector_thread, _http_server = None, None, None
+
+
+def get_metrics_queue() -> Optional[Any]:
+    """
+    Returns the queue of current process, which is passed to child processes, see "attach_metrics".
+    """
+    return _metrics_queue
+
+
+def attach_metrics(metrics_queue: Optional[Any]) -> None:
+    """
+    Makes current (child) process send its metric events to the main process's collector, through given queue.
+    """
+    global _metrics_queue
+    _metrics_queue = metrics_queue
+
+
+def increment(table_name: str, name: str, value: float = 1) -> None:
+    """
+    Increments given counter of given table (and the global one).
+    """
+    if _metrics_queue is not None:
+        _metrics_queue.put(('increment', table_name, name, value))
+
+
+def observe(table_name: str, name: str, value: float) -> None:
+    """
+    Adds given value (in seconds) to given histogram of given table (and to the global one).
+    """
+    if _metrics_queue is not None:
+        _metrics_queue.put(('observe', table_name, name, value))
+
+
+def set_gauge(table_name: str, name: str, value: float) -> None:
+    """
+    Sets given gauge of given table. Empty table name stands for a global gauge.
+    """
+    if _metrics_queue is not None:
+        _metrics_queue.put(('set', table_name, name, value))
+
+
+def add_to_gauge(table_name: str, name: str, value: float) -> None:
+    """
+    Adds given value (may be negative) to given gauge of given table. Empty table name stands for a global gauge.
+    """
+    if _metrics_queue is not None:
+        _metrics_queue.put(('add', table_name, name, value))
+
+
+def _collect(
+    metrics_queue: Any,
+    registry: MetricsRegistry,
+    metrics_export: MetricsExport,
+    metrics_path: str,
+    export_interval: float
+) -> None:
+    """
+    Applies metric events from given queue to given registry, and exports the metrics once per "export_interval".
+    """
+    next_export_at = time.time() + export_interval
+    is_stopped = False
+
+    while not is_stopped:
+        try:
+            event = metrics_queue.get(timeout=max(next_export_at - time.time(), 0.01))
+        except queue.Empty:
+            event = ()
+
+        if event is None:
+            is_stopped = True
+        elif event:
+            with registry.lock:
+                registry.apply(event)
+
+        if is_stopped or time.time() >= next_export_at:
+            with registry.lock:
+                registry.update_rates()
+
+            if metrics_export == MetricsExport.JSON:
+                _write_json(registry, metrics_path)
+
+            next_export_at = time.time() + export_interval
+
+
+def _write_json(registry: MetricsRegistry, metrics_path: str) -> None:
+    """
+    Rewrites the metrics file.
+    Notice, the file is replaced atomically, so readers never see a partially written file.
+    """
+    with registry.lock:
+        metrics = registry.to_dict()
+
+    try:
+        temporary_path = f'{metrics_path}.tmp'
+
+        with open(temporary_path, 'w') as file:
+            json.dump(metrics, file, indent=4)
+
+        os.replace(temporary_path, metrics_path)
+    except Exception as e:
+        print(f'\t--[{_write_json.__name__}] Failed to write into {metrics_path} due to {repr(e)}')
+
+
+def _get_request_handler(registry: MetricsRegistry) -> type[BaseHTTPRequestHandler]:
+    """
+    Returns HTTP request handler class, serving given registry in Prometheus text format on "/metrics".
+    """
+    class MetricsRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+
+            with registry.lock:
+                body = registry.to_prometheus().encode('utf-8')
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            # Scrapes must not pollute the console.
+            pass
+
+    return MetricsRequestHandler
+
+
+def _format_bound(bound: float) -> str:
+    """
+    Formats given histogram bucket bound, as Prometheus does.
+    """
+    return '+Inf' if bound == float('inf') else repr(bound)
+
+
+def _escape_label(value: str) -> str:
+    """
+    Escapes given label value for Prometheus text format.
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
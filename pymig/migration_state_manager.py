@@ -15,12 +15,13 @@ __license__ = """
     along with this program (please see the "LICENSE.md" file).
     If not, see <http://www.gnu.org/licenses/gpl.txt>.
 """
-from typing import Any, cast
+from typing import Any, Optional, cast
 
 import pymig.db_access as DBAccess
 from pymig.db_vendor import DBVendor
 from pymig.fs_ops import log
 from pymig.conversion import Conversion
+from pymig.tracer import traced
 
 
 def get_state_logs_table_name(conversion: Conversion) -> str:
@@ -37,6 +38,13 @@ def get_data_pool_table_name(conversion: Conversion) -> str:
     return f'"{conversion.schema}"."data_pool_{conversion.schema}{conversion.mysql_db_name}"'
 
 
+def get_progress_ledger_table_name(conversion: Conversion) -> str:
+    """
+    Returns progress-ledger table name.
+    """
+    return f'"{conversion.schema}"."progress_ledger_{conversion.schema}{conversion.mysql_db_name}"'
+
+
 def get(conversion: Conversion, param: str) -> bool:
     """
     Retrieves appropriate state-log.
@@ -105,6 +113,135 @@ def drop_data_pool_table(conversion: Conversion) -> None:
     log(conversion, f'[{drop_data_pool_table.__name__}] table {table_name} is dropped...')
 
 
+def create_progress_ledger_table(conversion: Conversion) -> None:
+    """
+    Creates progress-ledger temporary table.
+    The ledger keeps a loading progress of each data-chunk:
+    1. high_water_mark - the greatest split key value, loaded so far (if the data-chunk is loaded in key order).
+    2. rows_loaded - a number of rows, loaded so far.
+    3. is_completed - defines if the data-chunk is loaded entirely.
+    The ledger is updated within the same transaction as the COPY, which loads the data.
+    Notice, in "load_into_unlogged_tables" mode the ledger is UNLOGGED as well,
+    so it is truncated by a PostgreSQL crash together with the data it describes.
+    """
+    table_name = get_progress_ledger_table_name(conversion)
+    unlogged = 'UNLOGGED ' if conversion.should_load_into_unlogged_tables() else ''
+    sql = (f'CREATE {unlogged}TABLE IF NOT EXISTS {table_name}("data_pool_id" BIGINT PRIMARY KEY,'
+           ' "high_water_mark" BIGINT, "rows_loaded" BIGINT NOT NULL DEFAULT 0,'
+           ' "is_completed" BOOLEAN NOT NULL DEFAULT FALSE);')
+
+    DBAccess.query(
+        conversion=conversion,
+        caller=create_progress_ledger_table.__name__,
+        sql=sql,
+        vendor=DBVendor.PG,
+        process_exit_on_error=True,
+        should_return_client=False
+    )
+
+    log(conversion, f'[{create_progress_ledger_table.__name__}] table {table_name} is created...')
+
+
+def drop_progress_ledger_table(conversion: Conversion) -> None:
+    """
+    Drops progress-ledger temporary table.
+    """
+    table_name = get_progress_ledger_table_name(conversion)
+    DBAccess.query(
+        conversion=conversion,
+        caller=drop_progress_ledger_table.__name__,
+        sql=f'DROP TABLE {table_name};',
+        vendor=DBVendor.PG,
+        process_exit_on_error=False,
+        should_return_client=False
+    )
+
+    log(conversion, f'[{drop_progress_ledger_table.__name__}] table {table_name} is dropped...')
+
+
+def get_data_chunk_progress(conversion: Conversion, data_pool_id: int) -> Optional[dict[str, Any]]:
+    """
+    Returns given data-chunk's progress-ledger record, or None if nothing has been loaded yet.
+    """
+    table_name = get_progress_ledger_table_name(conversion)
+    result = DBAccess.query(
+        conversion=conversion,
+        caller=get_data_chunk_progress.__name__,
+        sql=(f'SELECT high_water_mark, rows_loaded, is_completed FROM {table_name}'
+             f' WHERE data_pool_id = {data_pool_id};'),
+        vendor=DBVendor.PG,
+        process_exit_on_error=True,
+        should_return_client=False
+    )
+
+    records = cast(list[dict[str, Any]], result.data)
+    return records[0] if records else None
+
+
+def reset_data_chunk_progress(conversion: Conversion, data_pool_id: int) -> None:
+    """
+    Removes given data-chunk's progress-ledger record.
+    """
+    table_name = get_progress_ledger_table_name(conversion)
+    DBAccess.query(
+        conversion=conversion,
+        caller=reset_data_chunk_progress.__name__,
+        sql=f'DELETE FROM {table_name} WHERE data_pool_id = {data_pool_id};',
+        vendor=DBVendor.PG,
+        process_exit_on_error=True,
+        should_return_client=False
+    )
+
+
+def delete_table_data_pool_items(conversion: Conversion, table_name: str) -> None:
+    """
+    Deletes completed data-chunks of given table from the data-pool.
+    Notice, data-chunks, which are not loaded entirely, are kept, so they are resumed on the next run.
+    """
+    data_pool_table_name = get_data_pool_table_name(conversion)
+    progress_ledger_table_name = get_progress_ledger_table_name(conversion)
+    sql = (f'DELETE FROM {data_pool_table_name} WHERE metadata->>\'table_name\' = %(table_name)s'
+           f' AND id IN(SELECT data_pool_id FROM {progress_ledger_table_name} WHERE is_completed);')
+
+    DBAccess.query(
+        conversion=conversion,
+        caller=delete_table_data_pool_items.__name__,
+        sql=sql,
+        vendor=DBVendor.PG,
+        process_exit_on_error=False,
+        should_return_client=False,
+        bindings={'table_name': table_name}
+    )
+
+    log(conversion, f'[{delete_table_data_pool_items.__name__}] Deleted "{table_name}" data-chunks from data-pool')
+
+
+def get_incomplete_data_chunks_cnt(conversion: Conversion, table_name: Optional[str] = None) -> int:
+    """
+    Returns a number of data-chunks of given table (or of all tables), which are not loaded entirely.
+    """
+    data_pool_table_name = get_data_pool_table_name(conversion)
+    progress_ledger_table_name = get_progress_ledger_table_name(conversion)
+    table_condition = ' AND dp.metadata->>\'table_name\' = %(table_name)s' if table_name else ''
+    sql = (f'SELECT COUNT(1) AS cnt FROM {data_pool_table_name} dp'
+           f' LEFT JOIN {progress_ledger_table_name} pl ON pl.data_pool_id = dp.id'
+           f' WHERE pl.is_completed IS NOT TRUE{table_condition};')
+
+    result = DBAccess.query(
+        conversion=conversion,
+        caller=get_incomplete_data_chunks_cnt.__name__,
+        sql=sql,
+        vendor=DBVendor.PG,
+        process_exit_on_error=True,
+        should_return_client=False,
+        bindings={'table_name': table_name} if table_name else None
+    )
+
+    records = cast(list[dict[str, Any]], result.data)
+    return int(records[0]['cnt'])
+
+
+@traced('stage')
 def read_data_pool(conversion: Conversion) -> None:
     """
     Reads temporary table ("{schema}"."data_pool_{schema + mysql_db_name}"), and generates data-pool.
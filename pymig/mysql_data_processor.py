@@ -14,3 +14,15 @@ def process_mysql_data(batch: tuple[tuple[str, ...], ...]) -> io.StringIO:
     text_stream.write(rows)
     text_stream.seek(0)
     return text_stream
+
+
+def process_mysql_data_to_string(batch: tuple[tuple[str, ...], ...]) -> str:
+    """
+    Accepts a batch of records from ``MySQLdb``,
+    and returns this batch converted to a string in TSV format.
+    Notice, each record (including the last one) is terminated by a new line,
+    so that consecutive batches can be concatenated.
+    """
+    # Note, the list comprehension below wrapped in square brackets on purpose.
+    # DO NOT strip the brackets, since it will work slower.
+    return '\n'.join(['\t'.join(record) for record in batch]) + '\n'
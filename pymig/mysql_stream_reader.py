@@ -0,0 +1,106 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+from typing import Any, Callable, Union
+
+
+class MySQLStreamReader:
+    """
+    File-like object, that pulls rows from unbuffered MySQL cursor on demand,
+    and returns them formatted for "PostgreSQL COPY".
+    Intended to be passed directly to psycopg2 "copy_expert".
+    """
+    # Amount of data "copy_expert" requests per single "read" call.
+    READ_SIZE = 1024 * 1024
+
+    # Limits of a number of rows, retrieved from MySQL per single "fetchmany" call.
+    MIN_FETCH_SIZE = 1
+    MAX_FETCH_SIZE = 10000
+
+    rows_read: int
+    bytes_read: int
+    _mysql_cursor: Any
+    _encode: Callable[[Any], Union[str, bytes]]
+    _trailer: Union[str, bytes]
+    _buffer: Union[str, bytes]
+    _offset: int
+    _fetch_size: int
+    _is_exhausted: bool
+
+    __slots__ = (
+        'rows_read', 'bytes_read', '_mysql_cursor', '_encode', '_trailer', '_buffer', '_offset', '_fetch_size',
+        '_is_exhausted',
+    )
+
+    def __init__(
+        self,
+        mysql_cursor: Any,
+        encode: Callable[[Any], Union[str, bytes]],
+        header: Union[str, bytes] = '',
+        trailer: Union[str, bytes] = '',
+        fetch_size: int = 100
+    ):
+        """
+        Class constructor.
+        "encode" converts a batch of rows into COPY data (str for text format, bytes for binary format).
+        """
+        self.rows_read = 0
+        self.bytes_read = 0
+        self._mysql_cursor = mysql_cursor
+        self._encode = encode
+        self._trailer = trailer
+        self._buffer = header
+        self._offset = 0
+        self._fetch_size = fetch_size
+        self._is_exhausted = False
+
+    def read(self, size: int = -1) -> Union[str, bytes]:
+        """
+        Returns up to "size" characters (text format) or bytes (binary format) of COPY data.
+        Returns an empty value when all rows are consumed.
+        """
+        while not self._is_exhausted and (size < 0 or len(self._buffer) - self._offset < size):
+            self._fill_buffer()
+
+        end = len(self._buffer) if size < 0 else self._offset + size
+        chunk = self._buffer[self._offset:end]
+        self._offset = min(end, len(self._buffer))
+        return chunk
+
+    def _fill_buffer(self) -> None:
+        """
+        Retrieves next batch of rows, and appends it to the buffer.
+        Fetch size is adjusted, so that each batch roughly fits a single "read" call.
+        """
+        batch = self._mysql_cursor.fetchmany(self._fetch_size)
+        remaining = self._buffer[self._offset:]
+        self._offset = 0
+
+        if not batch:
+            self._is_exhausted = True
+            self._buffer = remaining + self._trailer  # type: ignore
+            return
+
+        encoded_batch = self._encode(batch)
+        self._buffer = remaining + encoded_batch  # type: ignore
+        self.rows_read += len(batch)
+        self.bytes_read += len(encoded_batch)
+        average_row_size = max(1, len(encoded_batch) // len(batch))
+        self._fetch_size = max(
+            self.MIN_FETCH_SIZE,
+            min(self.MAX_FETCH_SIZE, self.READ_SIZE // average_row_size),
+        )
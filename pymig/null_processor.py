@@ -15,38 +15,31 @@ __license__ = """
     along with this program (please see the "LICENSE.md" file).
     If not, see <http://www.gnu.org/licenses/gpl.txt>.
 """
-import pymig.db_access as DBAccess
 import pymig.extra_config_processor as ExtraConfigProcessor
-from pymig.db_vendor import DBVendor
 from pymig.conversion import Conversion
 from pymig.fs_ops import log
 
 
-def process_null(conversion: Conversion, table_name: str) -> None:
+def get_null_clauses(conversion: Conversion, table_name: str) -> list[str]:
     """
     Defines which columns of the given table can contain the "NULL" value.
-    Sets an appropriate constraint.
+    Returns "ALTER TABLE" clauses, that set an appropriate constraint.
     """
-    msg = f'[{process_null.__name__}] Sets "NOT NULL" constraints for table: "{conversion.schema}"."{table_name}"'
+    msg = (f'[{get_null_clauses.__name__}] Defines "NOT NULL" constraints'
+           f' for table: "{conversion.schema}"."{table_name}"')
+
     log(conversion, msg, conversion.dic_tables[table_name].table_log_path)
     original_table_name = ExtraConfigProcessor.get_table_name(conversion, table_name, should_get_original=True)
-    params = [
-        [conversion, table_name, original_table_name, column]
+    return [
+        _get_not_null_clause(conversion, original_table_name, column)
         for column in conversion.dic_tables[table_name].table_columns
         if column['Null'].lower() == 'no'
     ]
 
-    conversion.run_concurrently(func=_set_not_null, params_list=params)
-
 
-def _set_not_null(
-    conversion: Conversion,
-    table_name: str,
-    original_table_name: str,
-    column: dict
-) -> None:
+def _get_not_null_clause(conversion: Conversion, original_table_name: str, column: dict) -> str:
     """
-    Sets the NOT NULL constraint for given column.
+    Returns a clause, that sets the NOT NULL constraint for given column.
     """
     column_name = ExtraConfigProcessor.get_column_name(
         conversion=conversion,
@@ -55,15 +48,4 @@ def _set_not_null(
         should_get_original=False
     )
 
-    result = DBAccess.query(
-        conversion=conversion,
-        caller=_set_not_null.__name__,
-        sql=f'ALTER TABLE "{conversion.schema}"."{table_name}" ALTER COLUMN "{column_name}" SET NOT NULL;',
-        vendor=DBVendor.PG,
-        process_exit_on_error=False,
-        should_return_client=False
-    )
-
-    if not result.error:
-        msg = f'[{_set_not_null.__name__}] Set NOT NULL for "{conversion.schema}"."{table_name}"."{column_name}"...'
-        log(conversion, msg, conversion.dic_tables[table_name].table_log_path)
+    return f'ALTER COLUMN "{column_name}" SET NOT NULL'
@@ -0,0 +1,289 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+import os
+import math
+import mmap
+from typing import Any, Optional, cast
+
+import pymig.migration_state_manager as MigrationStateManager
+import pymig.extra_config_processor as ExtraConfigProcessor
+from pymig.table import Table
+from pymig.fs_ops import log
+from pymig.conversion import Conversion
+from pymig.data_chunks_processor import insert_data_chunks
+
+# Amount of data "copy_expert" requests per single "read" call, while loading a source file range.
+READ_SIZE = 1024 * 1024
+
+# Size of a window, scanned at once, while counting quotes of a CSV file.
+_SCAN_WINDOW_SIZE = 16 * 1024 * 1024
+
+# Source file extensions and corresponding COPY formats.
+# Notice, "mysqldump --tab" writes the data into ".txt" files, using the format, which PostgreSQL COPY accepts as text.
+_COPY_FORMATS = {'.txt': 'text', '.csv': 'csv'}
+
+
+class OffsetRangeReader:
+    """
+    File-like reader of a byte range of a memory-mapped source file.
+    Passed directly to "copy_expert", which uses only the "read" method.
+    """
+    _file: Any
+    _mmap: Optional[mmap.mmap]
+    _position: int
+    _end: int
+
+    __slots__ = ('_file', '_mmap', '_position', '_end')
+
+    def __init__(self, path: str, start: int, end: int):
+        """
+        OffsetRangeReader constructor.
+        """
+        self._file = open(path, 'rb')
+        self._position = start
+        self._end = end
+        self._mmap = None
+
+        if end > start:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Returns up to "size" bytes of the range, or an empty bytes object, when the range is exhausted.
+        """
+        if self._mmap is None or self._position >= self._end:
+            return b''
+
+        read_to = self._end if size < 0 else min(self._end, self._position + size)
+        data = self._mmap[self._position:read_to]
+        self._position = read_to
+        return data
+
+    def close(self) -> None:
+        """
+        Releases the memory map and the file.
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+        self._file.close()
+
+    def __enter__(self) -> 'OffsetRangeReader':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def load_offline_structure(conversion: Conversion) -> None:
+    """
+    Loads a list of tables to migrate from the offline source directory,
+    and splits their files into data-chunks.
+    Each table is represented by a "<table_name>.txt" ("mysqldump --tab") or "<table_name>.csv" file.
+    Notice, target tables must exist, since the offline source carries no usable structure.
+    """
+    have_tables_loaded = MigrationStateManager.get(conversion, 'tables_loaded')
+    source_dir = cast(str, conversion.offline_source_dir)
+    thread_pool_params, tables_cnt = [], 0
+
+    for file_name in sorted(os.listdir(source_dir)):
+        original_table_name, extension = os.path.splitext(file_name)
+
+        if extension.lower() not in _COPY_FORMATS:
+            continue
+
+        if conversion.include_tables and original_table_name not in conversion.include_tables:
+            continue
+
+        if original_table_name in conversion.exclude_tables:
+            continue
+
+        table_name = ExtraConfigProcessor.get_table_name(conversion, original_table_name, False)
+        conversion.tables_to_migrate.append(table_name)
+        conversion.dic_tables[table_name] = Table(f'{conversion.logs_dir_path}/{table_name}.log')
+        source_file = os.path.join(source_dir, file_name)
+        thread_pool_params.append([conversion, table_name, source_file, have_tables_loaded])
+        tables_cnt += 1
+
+    conversion.run_concurrently(func=prepare_offline_data_chunks, params_list=thread_pool_params)
+    msg = (f'[{load_offline_structure.__name__}] Offline source "{source_dir}" is loaded...\n'
+           f'\t--[{load_offline_structure.__name__}] Tables to migrate: {tables_cnt}')
+
+    log(conversion, msg)
+    MigrationStateManager.set(conversion, 'tables_loaded')
+
+
+def prepare_offline_data_chunks(
+    conversion: Conversion,
+    table_name: str,
+    source_file: str,
+    have_data_chunks_processed: bool
+) -> None:
+    """
+    Splits given source file into data-chunks of roughly "data_chunk_size" MB each.
+    Notice, data-chunks are split on records boundaries, so each one is a valid COPY stream on its own.
+    """
+    if have_data_chunks_processed:
+        return
+
+    log_path = conversion.dic_tables[table_name].table_log_path
+    copy_format = _COPY_FORMATS[os.path.splitext(source_file)[1].lower()]
+    file_size = os.path.getsize(source_file)
+    table_data_size = round(file_size / 1024 / 1024, 2)
+    byte_ranges = _get_byte_ranges(
+        source_file,
+        file_size,
+        copy_format,
+        conversion.data_chunk_size,
+        conversion.offline_source_csv,
+    )
+
+    chunks_cnt = len(byte_ranges)
+    msg = (f'[{prepare_offline_data_chunks.__name__}] Total bytes to insert into'
+           f' "{conversion.schema}"."{table_name}": {file_size}, data-chunks: {chunks_cnt}')
+
+    log(conversion, msg, log_path)
+    insert_data_chunks(conversion, [
+        {
+            'table_name': table_name,
+            'source_file': source_file,
+            'rows_cnt': 0,
+            'table_data_size': table_data_size,
+            'copy_format': copy_format,
+            'source_range_start': range_start,
+            'source_range_end': range_end,
+            'chunk_id': chunk_id,
+            'chunks_cnt': chunks_cnt,
+        }
+        for chunk_id, (range_start, range_end) in enumerate(byte_ranges)
+    ])
+
+
+def _get_byte_ranges(
+    source_file: str,
+    file_size: int,
+    copy_format: str,
+    data_chunk_size: float,
+    csv_options: dict[str, Any]
+) -> list[tuple[int, int]]:
+    """
+    Returns a list of byte ranges [start, end), one per data-chunk.
+    Notice:
+    1. CSV header (if any) is excluded from the ranges, since each range is loaded by a separate COPY.
+    2. CSV files, which escape quotes by a character other than the quote itself, are not split,
+       since escaped quotes cannot be told from closing quotes by counting.
+    """
+    chunk_bytes = int(data_chunk_size * 1024 * 1024)
+    is_csv = copy_format == 'csv'
+
+    if file_size == 0:
+        return [(0, file_size)]
+
+    with open(source_file, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+        # Notice, a state of CSV scanning: the scanned offset, and whether it lies within a quoted value.
+        csv_state = [0, False]
+        quote = csv_options['quote'].encode()
+        data_start = (_find_csv_record_boundary(mapped_file, 0, csv_state, quote)
+                      if is_csv and csv_options['header']
+                      else 0)
+
+        data_size = file_size - data_start
+        is_splittable = not is_csv or csv_options['escape'] == csv_options['quote']
+
+        if data_chunk_size <= 0 or data_size <= chunk_bytes or not is_splittable:
+            return [(data_start, file_size)]
+
+        chunks_cnt = math.ceil(data_size / chunk_bytes)
+        boundaries = [data_start]
+
+        for chunk_id in range(1, chunks_cnt):
+            offset = max(data_start + chunk_id * data_size // chunks_cnt, boundaries[-1])
+            boundary = (_find_csv_record_boundary(mapped_file, offset, csv_state, quote)
+                        if is_csv
+                        else _find_text_record_boundary(mapped_file, offset))
+
+            if boundary >= file_size:
+                break
+
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+
+    boundaries.append(file_size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def _find_text_record_boundary(mapped_file: mmap.mmap, offset: int) -> int:
+    """
+    Returns a position of the first record, starting at or after given offset, in text format.
+    Notice, "mysqldump --tab" writes line breaks within values as backslash followed by a line break,
+    so a line break preceded by an odd number of backslashes does not terminate a record.
+    """
+    position = mapped_file.find(b'\n', offset)
+
+    while position != -1:
+        backslashes_cnt = 0
+
+        while position - backslashes_cnt > 0 and mapped_file[position - backslashes_cnt - 1] == ord('\\'):
+            backslashes_cnt += 1
+
+        if backslashes_cnt % 2 == 0:
+            return position + 1
+
+        position = mapped_file.find(b'\n', position + 1)
+
+    return len(mapped_file)
+
+
+def _find_csv_record_boundary(mapped_file: mmap.mmap, offset: int, csv_state: list[Any], quote: bytes) -> int:
+    """
+    Returns a position of the first record, starting at or after given offset, in CSV format.
+    Notice, a line break within a quoted value does not terminate a record.
+    Quotes are counted from the beginning of the file, so the file is scanned once, across all calls.
+    """
+    scanned_to, is_quoted = csv_state
+    is_quoted ^= _count_quotes(mapped_file, scanned_to, offset, quote) % 2 == 1
+    position = mapped_file.find(b'\n', offset)
+    scanned_to = offset
+
+    while position != -1:
+        is_quoted ^= _count_quotes(mapped_file, scanned_to, position, quote) % 2 == 1
+        scanned_to = position
+
+        if not is_quoted:
+            csv_state[0], csv_state[1] = position + 1, False
+            return position + 1
+
+        position = mapped_file.find(b'\n', position + 1)
+
+    return len(mapped_file)
+
+
+def _count_quotes(mapped_file: mmap.mmap, start: int, end: int, quote: bytes) -> int:
+    """
+    Returns a number of given quotes within given range of the file.
+    """
+    quotes_cnt = 0
+
+    for window_start in range(start, end, _SCAN_WINDOW_SIZE):
+        quotes_cnt += mapped_file[window_start:min(end, window_start + _SCAN_WINDOW_SIZE)].count(quote)
+
+    return quotes_cnt
@@ -0,0 +1,168 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+import os
+import re
+import csv
+import time
+import cProfile
+import tracemalloc
+from contextlib import contextmanager
+from multiprocessing.util import Finalize
+from typing import Optional, Iterator, Any, TextIO
+
+from pymig.conversion import Conversion
+from pymig.profiling_mode import ProfilingMode
+
+# Number of frames, stored by tracemalloc per each allocation.
+_TRACEMALLOC_FRAMES = 10
+
+# Notice, following variables are per process.
+_active_profiler: Optional[cProfile.Profile] = None
+_timings_file: Optional[TextIO] = None
+_timings_writer: Optional[Any] = None
+
+
+@contextmanager
+def profile_stage(conversion: Conversion, stage_name: str) -> Iterator[None]:
+    """
+    Profiles given stage, according to "profiling_modes":
+    1. CPROFILE - cProfile stats are written to the "/profiles/{stage}_{pid}_{started_at}.prof" file
+       (can be viewed by pstats, snakeviz, or converted for KCachegrind by pyprof2calltree).
+    2. TRACEMALLOC - a tracemalloc snapshot, taken at the end of the stage,
+       is written to the "/profiles/{stage}_{pid}_{started_at}.tracemalloc" file
+       (can be loaded by "tracemalloc.Snapshot.load").
+    Notice, nested stages of the same process are profiled by the outermost stage only.
+    """
+    global _active_profiler
+    profiler = None
+    is_tracemalloc_started = False
+
+    if ProfilingMode.CPROFILE in conversion.profiling_modes and _active_profiler is None:
+        profiler = _active_profiler = cProfile.Profile()
+        profiler.enable()
+
+    if ProfilingMode.TRACEMALLOC in conversion.profiling_modes and not tracemalloc.is_tracing():
+        tracemalloc.start(_TRACEMALLOC_FRAMES)
+        is_tracemalloc_started = True
+
+    try:
+        yield
+    finally:
+        profile_path = _get_profile_path(conversion, stage_name)
+
+        if profiler is not None:
+            profiler.disable()
+            _active_profiler = None
+            profiler.dump_stats(f'{profile_path}.prof')
+
+        if is_tracemalloc_started:
+            tracemalloc.take_snapshot().dump(f'{profile_path}.tracemalloc')
+            tracemalloc.stop()
+
+
+def profile_process(conversion: Conversion, process_name: str) -> None:
+    """
+    Profiles current process (using cProfile) until it exits, if "CPROFILE" profiling mode is on.
+    Intended for pool workers, which have no single entry point, see "profile_stage".
+    """
+    global _active_profiler
+
+    if ProfilingMode.CPROFILE not in conversion.profiling_modes or _active_profiler is not None:
+        return
+
+    profiler = _active_profiler = cProfile.Profile()
+    profiler.enable()
+
+    def dump_stats() -> None:
+        profiler.disable()
+        profiler.dump_stats(f'{_get_profile_path(conversion, process_name)}.prof')
+
+    Finalize(None, dump_stats, exitpriority=0)
+
+
+def record_timing(
+    conversion: Conversion,
+    table_name: str,
+    batch_id: int,
+    phase: str,
+    seconds: float
+) -> None:
+    """
+    Records duration of given phase of given batch, if "TIMINGS" profiling mode is on.
+    Timings are appended to the "/profiles/timings_{pid}_{started_at}.csv" file of current process
+    (pids may be reused by processes, spawned later).
+    Notice, when the mode is off, the cost of this call is a single set lookup.
+    """
+    if ProfilingMode.TIMINGS not in conversion.profiling_modes:
+        return
+
+    _get_timings_writer(conversion).writerow(
+        (f'{time.time():.6f}', os.getpid(), table_name, batch_id, phase, f'{seconds:.6f}')
+    )
+
+
+def _get_timings_writer(conversion: Conversion) -> Any:
+    """
+    Returns CSV writer of the timings file of current process.
+    The file is opened once, and is closed when current process exits.
+    """
+    global _timings_file, _timings_writer
+
+    if _timings_writer is None:
+        timings_file_name = f'timings_{os.getpid()}_{time.time_ns()}.csv'
+        _timings_file = open(os.path.join(conversion.profiles_dir_path, timings_file_name), 'w', newline='')
+        _timings_writer = csv.writer(_timings_file)
+        _timings_writer.writerow(('timestamp', 'pid', 'table_name', 'batch_id', 'phase', 'seconds'))
+        Finalize(None, _timings_file.close, exitpriority=0)
+
+    return _timings_writer
+
+
+def _flush_before_fork() -> None:
+    """
+    Flushes the timings file of current process, so a forked child does not inherit (and write again) buffered rows.
+    """
+    if _timings_file is not None:
+        _timings_file.flush()
+
+
+def _reset_after_fork() -> None:
+    """
+    Makes a forked child process write its own profiles, regardless of profiling state of the parent process.
+    Notice, the profiler of the parent process is inherited by the forking thread, so it is disabled in the child.
+    """
+    global _active_profiler, _timings_file, _timings_writer
+
+    if _active_profiler is not None:
+        _active_profiler.disable()
+        _active_profiler = None
+
+    _timings_file, _timings_writer = None, None
+
+
+os.register_at_fork(before=_flush_before_fork, after_in_child=_reset_after_fork)
+
+
+def _get_profile_path(conversion: Conversion, name: str) -> str:
+    """
+    Returns unique path (without extension) of a profile of given stage or process.
+    Notice, the path contains creation time, rather than a counter, since both counters and pids
+    are inherited, or reused, by processes, spawned later.
+    """
+    file_name = re.sub(r'\W', '_', name)
+    return os.path.join(conversion.profiles_dir_path, f'{file_name}_{os.getpid()}_{time.time_ns()}')
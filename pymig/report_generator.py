@@ -40,4 +40,12 @@ def generate_report(conversion: Conversion, last_message: str) -> None:
               f'Total time: {formatted_hours}:{formatted_minutes}:{formatted_seconds}\n'
               f'\t--[{log_title}] (hours:minutes:seconds)')
 
-    log(conversion, output)
+    if conversion.foreign_keys_validation_times:
+        validation_times = conversion.foreign_keys_validation_times
+        slowest_foreign_key = max(validation_times, key=lambda foreign_key: validation_times[foreign_key])
+        output += (f'\n\t--[{log_title}] Foreign keys validated: {len(validation_times)},'
+                   f' total validation time: {sum(validation_times.values()):.2f} seconds\n'
+                   f'\t--[{log_title}] The slowest validation: "{slowest_foreign_key}",'
+                   f' {validation_times[slowest_foreign_key]:.2f} seconds')
+
+    log(conversion, output, is_console_output_forced=True)
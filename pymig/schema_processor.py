@@ -20,8 +20,10 @@ from typing import cast, Any
 import pymig.db_access as DBAccess
 from pymig.db_vendor import DBVendor
 from pymig.conversion import Conversion
+from pymig.tracer import traced
 
 
+@traced('stage')
 def create_schema(conversion: Conversion) -> None:
     """
     Creates a new PostgreSQL schema if it does not exist yet.
@@ -20,6 +20,7 @@ import pymig.db_access as DBAccess
 from pymig.fs_ops import log
 from pymig.db_vendor import DBVendor
 from pymig.conversion import Conversion
+from pymig.catalog_snapshot import get_catalog_snapshot
 
 
 def create_sequence(conversion: Conversion, table_name: str) -> None:
@@ -42,7 +43,6 @@ def create_sequence(conversion: Conversion, table_name: str) -> None:
         should_get_original=False
     )
 
-    seq_name = _get_sequence_name(table_name=table_name, column_name=column_name)
     sql = (f'ALTER TABLE "{conversion.schema}"."{table_name}"'
            f' ALTER COLUMN "{column_name}" ADD GENERATED BY DEFAULT AS IDENTITY;')
 
@@ -59,9 +59,7 @@ def create_sequence(conversion: Conversion, table_name: str) -> None:
         DBAccess.release_db_client(conversion, create_sequence_result.client)
         return
 
-    sql_set_sequence_value = (f'SELECT SETVAL(\'"{conversion.schema}"."{seq_name}"\','
-                              f' (SELECT MAX("{column_name}") FROM "{conversion.schema}"."{table_name}"));')
-
+    sql_set_sequence_value = _get_set_sequence_value_sql(conversion, table_name, original_table_name, column_name)
     set_sequence_value_result = DBAccess.query(
         conversion=conversion,
         caller=create_sequence.__name__,
@@ -97,13 +95,10 @@ def set_sequence_value(conversion: Conversion, table_name: str) -> None:
     )
 
     seq_name = _get_sequence_name(table_name=table_name, column_name=column_name)
-    sql = (f'SELECT SETVAL("{conversion.schema}"."{seq_name}",'
-           f' (SELECT MAX("{column_name}") FROM "{conversion.schema}"."{table_name}"));')
-
     result = DBAccess.query(
         conversion=conversion,
         caller=set_sequence_value.__name__,
-        sql=sql,
+        sql=_get_set_sequence_value_sql(conversion, table_name, original_table_name, column_name),
         vendor=DBVendor.PG,
         process_exit_on_error=False,
         should_return_client=False
@@ -114,6 +109,75 @@ def set_sequence_value(conversion: Conversion, table_name: str) -> None:
         log(conversion, msg, conversion.dic_tables[table_name].table_log_path)
 
 
+def adjust_sequence_value(conversion: Conversion, table_name: str) -> None:
+    """
+    In "AUTO_INCREMENT" sequence initialization mode, moves the sequence past the maximal value of the column,
+    if the loaded data exceeds the source table's AUTO_INCREMENT value, taken from the catalog
+    (rows, inserted into the source after the catalog is retrieved, are loaded as well).
+    Notice, runs once the table's indexes are built, so the maximal value is read from the PK index,
+    rather than by scanning the table.
+    """
+    original_table_name = ExtraConfigProcessor.get_table_name(conversion, table_name, True)
+    table_columns_list = conversion.dic_tables[table_name].table_columns
+    auto_increment_columns = [column for column in table_columns_list if column['Extra'] == 'auto_increment']
+    auto_increment = get_catalog_snapshot(conversion).get_table(original_table_name).get('auto_increment')
+
+    if len(auto_increment_columns) == 0 or auto_increment is None:
+        return  # The sequence is either absent, or initialized by the maximal value of the column.
+
+    auto_increment_column = auto_increment_columns[0]['Field']
+    column_name = ExtraConfigProcessor.get_column_name(
+        conversion=conversion,
+        original_table_name=original_table_name,
+        current_column_name=auto_increment_column,
+        should_get_original=False
+    )
+
+    seq_name = _get_sequence_name(table_name=table_name, column_name=column_name)
+    sql = (f'SELECT SETVAL(\'"{conversion.schema}"."{seq_name}"\', MAX("{column_name}")) AS next_value'
+           f' FROM "{conversion.schema}"."{table_name}" HAVING MAX("{column_name}") >= {int(auto_increment)};')
+
+    result = DBAccess.query(
+        conversion=conversion,
+        caller=adjust_sequence_value.__name__,
+        sql=sql,
+        vendor=DBVendor.PG,
+        process_exit_on_error=False,
+        should_return_client=False
+    )
+
+    if not result.error and result.data:
+        msg = (f'[{adjust_sequence_value.__name__}] Sequence "{conversion.schema}"."{seq_name}" is moved past'
+               f' the loaded data, which exceeds the source AUTO_INCREMENT value {int(auto_increment)}')
+
+        log(conversion, msg, conversion.dic_tables[table_name].table_log_path)
+
+
+def _get_set_sequence_value_sql(
+    conversion: Conversion,
+    table_name: str,
+    original_table_name: str,
+    column_name: str
+) -> str:
+    """
+    Returns a statement, that sets the next value of given column's sequence.
+    In "AUTO_INCREMENT" sequence initialization mode, the source table's AUTO_INCREMENT value is used,
+    so the target table is not scanned.
+    """
+    seq_name = _get_sequence_name(table_name=table_name, column_name=column_name)
+    quoted_seq_name = f'\'"{conversion.schema}"."{seq_name}"\''
+
+    if conversion.sequence_initialization == 'AUTO_INCREMENT':
+        auto_increment = get_catalog_snapshot(conversion).get_table(original_table_name).get('auto_increment')
+
+        if auto_increment is not None:
+            # Notice, AUTO_INCREMENT is the next value to use, hence "is_called" is false.
+            return f'SELECT SETVAL({quoted_seq_name}, {int(auto_increment)}, false);'
+
+    return (f'SELECT SETVAL({quoted_seq_name},'
+            f' (SELECT MAX("{column_name}") FROM "{conversion.schema}"."{table_name}"));')
+
+
 def _get_sequence_name(table_name: str, column_name: str) -> str:
     """
     Returns sequence name by table's name and column's name.
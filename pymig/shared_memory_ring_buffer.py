@@ -0,0 +1,168 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+import struct
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Optional
+
+
+class SharedMemoryRingBuffer:
+    """
+    Single-producer/single-consumer ring buffer of encoded COPY payloads, placed in shared memory.
+    The reader process writes COPY data into fixed-size slots,
+    while the writer process consumes it as a file-like object, passed to psycopg2 "copy_expert".
+    Notice:
+    1. No pickling is involved, the data is copied into and out of shared memory exactly once.
+    2. A number of slots is bounded, so the reader blocks while all slots are filled.
+    3. An empty slot marks the end of the stream.
+    4. Each side may watch the other side's process (see "watch_peer"),
+       so it does not block forever, if the other side is killed without calling "abort".
+    """
+    _SLOT_HEADER = struct.Struct('!i')
+    _WAIT_TIMEOUT_SECONDS = 1
+
+    slots_count: int
+    slot_size: int
+    _shared_memory: SharedMemory
+    _free_slots: Any
+    _filled_slots: Any
+    _aborted: Any
+    _write_index: int
+    _read_index: int
+    _chunk: bytes
+    _chunk_offset: int
+    _is_exhausted: bool
+    _peer: Optional[Any]
+
+    __slots__ = (
+        'slots_count', 'slot_size', '_shared_memory', '_free_slots', '_filled_slots', '_aborted',
+        '_write_index', '_read_index', '_chunk', '_chunk_offset', '_is_exhausted', '_peer',
+    )
+
+    def __init__(self, slots_count: int, slot_size: int):
+        """
+        Class constructor.
+        Allocates the shared memory block, that must be eventually released by "release" call.
+        """
+        self.slots_count = slots_count
+        self.slot_size = slot_size
+        self._shared_memory = SharedMemory(create=True, size=slots_count * (self._SLOT_HEADER.size + slot_size))
+        self._free_slots = multiprocessing.Semaphore(slots_count)
+        self._filled_slots = multiprocessing.Semaphore(0)
+        self._aborted = multiprocessing.Event()
+        self._write_index = 0
+        self._read_index = 0
+        self._chunk = b''
+        self._chunk_offset = 0
+        self._is_exhausted = False
+        self._peer = None
+
+    def write(self, payload: bytes) -> None:
+        """
+        Writes given payload into the ring buffer, splitting it across as many slots as needed.
+        Blocks while there are no free slots.
+        """
+        for offset in range(0, len(payload), self.slot_size):
+            self._write_slot(payload[offset:offset + self.slot_size])
+
+    def close_writing(self) -> None:
+        """
+        Marks the end of the stream.
+        """
+        self._write_slot(b'')
+
+    def watch_peer(self, peer: Optional[Any]) -> None:
+        """
+        Sets the process of the other side, which is checked while waiting for slots.
+        Notice, must be called after the other side's process is started, since process objects are not picklable.
+        """
+        self._peer = peer
+
+    def abort(self) -> None:
+        """
+        Signals the other side, that the transfer has failed.
+        """
+        self._aborted.set()
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Returns up to "size" bytes of COPY data.
+        Returns an empty bytes object when the end of the stream is reached.
+        Blocks while there are no filled slots.
+        """
+        if self._chunk_offset >= len(self._chunk):
+            if self._is_exhausted:
+                return b''
+
+            self._chunk, self._chunk_offset = self._read_slot(), 0
+
+            if not self._chunk:
+                self._is_exhausted = True
+                return b''
+
+        end = len(self._chunk) if size < 0 else self._chunk_offset + size
+        data = self._chunk[self._chunk_offset:end]
+        self._chunk_offset += len(data)
+        return data
+
+    def release(self, unlink: bool) -> None:
+        """
+        Closes access to the shared memory block.
+        The block itself must be unlinked by the process, that has created it.
+        """
+        self._shared_memory.close()
+
+        if unlink:
+            self._shared_memory.unlink()
+
+    def _write_slot(self, data: bytes) -> None:
+        """
+        Copies given data into next free slot.
+        """
+        self._acquire(self._free_slots)
+        slot_start = self._write_index * (self._SLOT_HEADER.size + self.slot_size)
+        data_start = slot_start + self._SLOT_HEADER.size
+        self._SLOT_HEADER.pack_into(self._shared_memory.buf, slot_start, len(data))
+        self._shared_memory.buf[data_start:data_start + len(data)] = data
+        self._write_index = (self._write_index + 1) % self.slots_count
+        self._filled_slots.release()
+
+    def _read_slot(self) -> bytes:
+        """
+        Copies the data out of next filled slot, and makes the slot available for writing.
+        """
+        self._acquire(self._filled_slots)
+        slot_start = self._read_index * (self._SLOT_HEADER.size + self.slot_size)
+        data_start = slot_start + self._SLOT_HEADER.size
+        (data_length,) = self._SLOT_HEADER.unpack_from(self._shared_memory.buf, slot_start)
+        data = bytes(self._shared_memory.buf[data_start:data_start + data_length])
+        self._read_index = (self._read_index + 1) % self.slots_count
+        self._free_slots.release()
+        return data
+
+    def _acquire(self, semaphore: Any) -> None:
+        """
+        Acquires given semaphore.
+        Raises BrokenPipeError if the other side has aborted the transfer, or its process has exited.
+        """
+        while not semaphore.acquire(timeout=self._WAIT_TIMEOUT_SECONDS):
+            if self._aborted.is_set():
+                raise BrokenPipeError('Shared memory transfer has been aborted by the other side')
+
+            if self._peer is not None and not self._peer.is_alive():
+                raise BrokenPipeError('Shared memory transfer has been interrupted, the other side has exited')
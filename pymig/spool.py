@@ -0,0 +1,201 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+import os
+import gzip
+import json
+import shutil
+from typing import Any, BinaryIO, Optional, cast
+
+from pymig.conversion import Conversion
+
+# Amount of data "copy_expert" requests per single "read" call, while loading a spool segment.
+READ_SIZE = 1024 * 1024
+
+_DONE_MARKER_NAME = 'done.json'
+_SEGMENT_PREFIX = 'segment_'
+_PART_SUFFIX = '.part'
+_EXTENSIONS = {'gzip': '.copy.gz', 'zstd': '.copy.zst'}
+
+
+class SpoolWriter:
+    """
+    Writes COPY data of a single data-chunk into compressed spool segments.
+    Each segment is a self-contained COPY stream, so segments can be loaded (and resumed) one by one.
+    Notice:
+    1. Each segment is written under a temporary name, and renamed once complete.
+    2. The data-chunk is considered dumped only when the "done" marker is written by "close".
+    """
+    rows_written: int
+    segments_cnt: int
+    _spool_dir: str
+    _compression: str
+    _segment_size: int
+    _header: bytes
+    _trailer: bytes
+    _segment: Optional[BinaryIO]
+    _segment_path: str
+    _segment_bytes: int
+
+    __slots__ = (
+        'rows_written', 'segments_cnt', '_spool_dir', '_compression', '_segment_size', '_header', '_trailer',
+        '_segment', '_segment_path', '_segment_bytes',
+    )
+
+    def __init__(
+        self,
+        spool_dir: str,
+        compression: str,
+        segment_size: int,
+        header: bytes = b'',
+        trailer: bytes = b''
+    ):
+        """
+        Class constructor.
+        Removes leftovers of previous (interrupted) dump of the same data-chunk.
+        "segment_size" is a size (in bytes) of uncompressed COPY data per segment.
+        """
+        if compression not in _EXTENSIONS:
+            raise ValueError(f'Unknown spool compression "{compression}"')
+
+        if os.path.exists(spool_dir):
+            shutil.rmtree(spool_dir)
+
+        os.makedirs(spool_dir)
+        self.rows_written = 0
+        self.segments_cnt = 0
+        self._spool_dir = spool_dir
+        self._compression = compression
+        self._segment_size = segment_size
+        self._header = header
+        self._trailer = trailer
+        self._segment = None
+        self._segment_path = ''
+        self._segment_bytes = 0
+
+    def write(self, payload: bytes, rows_cnt: int) -> None:
+        """
+        Writes given COPY payload, which contains given number of rows.
+        Starts a new segment, once current one exceeds the segment size.
+        """
+        if self._segment is None:
+            self._open_segment()
+
+        cast(BinaryIO, self._segment).write(payload)
+        self._segment_bytes += len(payload)
+        self.rows_written += rows_cnt
+
+        if self._segment_bytes >= self._segment_size:
+            self._close_segment()
+
+    def close(self) -> None:
+        """
+        Completes the last segment, and marks the data-chunk as dumped.
+        """
+        if self._segment is not None:
+            self._close_segment()
+
+        done_marker = {'segments_cnt': self.segments_cnt, 'rows_cnt': self.rows_written}
+
+        with open(os.path.join(self._spool_dir, _DONE_MARKER_NAME), 'w') as file:
+            json.dump(done_marker, file)
+
+    def _open_segment(self) -> None:
+        """
+        Starts next segment.
+        """
+        self.segments_cnt += 1
+        segment_name = f'{_SEGMENT_PREFIX}{self.segments_cnt:06d}{_EXTENSIONS[self._compression]}'
+        self._segment_path = os.path.join(self._spool_dir, segment_name)
+        self._segment = _open_compressed(self._segment_path + _PART_SUFFIX, self._compression, 'wb')
+        self._segment.write(self._header)
+        self._segment_bytes = len(self._header)
+
+    def _close_segment(self) -> None:
+        """
+        Completes current segment, and publishes it under its final name.
+        """
+        segment = cast(BinaryIO, self._segment)
+        segment.write(self._trailer)
+        segment.close()
+        os.replace(self._segment_path + _PART_SUFFIX, self._segment_path)
+        self._segment = None
+
+
+def get_spool_dir(conversion: Conversion, data_pool_id: int) -> str:
+    """
+    Returns a path to the directory, containing given data-chunk's spool segments.
+    """
+    return os.path.join(conversion.spool_dir, f'data_chunk_{data_pool_id}')
+
+
+def is_dumped(spool_dir: str) -> bool:
+    """
+    Checks if the data-chunk, which spool directory is given, is dumped entirely.
+    """
+    return os.path.isfile(os.path.join(spool_dir, _DONE_MARKER_NAME))
+
+
+def get_segments(spool_dir: str) -> list[tuple[int, str]]:
+    """
+    Returns a list of tuples (segment id, segment path) of given spool directory, ordered by segment id.
+    """
+    segments = []
+
+    for file_name in os.listdir(spool_dir):
+        if not file_name.startswith(_SEGMENT_PREFIX) or file_name.endswith(_PART_SUFFIX):
+            continue
+
+        segment_id = int(file_name[len(_SEGMENT_PREFIX):].split('.')[0])
+        segments.append((segment_id, os.path.join(spool_dir, file_name)))
+
+    return sorted(segments)
+
+
+def open_segment(segment_path: str) -> BinaryIO:
+    """
+    Opens given spool segment for reading.
+    Returns a file-like object, yielding uncompressed COPY data.
+    """
+    compression = next(
+        (compression for compression, extension in _EXTENSIONS.items() if segment_path.endswith(extension)),
+        'gzip',
+    )
+
+    return _open_compressed(segment_path, compression, 'rb')
+
+
+def _open_compressed(path: str, compression: str, mode: str) -> BinaryIO:
+    """
+    Opens compressed file in given mode ("rb" or "wb").
+    Notice, "zstd" compression requires optional "zstandard" package.
+    """
+    if compression == 'gzip':
+        # Notice, fast compression level is preferred, since the dump must keep up with the source.
+        return cast(BinaryIO, gzip.open(path, mode, compresslevel=1))
+
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError('"zstd" spool compression requires "zstandard" package, please install it') from None
+
+    file: Any = open(path, mode)
+
+    if mode == 'rb':
+        return cast(BinaryIO, zstandard.ZstdDecompressor().stream_reader(file, closefd=True))
+
+    return cast(BinaryIO, zstandard.ZstdCompressor().stream_writer(file, closefd=True))
@@ -25,39 +25,37 @@ from pymig.utils import get_index_of
 from pymig.table import Table
 from pymig.fs_ops import log
 from pymig.conversion import Conversion
+from pymig.tracer import traced
 from pymig.table_processor import create_table
 from pymig.data_chunks_processor import prepare_data_chunks
+from pymig.catalog_snapshot import get_catalog_snapshot, spool_catalog_snapshot
+from pymig.offline_source import load_offline_structure
+from pymig.spool_mode import SpoolMode
+from pymig.view_generator import get_mysql_view_code
 
 
+@traced('stage')
 def load_structure(conversion: Conversion) -> None:
     """
     Loads source tables and views, that need to be migrated.
+    Notice:
+    1. In "DUMP" spool mode, the source catalog is spooled, along with the data.
+    2. In "LOAD" spool mode, the source catalog is read from the spool directory, so MySQL is not queried.
     """
-    _get_mysql_version(conversion)
-    have_tables_loaded = MigrationStateManager.get(conversion, 'tables_loaded')
-    sql = f'SHOW FULL TABLES IN `{conversion.mysql_db_name}` WHERE 1 = 1'
-
-    if conversion.include_tables:
-        include_tables = ','.join([f'"{table_name}"' for table_name in conversion.include_tables])
-        sql += f' AND Tables_in_{conversion.mysql_db_name} IN({include_tables})'
+    if conversion.should_load_from_offline_source():
+        return load_offline_structure(conversion)
 
-    if conversion.exclude_tables:
-        exclude_tables = ','.join([f'"{table_name}"' for table_name in conversion.exclude_tables])
-        sql += f' AND Tables_in_{conversion.mysql_db_name} NOT IN({exclude_tables})'
-
-    result = DBAccess.query(
-        conversion=conversion,
-        caller=load_structure.__name__,
-        sql=f'{sql};',
-        vendor=DBVendor.MYSQL,
-        process_exit_on_error=True,
-        should_return_client=False
-    )
+    have_tables_loaded = MigrationStateManager.get(conversion, 'tables_loaded')
+    relations = (get_catalog_snapshot(conversion).relations
+                 if conversion.spool_mode == SpoolMode.LOAD
+                 else _get_relations(conversion))
 
     thread_pool_params, tables_cnt, views_cnt = [], 0, 0
-    result_data = cast(list[dict[str, Any]], result.data)
 
-    for row in result_data:
+    # Notice, the whole source catalog is retrieved at once, instead of querying each table separately.
+    get_catalog_snapshot(conversion)
+
+    for row in relations:
         relation_name = row[f'Tables_in_{conversion.mysql_db_name}']
 
         if row['Table_type'] == 'BASE TABLE' and get_index_of(relation_name, conversion.exclude_tables) == -1:
@@ -71,6 +69,10 @@ def load_structure(conversion: Conversion) -> None:
             views_cnt += 1
 
     conversion.run_concurrently(func=process_table_before_data_loading, params_list=thread_pool_params)
+
+    if conversion.spool_mode == SpoolMode.DUMP:
+        _spool_catalog(conversion, relations)
+
     msg = (f'[{load_structure.__name__}] Source DB structure is loaded...\n'
            f'\t--[{load_structure.__name__}] Tables to migrate: {tables_cnt}\n'
            f'\t--[{load_structure.__name__}] Views to migrate: {views_cnt}')
@@ -79,6 +81,49 @@ def load_structure(conversion: Conversion) -> None:
     MigrationStateManager.set(conversion, 'tables_loaded')
 
 
+def _spool_catalog(conversion: Conversion, relations: list[dict[str, Any]]) -> None:
+    """
+    Spools the source catalog, along with given relations and MySQL code of views to migrate,
+    so that subsequent run in "LOAD" spool mode does not touch the source database.
+    """
+    views = {}
+
+    for view_name in conversion.views_to_migrate:
+        mysql_view_code = get_mysql_view_code(conversion, view_name)
+
+        if mysql_view_code is not None:
+            views[view_name] = mysql_view_code
+
+    spool_catalog_snapshot(conversion, relations, views)
+
+
+def _get_relations(conversion: Conversion) -> list[dict[str, Any]]:
+    """
+    Retrieves source tables and views, that need to be migrated.
+    """
+    _get_mysql_version(conversion)
+    sql = f'SHOW FULL TABLES IN `{conversion.mysql_db_name}` WHERE 1 = 1'
+
+    if conversion.include_tables:
+        include_tables = ','.join([f'"{table_name}"' for table_name in conversion.include_tables])
+        sql += f' AND Tables_in_{conversion.mysql_db_name} IN({include_tables})'
+
+    if conversion.exclude_tables:
+        exclude_tables = ','.join([f'"{table_name}"' for table_name in conversion.exclude_tables])
+        sql += f' AND Tables_in_{conversion.mysql_db_name} NOT IN({exclude_tables})'
+
+    result = DBAccess.query(
+        conversion=conversion,
+        caller=_get_relations.__name__,
+        sql=f'{sql};',
+        vendor=DBVendor.MYSQL,
+        process_exit_on_error=True,
+        should_return_client=False
+    )
+
+    return cast(list[dict[str, Any]], result.data)
+
+
 def process_table_before_data_loading(
     conversion: Conversion,
     table_name: str,
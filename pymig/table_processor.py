@@ -15,14 +15,14 @@ __license__ = """
     along with this program (please see the "LICENSE.md" file).
     If not, see <http://www.gnu.org/licenses/gpl.txt>.
 """
-from typing import cast, Any
-
 import pymig.db_access as DBAccess
 import pymig.extra_config_processor as ExtraConfigProcessor
+import pymig.migration_state_manager as MigrationStateManager
 from pymig.db_vendor import DBVendor
-from pymig.fs_ops import log
+from pymig.fs_ops import log, generate_error
 from pymig.utils import get_index_of
 from pymig.conversion import Conversion
+from pymig.catalog_snapshot import get_catalog_snapshot
 
 
 def create_table(conversion: Conversion, table_name: str) -> None:
@@ -32,19 +32,12 @@ def create_table(conversion: Conversion, table_name: str) -> None:
     log_path = conversion.dic_tables[table_name].table_log_path
     log(conversion, f'[{create_table.__name__}] Currently creating table: `{table_name}`', log_path)
     original_table_name = ExtraConfigProcessor.get_table_name(conversion, table_name, True)
-    show_columns_result = DBAccess.query(
-        conversion=conversion,
-        caller=create_table.__name__,
-        sql=f'SHOW FULL COLUMNS FROM `{original_table_name}`;',
-        vendor=DBVendor.MYSQL,
-        process_exit_on_error=False,
-        should_return_client=False
-    )
+    show_columns_result_data = get_catalog_snapshot(conversion).get_columns(original_table_name)
 
-    if show_columns_result.error:
+    if not show_columns_result_data:
+        generate_error(conversion, f'[{create_table.__name__}] Columns of `{original_table_name}` are not found')
         return
 
-    show_columns_result_data = cast(list[dict[str, Any]], show_columns_result.data)
     conversion.dic_tables[table_name].table_columns = show_columns_result_data
 
     if conversion.should_migrate_only_data():
@@ -59,10 +52,11 @@ def create_table(conversion: Conversion, table_name: str) -> None:
         return f'"{col_name}" {col_type}'
 
     sql_columns = ','.join([_get_column_definition(input_dict) for input_dict in show_columns_result_data])
+    unlogged = 'UNLOGGED ' if conversion.should_load_into_unlogged_tables() else ''
     create_table_result = DBAccess.query(
         conversion=conversion,
         caller=create_table.__name__,
-        sql=f'CREATE TABLE IF NOT EXISTS "{conversion.schema}"."{table_name}"({sql_columns});',
+        sql=f'CREATE {unlogged}TABLE IF NOT EXISTS "{conversion.schema}"."{table_name}"({sql_columns});',
         vendor=DBVendor.PG,
         process_exit_on_error=True,
         should_return_client=False
@@ -73,6 +67,70 @@ def create_table(conversion: Conversion, table_name: str) -> None:
         log(conversion, success_message, log_path)
 
 
+def set_logged(conversion: Conversion, table_name: str) -> None:
+    """
+    Switches given UNLOGGED table to LOGGED, so its data becomes crash-safe.
+    Once done, the table's data-chunks are removed from the data-pool.
+    Notice, until then the data-chunks are kept, since PostgreSQL truncates UNLOGGED tables after a crash.
+    """
+    log_path = conversion.dic_tables[table_name].table_log_path
+    result = DBAccess.query(
+        conversion=conversion,
+        caller=set_logged.__name__,
+        sql=f'ALTER TABLE "{conversion.schema}"."{table_name}" SET LOGGED;',
+        vendor=DBVendor.PG,
+        process_exit_on_error=False,
+        should_return_client=False
+    )
+
+    if result.error:
+        return
+
+    log(conversion, f'[{set_logged.__name__}] Table "{conversion.schema}"."{table_name}" is LOGGED', log_path)
+    MigrationStateManager.delete_table_data_pool_items(conversion, table_name)
+
+
+def alter_table(conversion: Conversion, table_name: str, clauses: list[str]) -> None:
+    """
+    Applies given "ALTER TABLE" clauses (SET NOT NULL, SET DEFAULT, ADD CHECK, etc.) by a single statement,
+    so the table is locked only once, and all new constraints are validated by a single table scan.
+    Notice, if the statement fails, the clauses are applied one by one,
+    so that a single failing clause does not prevent the others from being applied.
+    """
+    if not clauses:
+        return
+
+    log_path = conversion.dic_tables[table_name].table_log_path
+    sql_alter_table = f'ALTER TABLE "{conversion.schema}"."{table_name}"'
+    result = DBAccess.query(
+        conversion=conversion,
+        caller=alter_table.__name__,
+        sql=f'{sql_alter_table} {", ".join(clauses)};',
+        vendor=DBVendor.PG,
+        process_exit_on_error=False,
+        should_return_client=False,
+        should_return_programming_error=True
+    )
+
+    if not result.error:
+        msg = f'[{alter_table.__name__}] Applied {len(clauses)} clauses to "{conversion.schema}"."{table_name}"'
+        log(conversion, msg, log_path)
+        return
+
+    msg = f'[{alter_table.__name__}] Applying clauses to "{conversion.schema}"."{table_name}" one by one...'
+    log(conversion, msg, log_path)
+
+    for clause in clauses:
+        DBAccess.query(
+            conversion=conversion,
+            caller=alter_table.__name__,
+            sql=f'{sql_alter_table} {clause};',
+            vendor=DBVendor.PG,
+            process_exit_on_error=False,
+            should_return_client=False
+        )
+
+
 def map_data_types(data_types_map: dict, mysql_data_type: str) -> str:
     """
     Converts MySQL data types to corresponding PostgreSQL data types.
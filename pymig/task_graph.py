@@ -0,0 +1,131 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+import threading
+from typing import Any, Callable
+from concurrent.futures import Future, wait
+
+from pymig.fs_ops import generate_error
+from pymig.conversion import Conversion
+
+
+class TaskGraph:
+    """
+    Runs tasks on the conversion's thread pool, each one as soon as all its dependencies are completed,
+    instead of running the migration stages one after another.
+    Notice:
+    1. A dependency is any Future, so tasks may depend on other tasks, or on external events.
+    2. A task may return a Future (for example, of index builds), and then it is completed,
+       only when the returned Future is completed.
+    3. A task runs even if some of its dependencies failed, the same way later stages ran after failures,
+       unless it is added with "skip_on_failed_dependency", and then it fails with the dependency's error.
+    """
+    _conversion: Conversion
+    _futures: list[Future]
+    _lock: threading.Lock
+
+    __slots__ = ('_conversion', '_futures', '_lock')
+
+    def __init__(self, conversion: Conversion):
+        """
+        TaskGraph constructor.
+        """
+        self._conversion = conversion
+        self._futures = []
+        self._lock = threading.Lock()
+
+    def add_task(
+        self,
+        func: Callable,
+        params: list[Any],
+        dependencies: list[Future],
+        skip_on_failed_dependency: bool = False
+    ) -> Future:
+        """
+        Schedules given function to run with given parameters, once all given dependencies are completed.
+        Returns a Future, which is resolved with the function's result.
+        """
+        task_future: Future = Future()
+        dependencies_left = [len(dependencies)]
+        dependencies_errors: list[BaseException] = []
+        dependencies_lock = threading.Lock()
+
+        def _resolve(future: Future) -> None:
+            try:
+                result = future.result()
+            except Exception as e:
+                generate_error(self._conversion, f'[{func.__name__}] {repr(e)}')
+                task_future.set_exception(e)
+                return
+
+            if isinstance(result, Future):
+                result.add_done_callback(_resolve)
+                return
+
+            task_future.set_result(result)
+
+        def _on_dependency_done(dependency: Future) -> None:
+            with dependencies_lock:
+                dependencies_left[0] -= 1
+                dependency_error = dependency.exception()
+
+                if dependency_error is not None:
+                    dependencies_errors.append(dependency_error)
+
+                if dependencies_left[0] > 0:
+                    return
+
+            if skip_on_failed_dependency and dependencies_errors:
+                # Notice, the error is already reported by the failed dependency.
+                task_future.set_exception(dependencies_errors[0])
+                return
+
+            self._conversion.submit(func, *params).add_done_callback(_resolve)
+
+        with self._lock:
+            self._futures.append(task_future)
+
+        if not dependencies:
+            self._conversion.submit(func, *params).add_done_callback(_resolve)
+
+        for dependency in dependencies:
+            dependency.add_done_callback(_on_dependency_done)
+
+        return task_future
+
+    def wait(self) -> None:
+        """
+        Waits for all the tasks, including the ones added while waiting, to complete.
+        """
+        while True:
+            with self._lock:
+                futures = list(self._futures)
+
+            wait(futures)
+
+            with self._lock:
+                if len(futures) == len(self._futures):
+                    return
+
+
+def get_resolved_future(result: Any = None) -> Future:
+    """
+    Returns a Future, which is already resolved with given result.
+    """
+    future: Future = Future()
+    future.set_result(result)
+    return future
@@ -0,0 +1,249 @@
+__author__ = "Anatoly Khaytovich <anatolyuss@gmail.com>"
+__copyright__ = "Copyright (C) 2015 - present, Anatoly Khaytovich <anatolyuss@gmail.com>"
+__license__ = """
+    This file is a part of "FromMySqlToPostgreSql" - the database migration tool.
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program (please see the "LICENSE.md" file).
+    If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+import os
+import json
+import time
+import atexit
+import threading
+import multiprocessing
+from functools import wraps
+from contextlib import contextmanager
+from multiprocessing.util import Finalize
+from typing import Optional, Iterator, Callable, Any, TextIO
+
+from pymig.conversion import Conversion
+
+# Maximal length of SQL, attached to the spans of queries.
+_MAX_SQL_LENGTH = 1000
+
+# Notice, following variables are per process.
+_trace_file: Optional[TextIO] = None
+_traced_threads: set[int] = set()
+_trace_lock = threading.Lock()
+
+
+def start_tracing(conversion: Conversion) -> None:
+    """
+    Prepares the tracing in the main process, if "trace" is on:
+    removes parts of the previous run's trace, and makes sure the trace is assembled on exit.
+    Notice, each process writes its spans into a separate "/trace/trace_{pid}_{started_at}.json" part
+    (pids may be reused by processes, spawned later),
+    and the parts are merged into the "/trace.json" file by "stop_tracing".
+    """
+    if not conversion.trace:
+        return
+
+    for part_path in _get_part_paths(conversion):
+        os.remove(part_path)
+
+    atexit.register(stop_tracing, conversion)
+
+
+def stop_tracing(conversion: Conversion) -> None:
+    """
+    Merges trace parts of all the processes into the "/trace.json" file,
+    which can be opened in Perfetto (https://ui.perfetto.dev) or chrome://tracing.
+    Notice, must be called by the main process, once all other processes exit.
+    """
+    global _trace_file
+
+    if not conversion.trace:
+        return
+
+    with _trace_lock:
+        if _trace_file is not None:
+            _trace_file.close()
+            _trace_file = None
+
+    part_paths = _get_part_paths(conversion)
+
+    if not part_paths:
+        return
+
+    is_first_event = True
+
+    with open(conversion.trace_path, 'w') as trace_file:
+        trace_file.write('{"traceEvents": [')
+
+        # Notice, the parts are merged line by line, since a trace of a large migration may not fit in memory.
+        for part_path in part_paths:
+            with open(part_path, 'r') as part_file:
+                for line in part_file:
+                    event = line.strip().rstrip(',')
+
+                    if not event or event == '[':
+                        continue
+
+                    trace_file.write(('\n' if is_first_event else ',\n') + event)
+                    is_first_event = False
+
+            os.remove(part_path)
+
+        trace_file.write('\n], "displayTimeUnit": "ms"}\n')
+
+
+def traced(category: str) -> Callable:
+    """
+    Decorator, intended to trace the decorated stage.
+    Notice, the first argument of decorated function must be of type Conversion.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrap(*args: Any, **kwargs: Any) -> Any:
+            conversion = (args[0] if args else None) or kwargs.get('conversion')
+
+            if not isinstance(conversion, Conversion) or not conversion.trace:
+                return func(*args, **kwargs)
+
+            with trace_span(conversion, func.__name__, category):
+                return func(*args, **kwargs)
+        return wrap
+    return decorator
+
+
+@contextmanager
+def trace_span(conversion: Conversion, name: str, category: str, args: Optional[dict] = None) -> Iterator[None]:
+    """
+    Traces a span, enclosed by the "with" block.
+    """
+    if not conversion.trace:
+        yield
+        return
+
+    started_at = time.time()
+
+    try:
+        yield
+    finally:
+        add_span(conversion, name, category, started_at, args)
+
+
+def add_span(
+    conversion: Conversion,
+    name: str,
+    category: str,
+    started_at: float,
+    args: Optional[dict] = None
+) -> None:
+    """
+    Adds a span, which started at "started_at" (seconds since the epoch), and ends now.
+    Each span carries ids of current process and thread.
+    """
+    if not conversion.trace:
+        return
+
+    ended_at = time.time()
+    event = {
+        'name': name,
+        'cat': category,
+        'ph': 'X',
+        'ts': round(started_at * 1_000_000),
+        'dur': round((ended_at - started_at) * 1_000_000),
+        'pid': os.getpid(),
+        'tid': threading.get_native_id(),
+    }
+
+    if args:
+        event['args'] = args
+
+    _write_event(conversion, event)
+
+
+def get_sql_args(sql: str) -> dict:
+    """
+    Returns span arguments, describing given SQL.
+    """
+    return {'sql': sql if len(sql) <= _MAX_SQL_LENGTH else f'{sql[:_MAX_SQL_LENGTH]}...'}
+
+
+def _write_event(conversion: Conversion, event: dict) -> None:
+    """
+    Appends given event to the trace part of current process.
+    Names of current process and thread are written once, as metadata events.
+    """
+    global _trace_file
+
+    with _trace_lock:
+        if _trace_file is None:
+            part_name = f'trace_{os.getpid()}_{time.time_ns()}.json'
+            _trace_file = open(os.path.join(conversion.traces_dir_path, part_name), 'w')
+            _traced_threads.clear()
+            _trace_file.write('[\n')
+            _write_metadata_event('process_name', multiprocessing.current_process().name, event['pid'], 0)
+            Finalize(None, _close_trace_file, exitpriority=0)
+
+        if event['tid'] not in _traced_threads:
+            _traced_threads.add(event['tid'])
+            _write_metadata_event('thread_name', threading.current_thread().name, event['pid'], event['tid'])
+
+        _trace_file.write(json.dumps(event) + ',\n')
+
+
+def _write_metadata_event(name: str, value: str, pid: int, tid: int) -> None:
+    """
+    Writes given metadata event into the trace part of current process.
+    """
+    metadata_event = {'name': name, 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': value}}
+    _trace_file.write(json.dumps(metadata_event) + ',\n')  # type: ignore
+
+
+def _close_trace_file() -> None:
+    """
+    Closes the trace part of current process.
+    """
+    global _trace_file
+
+    with _trace_lock:
+        if _trace_file is not None:
+            _trace_file.close()
+            _trace_file = None
+
+
+def _flush_before_fork() -> None:
+    """
+    Flushes the trace part of current process, so a forked child does not inherit (and write again) buffered spans.
+    """
+    with _trace_lock:
+        if _trace_file is not None:
+            _trace_file.flush()
+
+
+def _reset_after_fork() -> None:
+    """
+    Makes a forked child process write its own trace part.
+    """
+    global _trace_file, _trace_lock
+    _trace_file = None
+    _trace_lock = threading.Lock()
+
+
+os.register_at_fork(before=_flush_before_fork, after_in_child=_reset_after_fork)
+
+
+def _get_part_paths(conversion: Conversion) -> list[str]:
+    """
+    Returns paths of trace parts, written so far.
+    """
+    if not os.path.isdir(conversion.traces_dir_path):
+        return []
+
+    return sorted(
+        os.path.join(conversion.traces_dir_path, file_name)
+        for file_name in os.listdir(conversion.traces_dir_path)
+        if file_name.startswith('trace_') and file_name.endswith('.json')
+    )
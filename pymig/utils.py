@@ -20,6 +20,7 @@ import gc
 from typing import Union, Callable, Any
 
 from pymig.conversion import Conversion
+from pymig.profiler import profile_stage
 
 
 def get_cpu_count() -> int:
@@ -44,8 +45,11 @@ def get_index_of(needle: str, haystack: Union[str, list[str], tuple[str]]) -> in
 
 def track_memory(func: Callable) -> Callable:
     """
-    Decorator, intended to track memory used by the program.
-    Notice, memory tracking works only in debug mode.
+    Decorator, intended to track memory used by the program, and to profile the decorated stage.
+    Notice:
+    1. Memory tracking works only in debug mode.
+    2. Profiling works only if "profiling_modes" are set, see "pymig.profiler.profile_stage".
+    3. Otherwise, the decorated function is called as is.
     """
     def wrap(*args: Any, **kwargs: Any) -> Any:
         conversion = (args[0] if args else None) or kwargs.get('conversion')
@@ -53,10 +57,14 @@ def track_memory(func: Callable) -> Callable:
         if not isinstance(conversion, Conversion):
             raise ValueError(f'[{func.__name__}] First track_memory.wrap argument must be of type Conversion')
 
+        if not conversion.debug and not conversion.profiling_modes:
+            return func(*args, **kwargs)
+
+        stage_name = f'{func.__name__}_{kwargs["table_name"]}' if 'table_name' in kwargs else func.__name__
+
         if not conversion.debug:
-            func_result = func(*args, **kwargs)
-            gc.collect()
-            return func_result
+            with profile_stage(conversion, stage_name):
+                return func(*args, **kwargs)
 
         import math
         import psutil
@@ -72,7 +80,10 @@ def track_memory(func: Callable) -> Callable:
 
         rss_before, vms_before = _get_process_memory_stats()
         log(conversion, f'[{func.__name__}] rss_before {rss_before} MB vms_before {vms_before} MB')
-        func_result = func(*args, **kwargs)
+
+        with profile_stage(conversion, stage_name):
+            func_result = func(*args, **kwargs)
+
         unreachable_objects = gc.collect()
         log(conversion, f'[{func.__name__}] gc.collect() found {unreachable_objects} unreachable objects')
         rss_after, vms_after = _get_process_memory_stats()
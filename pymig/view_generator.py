@@ -16,36 +16,44 @@ __license__ = """
     If not, see <http://www.gnu.org/licenses/gpl.txt>.
 """
 import os
-from typing import cast, Any
+import re
+from typing import cast, Any, Optional
 
-import pymig.migration_state_manager as MigrationStateManager
 import pymig.db_access as DBAccess
 from pymig.db_vendor import DBVendor
 from pymig.utils import get_index_of
 from pymig.fs_ops import write_to_file, log
 from pymig.conversion import Conversion
+from pymig.spool_mode import SpoolMode
+from pymig.catalog_snapshot import get_catalog_snapshot
 
 
-def generate_views(conversion: Conversion) -> None:
+def get_view_sql(conversion: Conversion, view_name: str) -> Optional[str]:
     """
-    Attempts to convert MySQL views to PostgreSQL views.
+    Retrieves given MySQL view, and returns a statement, that creates its PostgreSQL equivalent.
+    Notice, in "LOAD" spool mode the view is taken from the spooled catalog snapshot.
     """
-    views_loaded = MigrationStateManager.get(conversion, 'views_loaded')
+    mysql_view_code = (get_catalog_snapshot(conversion).views.get(view_name)
+                       if conversion.spool_mode == SpoolMode.LOAD
+                       else get_mysql_view_code(conversion, view_name))
 
-    if views_loaded:
-        return
+    if mysql_view_code is None:
+        return None
 
-    params = [[conversion, view_name] for view_name in conversion.views_to_migrate]
-    conversion.run_concurrently(func=_generate_single_view, params_list=params)
+    return _generate_view_code(
+        schema=conversion.schema,
+        view_name=view_name,
+        mysql_view_code=mysql_view_code
+    )
 
 
-def _generate_single_view(conversion: Conversion, view_name: str) -> None:
+def get_mysql_view_code(conversion: Conversion, view_name: str) -> Optional[str]:
     """
-    Attempts to convert given view from MySQL to PostgreSQL.
+    Retrieves MySQL code of given view.
     """
     show_create_view_result = DBAccess.query(
         conversion=conversion,
-        caller=_generate_single_view.__name__,
+        caller=get_mysql_view_code.__name__,
         vendor=DBVendor.MYSQL,
         process_exit_on_error=False,
         should_return_client=False,
@@ -53,18 +61,30 @@ def _generate_single_view(conversion: Conversion, view_name: str) -> None:
     )
 
     if show_create_view_result.error:
-        return
+        return None
 
     show_create_view_result_data = cast(list[dict[str, Any]], show_create_view_result.data)
-    create_pg_view_sql = _generate_view_code(
-        schema=conversion.schema,
-        view_name=view_name,
-        mysql_view_code=show_create_view_result_data[0]['Create View']
-    )
+    return cast(str, show_create_view_result_data[0]['Create View'])
+
+
+def get_referenced_relations(create_pg_view_sql: str) -> set[str]:
+    """
+    Returns names of tables and views, referenced by given view (in its FROM and JOIN clauses).
+    """
+    qualified_names = re.findall(r'\b(?:from|join)\s+\(*((?:"[^"]+"\.)*"[^"]+")(?!\.)', create_pg_view_sql, re.I)
+    return {qualified_name.split('.')[-1].strip('"') for qualified_name in qualified_names}
+
+
+def create_view(conversion: Conversion, view_name: str, create_pg_view_sql: Optional[str]) -> None:
+    """
+    Creates given view in PostgreSQL.
+    """
+    if create_pg_view_sql is None:
+        return
 
     create_pg_view_result = DBAccess.query(
         conversion=conversion,
-        caller=_generate_single_view.__name__,
+        caller=create_view.__name__,
         vendor=DBVendor.PG,
         process_exit_on_error=False,
         should_return_client=False,
@@ -76,7 +96,7 @@ def _generate_single_view(conversion: Conversion, view_name: str) -> None:
         _log_not_created_view(conversion, view_name, create_pg_view_sql)
         return
 
-    log(conversion, f'[{_generate_single_view.__name__}] View "{conversion.schema}"."{view_name}" is created...')
+    log(conversion, f'[{create_view.__name__}] View "{conversion.schema}"."{view_name}" is created...')
 
 
 def _log_not_created_view(